@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_arrays.py
+***********************************
+
+Compares validating the elements of an array one at a time (converting it to a
+list and calling e.g.
+:func:`validators.numeric_many() <validator_collection.validators.numeric_many>`)
+against validating the array with array operations (with e.g.
+:func:`arrays.numeric() <validator_collection.arrays.numeric>`), and checks
+that both give the same results.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_arrays.py
+
+Requires NumPy. The string validators are compared on Arrow arrays, and are
+skipped if PyArrow is not installed.
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy                                                                    # pylint: disable=C0413
+
+from validator_collection import arrays, validators                            # pylint: disable=C0413
+
+COUNT = 100000
+
+# The validators to compare, with their keyword arguments and the arrays they
+# are applied to.
+VALIDATORS = [
+    ('numeric', {'minimum': 0, 'maximum': 1000}, ['float64', 'int64']),
+    ('integer', {'minimum': 0, 'maximum': 1000}, ['float64', 'int64']),
+    ('integer', {'minimum': 0, 'maximum': 1000, 'coerce_value': True}, ['float64', 'int64']),
+    ('float', {'minimum': -0.5, 'maximum': 999.5}, ['float64', 'int64']),
+    ('decimal', {'minimum': 0, 'maximum': 1000}, ['float64', 'int64']),
+    ('string', {'minimum_length': 5, 'maximum_length': 30}, ['arrow emails']),
+    ('email', {}, ['arrow emails']),
+    ('uuid', {}, ['arrow uuids']),
+    ('mac_address', {}, ['arrow MAC addresses']),
+]
+
+# Every INVALID_EVERY-th string is made invalid.
+INVALID_EVERY = 10
+
+
+def build_arrays():
+    """Return the arrays to validate, keyed by a description."""
+    generator = numpy.random.RandomState(0)
+    floats = generator.uniform(-100, 1100, COUNT)
+    floats[::7] = numpy.round(floats[::7])
+    floats[::101] = numpy.nan
+
+    built = {
+        'float64': floats,
+        'int64': generator.randint(-100, 1100, COUNT),
+    }
+
+    try:
+        import pyarrow
+    except ImportError:
+        return built
+
+    def strings(template, invalid_template):
+        return pyarrow.array([(invalid_template if index % INVALID_EVERY == 0 else template)
+                              % (index % 256, index // 256 % 256) for index in range(COUNT)])
+
+    built['arrow emails'] = strings('user.%d@mail%d.example.com', 'user %d at mail%d')
+    built['arrow uuids'] = strings('%08x-0000-4000-8000-%012x', '%08x-0000-4000-8000-%012xz')
+    built['arrow MAC addresses'] = strings('00:1a:%02x:%02x:0c:ff', '00:1a:%02x:%02x:0c')
+
+    return built
+
+
+def comparable(values):
+    """Return ``values`` with each NaN replaced (so that equal results compare
+    equal), and any UUIDs as strings."""
+    return [str(value) if type(value).__name__ == 'UUID' else
+            value if value == value else 'NaN' for value in values]
+
+
+def to_list(array):
+    """Return the elements of ``array`` (a NumPy or Arrow array) as a list."""
+    return array.tolist() if hasattr(array, 'tolist') else array.to_pylist()
+
+
+def one_at_a_time(name, array, kwargs):
+    """Validate the elements of ``array`` with the ``name_many`` validator."""
+    return getattr(validators, '%s_many' % name)(to_list(array),
+                                                 collect_errors = True,
+                                                 **kwargs)
+
+
+def vectorized(name, array, kwargs):
+    """Validate ``array`` with the vectorized validator ``name``."""
+    return getattr(arrays, name)(array, **kwargs)
+
+
+def same_results(name, array, kwargs):
+    """Indicate whether both ways of validating ``array`` give the same valid
+    elements and values."""
+    batch = one_at_a_time(name, array, kwargs)
+    valid = [index not in batch.errors for index in range(len(batch.values))]
+    values = comparable(value for value, is_valid in zip(batch.values, valid) if is_valid)
+
+    result = vectorized(name, array, kwargs)
+    vectorized_valid = [bool(is_valid) for is_valid in to_list(result.valid)]
+    vectorized_values = comparable(value
+                                   for value, is_valid in zip(to_list(result.values),
+                                                              vectorized_valid)
+                                   if is_valid)
+
+    return valid == vectorized_valid and values == vectorized_values
+
+
+def seconds(function, *args):
+    """Return the best time taken by ``function``, in seconds."""
+    return min(timeit.repeat(lambda: function(*args), number = 1, repeat = 3))
+
+
+def main():
+    print('%-40s %12s %12s %8s' % ('%d elements' % COUNT, 'one by one',
+                                    'vectorized', 'speedup'))
+    built = build_arrays()
+    differences = 0
+    for name, kwargs, array_names in VALIDATORS:
+        for array_name in array_names:
+            if array_name not in built:
+                print('%-40s skipped (PyArrow is not installed)' % name)
+                continue
+
+            array = built[array_name]
+            label = '%s %s%s' % (array_name, name,
+                                 ' (coerce_value)' if kwargs.get('coerce_value') else '')
+            if not same_results(name, array, kwargs):
+                differences += 1
+                print('DIFFERENCE: %s' % label)
+
+            before = seconds(one_at_a_time, name, array, kwargs)
+            after = seconds(vectorized, name, array, kwargs)
+            print('%-40s %11.3fs %11.3fs %7.0fx' % (label, before, after, before / after))
+
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
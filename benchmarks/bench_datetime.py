@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_datetime.py
+***********************************
+
+Compares :func:`validators.datetime() <validator_collection.validators.datetime>`
+against the :func:`strptime <python:datetime.datetime.strptime>` cascade it
+falls back to, for each supported string format.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_datetime.py
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators                                     # pylint: disable=C0413
+
+VALUES = [
+    '2018-06-15T12:34:56.789012+05:30',
+    '2018-06-15 12:34:56.789012+0530',
+    '2018-06-15T12:34:56Z',
+    '2018-06-15T12:34:56+00:00',
+    '2018-06-15T12:34:56.789012',
+    '2018-06-15 12:34:56',
+    '2018-06-15T12:34:56',
+    '2018-06-15',
+    '2018/06/15 12:34:56',
+]
+
+NUMBER = 20000
+
+
+def microseconds(function, value):
+    """Return the best per-call time of ``function(value)``, in microseconds."""
+    timings = timeit.repeat(lambda: function(value), number = NUMBER, repeat = 5)
+    return min(timings) / NUMBER * 1e6
+
+
+def legacy(value):
+    """Validate ``value`` using only the strptime cascade."""
+    return validators.datetime(validators._strptime_datetime(value, True))      # pylint: disable=W0212
+
+
+def main():
+    print('%-36s %10s %10s %8s' % ('value', 'strptime', 'datetime', 'speedup'))
+    for value in VALUES:
+        before = microseconds(legacy, value)
+        after = microseconds(validators.datetime, value)
+        print('%-36s %8.2fus %8.2fus %7.1fx' % (value, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_email.py
+***********************************
+
+Compares :func:`validators.email() <validator_collection.validators.email>`
+against the string parsing and regular expression search it used previously,
+and checks that its running time grows linearly with the length of its input.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_email.py
+
+To also compare the results of the two implementations on a randomly generated
+corpus (here, of 100000 values)::
+
+  $ python benchmarks/bench_email.py --fuzz 100000
+
+"""
+
+from __future__ import print_function
+
+import os
+import random
+import re
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators                                     # pylint: disable=C0413
+
+# The regular expression searched for by email() before it was replaced by a
+# single left-to-right scan.
+EMAIL_REGEX = re.compile(
+    r"(?:(?<![a-z0-9!#$%&'*+/=?^_`{|}~-])(?<![a-z0-9!#$%&'*+/=?^_`{|}~-]\.)"
+    r"[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|\""
+    r"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*\")"
+    r"@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])"
+    r"?|\[(?:(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9]))\.){3}"
+    r"(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]:"
+    r"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])"
+)
+
+VALUES = ['test@domain.dev',
+          'first.last@sub.example.org',
+          'a.b+c@x.co.uk',
+          'user_name-1@mail.example.com',
+          'x@✩df.ws',
+          'bad@',
+          'not an email',
+          'Test@Example.com']
+
+UNUSUAL_VALUES = ['"first last"@example.com',
+                  '"a@b"@example.com',
+                  '(comment)user@example.com',
+                  'user@[192.168.1.1]',
+                  'user@192.168.1.1',
+                  '"<user>"@example.com']
+
+WORST_CASES = [
+    ('long local part', lambda count: 'a' * count + ',@example.com'),
+    ('dotted local part', lambda count: 'a.' * count + ',@example.com'),
+    ('unterminated quote', lambda count: '"' + 'a' * count + '@example.com'),
+    ('escaped quotes', lambda count: '"' + '\\"' * count + '\n@example.com'),
+    ('quoted @', lambda count: '"a@"' * count + '@example.com'),
+    ('address literals', lambda count: '"a"@[1.2.3.t:' * count + '@example.com'),
+]
+
+TOKENS = ['a', 'b', 'Z', 'x.y', '.', '..', '@', '"', '\\', '-', '+', '!', ',', ' ',
+          '\t', '(', ')', '(c)', '[', ']', '<', '>', '1', '00', '255', '256',
+          '1.2.3.', '1.2.3.4', 't:', '::1', 'com', 'example.com', 'b-c',
+          'test@domain.dev', 'é', '~', ':', '#', '"a b"', '"a@b"', '\\"',
+          '[1.2.3.4]', '10.0.0.1', 'localhost', 'Ab.Co']
+
+NUMBER = 500
+
+
+def legacy_email(value):
+    """Check ``value`` the way email() did before.
+
+    :returns: The value email() returned, or :obj:`None <python:None>` where it
+      raised an error.
+    """
+    # pylint: disable=too-many-branches,too-many-return-statements
+
+    if '@' not in value:
+        return None
+    if '(' in value and ')' in value:
+        open_parentheses = value.find('(')
+        close_parentheses = value.find(')') + 1
+        if close_parentheses < open_parentheses:
+            return None
+
+        value = value.replace(value[open_parentheses:close_parentheses], '')
+    elif '(' in value or ')' in value:
+        return None
+
+    if '<' in value or '>' in value:
+        lt_position = value.find('<')
+        gt_position = value.find('>')
+        first_quote_position = -1
+        second_quote_position = -1
+        if lt_position >= 0:
+            first_quote_position = value.find('"', 0, lt_position)
+        if gt_position >= 0:
+            second_quote_position = value.find('"', gt_position)
+        if first_quote_position < 0 or second_quote_position < 0:
+            return None
+
+    at_count = value.count('@')
+    if at_count > 1:
+        last_at_position = 0
+        last_quote_position = 0
+        for _ in range(0, at_count):
+            at_position = value.find('@', last_at_position + 1)
+            if at_position >= 0:
+                first_quote_position = value.find('"', last_quote_position,
+                                                  at_position)
+                second_quote_position = value.find('"', first_quote_position)
+                if first_quote_position < 0 or second_quote_position < 0:
+                    return None
+            last_at_position = at_position
+            last_quote_position = second_quote_position
+
+    split_values = value.split('@')
+    if len(split_values) < 2:
+        return None
+
+    local_value = ''.join(split_values[:-1])
+    domain_value = split_values[-1]
+    if domain_value.startswith('[') and domain_value.endswith(']'):
+        domain_value = domain_value[1:-1]
+
+    try:
+        validators.domain(domain_value)
+    except ValueError:
+        try:
+            validators.ip_address(domain_value, force_run = True)               # pylint: disable=E1123
+        except ValueError:
+            return None
+
+        if legacy_email(local_value + '@test.com') is None:
+            return None
+
+        return value
+
+    is_valid = EMAIL_REGEX.search(value)
+    if not is_valid:
+        return None
+
+    matched_string = is_valid.group(0)
+    position = value.find(matched_string)
+    if position > 0:
+        prefix = value[:position]
+        if prefix[0] in string.punctuation or '..' in prefix:
+            return None
+
+    if value[position + len(matched_string):]:
+        return None
+
+    return value
+
+
+def current_email(value):
+    """Check ``value`` with the (non-raising) core of email().
+
+    :returns: The value email() returns, or :obj:`None <python:None>` where it
+      raises an error.
+    """
+    result = validators._email_core(value)                                       # pylint: disable=W0212
+    if isinstance(result, validators._Invalid):                                 # pylint: disable=W0212
+        return None
+
+    return result
+
+
+def microseconds(function, values, number = NUMBER):
+    """Return the best time taken by ``function`` per value in ``values``, in
+    microseconds."""
+    def run():
+        for value in values:
+            function(value)
+
+    timings = timeit.repeat(run, number = number, repeat = 5)
+
+    return min(timings) / (number * len(values)) * 1e6
+
+
+def compare():
+    """Print the time taken by the previous and current implementations."""
+    rows = [('typical addresses', VALUES, NUMBER),
+            ('unusual addresses', UNUSUAL_VALUES, NUMBER),
+            ('long addresses', [build(2000) for _, build in WORST_CASES], 1)]
+
+    print('%-28s %10s %10s %8s' % ('', 'previous', 'scan', 'speedup'))
+    for label, values, number in rows:
+        before = microseconds(legacy_email, values, number)
+        after = microseconds(current_email, values, number)
+        print('%-28s %8.2fus %8.2fus %7.1fx' % (label, before, after, before / after))
+
+
+def worst_case():
+    """Print the current implementation's time for inputs of increasing length.
+    Linear running time means that the time per character stays flat."""
+    print()
+    print('%-28s %10s %10s %10s' % ('worst case', 'length', 'time', 'per char'))
+    for label, build in WORST_CASES:
+        for count in (1000, 8000, 64000):
+            value = build(count)
+            time = microseconds(current_email, [value], 5)
+            print('%-28s %10d %8.0fus %8.3fus' % (label, len(value), time,
+                                                  time / len(value)))
+
+
+def fuzz(count, seed = 0):
+    """Compare the results of the previous and current implementations on
+    ``count`` random values."""
+    generator = random.Random(seed)
+    differences = 0
+    for _ in range(count):
+        value = ''.join(generator.choice(TOKENS)
+                        for _ in range(generator.randint(1, 8)))
+        if generator.random() < 0.5:
+            value = value + '@' + generator.choice(TOKENS[-20:])
+
+        expected = legacy_email(value)
+        actual = current_email(value)
+        if expected != actual:
+            differences += 1
+            print('DIFFERENCE: %r: previously %r, now %r' % (value, expected, actual))
+
+    print()
+    print('fuzzed %s values: %s difference(s)' % (count, differences))
+
+    return differences
+
+
+def main():
+    compare()
+    worst_case()
+    if '--fuzz' in sys.argv:
+        count = int(sys.argv[sys.argv.index('--fuzz') + 1])
+        if fuzz(count):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_filesystem.py
+***********************************
+
+Compares validating a list of paths one at a time against validating them as a
+batch (e.g. with :func:`validators.file_exists_many()
+<validator_collection.validators.file_exists_many>`), which lists each
+directory once rather than looking up each path on its own, and checks that
+both give the same results.
+
+Besides the time taken, it reports the number of calls made to the file
+system (to :func:`os.stat() <python:os.stat>` and
+:func:`os.scandir() <python:os.scandir>`), each of which is a round trip to
+the server on a network file system.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_filesystem.py
+
+The paths are created in a temporary directory, which is removed afterwards.
+Local file systems answer individual lookups quickly, so the difference is far
+greater on network file systems.
+
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators                                     # pylint: disable=C0413
+
+DIRECTORIES = 20
+FILES_PER_DIRECTORY = 500
+
+# The share of the validated paths that do not exist.
+MISSING_EVERY = 10
+
+VALIDATORS = ['path_exists', 'file_exists', 'directory_exists', 'readable',
+              'executable']
+
+
+def build_tree(root):
+    """Create the directories and files to validate under ``root``, and return
+    the paths to validate."""
+    paths = []
+    for directory_index in range(DIRECTORIES):
+        directory = os.path.join(root, 'directory-%d' % directory_index)
+        os.mkdir(directory)
+        for file_index in range(FILES_PER_DIRECTORY):
+            path = os.path.join(directory, 'file-%d.txt' % file_index)
+            if file_index % MISSING_EVERY:
+                open(path, 'w').close()
+            paths.append(path)
+
+    return paths
+
+
+def one_at_a_time(validator, paths):
+    """Validate each of ``paths`` with ``validator`` on its own."""
+    results = []
+    errors = {}
+    for index, path in enumerate(paths):
+        try:
+            results.append(validator(path))
+        except (ValueError, TypeError, IOError) as error:
+            results.append(None)
+            errors[index] = type(error)
+
+    return results, errors
+
+
+def batched(validator_many, paths):
+    """Validate ``paths`` with ``validator_many``."""
+    result = validator_many(paths, collect_errors = True)
+
+    return result.values, dict((index, type(error))
+                               for index, error in result.errors.items())
+
+
+def file_system_calls(function, *args):
+    """Return the number of calls to :func:`os.stat() <python:os.stat>` and
+    :func:`os.scandir() <python:os.scandir>` made by ``function``."""
+    calls = [0]
+    originals = (os.stat, os.scandir)
+
+    def counted(original):
+        def call(*call_args, **call_kwargs):
+            calls[0] += 1
+            return original(*call_args, **call_kwargs)
+        return call
+
+    os.stat, os.scandir = [counted(original) for original in originals]
+    try:
+        function(*args)
+    finally:
+        os.stat, os.scandir = originals
+
+    return calls[0]
+
+
+def microseconds(function, *args):
+    """Return the best time taken by ``function`` per path, in microseconds."""
+    timings = timeit.repeat(lambda: function(*args), number = 1, repeat = 5)
+
+    return min(timings) / len(args[-1]) * 1e6
+
+
+def main():
+    root = tempfile.mkdtemp()
+    try:
+        paths = build_tree(root)
+        print('%-20s %12s %10s %8s %12s %10s' % ('%d paths' % len(paths),
+                                                  'one by one', 'batched',
+                                                  'speedup', 'calls before',
+                                                  'after'))
+        differences = 0
+        for name in VALIDATORS:
+            validator = getattr(validators, name)
+            validator_many = getattr(validators, '%s_many' % name)
+
+            if one_at_a_time(validator, paths) != batched(validator_many, paths):
+                differences += 1
+                print('DIFFERENCE: %s' % name)
+
+            before = microseconds(one_at_a_time, validator, paths)
+            after = microseconds(batched, validator_many, paths)
+            calls_before = file_system_calls(one_at_a_time, validator, paths)
+            calls_after = file_system_calls(batched, validator_many, paths)
+            print('%-20s %10.2fus %8.2fus %7.1fx %12d %10d' % (
+                name, before, after, before / after, calls_before, calls_after
+            ))
+    finally:
+        shutil.rmtree(root)
+
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
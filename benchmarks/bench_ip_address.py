@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_ip_address.py
+***********************************
+
+Compares :func:`validators.ip_address() <validator_collection.validators.ip_address>`
+and :func:`validators.ipv6() <validator_collection.validators.ipv6>` against the
+regular expression they used previously, on a mix of IPv4 and IPv6 traffic.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_ip_address.py
+
+"""
+
+from __future__ import print_function
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators                                     # pylint: disable=C0413
+
+# The regular expression used by ipv6() before it was replaced by a tokenizer.
+IPV6_REGEX = re.compile(
+    '^(?:(?:[0-9A-Fa-f]{1,4}:){6}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|::(?:[0-9A-Fa-f]{1,4}:){5}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){4}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){3}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,2}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){2}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,3}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}:(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,4}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,5}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}|(?:(?:[0-9A-Fa-f]{1,4}:){,6}[0-9A-Fa-f]{1,4})?::)(?:%25(?:[A-Za-z0-9\\-._~]|%[0-9A-Fa-f]{2})+)?$'
+)
+
+IPV4_VALUES = ['192.168.1.1', '10.0.0.254', '172.16.31.7', '8.8.8.8', '256.1.1.1']
+IPV6_VALUES = ['::1', 'fe80::1%25eth0', '2001:db8:85a3::8a2e:370:7334',
+               '::ffff:192.168.1.1', '2001:0db8:0000:0000:0000:ff00:0042:8329',
+               '1:2:3:4:5:6:7:8:9']
+
+# Long inputs that the regular expression has to backtrack through.
+ADVERSARIAL_VALUES = ['ffff:' * 7 + 'ffff%25' + 'a' * 2000 + '!',
+                      '1:' * 2000 + 'x',
+                      '::' + '1:' * 2000]
+
+# 80% IPv4, 20% IPv6.
+MIXED_VALUES = IPV4_VALUES * 4 + IPV6_VALUES[:5]
+
+NUMBER = 500
+
+
+def legacy_ipv6(value):
+    """Check ``value`` the way ipv6() did before."""
+    return IPV6_REGEX.match(value.lower().strip()) is not None
+
+
+def legacy_ip_address(value):
+    """Check ``value`` the way ip_address() did before: IPv6 first, then IPv4."""
+    if legacy_ipv6(value):
+        return True
+
+    return validators._parse_ipv4(value) is not None                           # pylint: disable=W0212
+
+
+def ip_address(value):
+    """Check ``value`` with the non-raising core of ip_address()."""
+    return not isinstance(validators._ip_address_core(value),                  # pylint: disable=W0212
+                          validators._Invalid)                                  # pylint: disable=W0212
+
+
+def microseconds(function, values):
+    """Return the best per-value time of ``function`` over ``values``, in
+    microseconds."""
+    def run():
+        for value in values:
+            function(value)
+
+    timings = timeit.repeat(run, number = NUMBER, repeat = 5)
+    return min(timings) / (NUMBER * len(values)) * 1e6
+
+
+def main():
+    rows = [
+        ('ipv6 (IPv6 values)', legacy_ipv6, validators._is_ipv6, IPV6_VALUES),   # pylint: disable=W0212
+        ('ipv6 (adversarial)', legacy_ipv6, validators._is_ipv6,                  # pylint: disable=W0212
+         ADVERSARIAL_VALUES),
+        ('ip_address (mixed)', legacy_ip_address, ip_address, MIXED_VALUES),
+        ('ip_address (IPv4 values)', legacy_ip_address, ip_address, IPV4_VALUES),
+    ]
+
+    print('%-28s %10s %10s %8s' % ('', 'regex', 'tokenizer', 'speedup'))
+    for label, before_function, after_function, values in rows:
+        before = microseconds(before_function, values)
+        after = microseconds(after_function, values)
+        print('%-28s %8.2fus %8.2fus %7.1fx' % (label, before, after, before / after))
+
+
+if __name__ == '__main__':
+    main()
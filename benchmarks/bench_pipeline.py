@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_pipeline.py
+***********************************
+
+Validates generated CSV and NDJSON files of increasing size with
+:func:`pipeline.validate_csv() <validator_collection.pipeline.validate_csv>` and
+:func:`pipeline.validate_ndjson() <validator_collection.pipeline.validate_ndjson>`,
+and checks that throughput (rows per second) and peak memory stay flat as the
+files grow.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_pipeline.py
+
+The script exits with a non-zero status if the peak memory for the largest file
+is more than ``MAX_MEMORY_GROWTH`` times that for the smallest.
+
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import pipeline, validators                           # pylint: disable=C0413
+
+FIELDS = {
+    'email': 'email',
+    'url': 'url',
+    'age': validators.compile('integer', minimum = 0, maximum = 150, coerce_value = True),
+    'created': 'datetime',
+}
+
+ROW_COUNTS = [5000, 20000, 80000]
+
+# The share of the generated rows that fail validation.
+INVALID_EVERY = 20
+
+MAX_MEMORY_GROWTH = 2.0
+
+
+def build_row(index):
+    """Return the ``index``-th generated row."""
+    row = {
+        'email': 'user%d@example.com' % index,
+        'url': 'https://www.example.com/users/%d' % index,
+        'age': str(index % 100),
+        'created': '2018-01-%02dT12:00:00' % (index % 28 + 1),
+    }
+    if not index % INVALID_EVERY:
+        row['email'] = 'not an email %d' % index
+
+    return row
+
+
+def write_csv(path, count):
+    """Write a CSV file of ``count`` generated rows to ``path``."""
+    columns = sorted(FIELDS)
+    with open(path, 'w') as output:
+        output.write(','.join(columns) + '\n')
+        for index in range(count):
+            row = build_row(index)
+            output.write(','.join(row[column] for column in columns) + '\n')
+
+
+def write_ndjson(path, count):
+    """Write an NDJSON file of ``count`` generated rows to ``path``."""
+    with open(path, 'w') as output:
+        for index in range(count):
+            output.write(json.dumps(build_row(index)) + '\n')
+
+
+def measure(function, path):
+    """Validate the file at ``path`` with ``function``, returning the number of
+    valid rows, the number of errors, the rows per second and the peak memory
+    allocated (in KiB).
+
+    Tracing memory allocations slows validation down, so the file is validated
+    twice: once to time it, and once to trace it."""
+    valid = invalid = 0
+    start = time.time()
+    for chunk in function(path, FIELDS):
+        valid += len(chunk.rows)
+        invalid += len(chunk.errors)
+    elapsed = time.time() - start
+
+    tracemalloc.start()
+    for chunk in function(path, FIELDS):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return valid, invalid, (valid + invalid) / elapsed, peak / 1024.0
+
+
+def main():
+    root = tempfile.mkdtemp()
+    failures = []
+    try:
+        print('%-8s %10s %10s %10s %12s %12s' % ('format', 'rows', 'valid', 'errors',
+                                                 'rows/s', 'peak memory'))
+        for name, write, function in [('csv', write_csv, pipeline.validate_csv),
+                                      ('ndjson', write_ndjson, pipeline.validate_ndjson)]:
+            peaks = []
+            for count in ROW_COUNTS:
+                path = os.path.join(root, '%s-%d.%s' % (name, count, name))
+                write(path, count)
+                valid, invalid, rate, peak = measure(function, path)
+                peaks.append(peak)
+                print('%-8s %10d %10d %10d %12.0f %10.0fKiB' % (name, count, valid,
+                                                               invalid, rate, peak))
+
+            if peaks[-1] > MAX_MEMORY_GROWTH * peaks[0]:
+                failures.append(name)
+    finally:
+        shutil.rmtree(root)
+
+    if failures:
+        print()
+        print('FAIL: peak memory grows with file size for %s' % ', '.join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_processes.py
+***********************************
+
+Measures how validating a batch in a pool of processes (with
+``processes = True``) scales with the number of processes, compared with
+validating it in the calling process, and checks that both give the same
+results.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_processes.py
+
+To also compare chunk sizes (here, with 4 processes)::
+
+  $ python benchmarks/bench_processes.py --chunk-sizes 4
+
+The speedup is bounded by the number of processor cores on the machine, which
+is printed first.
+
+"""
+
+from __future__ import print_function
+
+import multiprocessing
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators                                     # pylint: disable=C0413
+
+VALUES = {
+    'email': ['test%d@domain.dev', 'first.last%d@sub.example.org', 'bad%d@',
+              '"quoted %d"@example.com'],
+    'url': ['http://www.example.com/path/%d?query=1', 'https://user@host%d.org:8080/',
+            'not a url %d', 'http://127.0.0.1/%d'],
+    'domain': ['www%d.example.com', 'sub%d.example.co.uk', 'bad_domain%d!',
+               'xn--bcher-kva%d.example'],
+    'ipv6': ['2001:db8::%x', 'fe80::1:%x', '1:2:3:4:5:6:7:%x', 'not-ipv6-%x'],
+}
+
+COUNT = 100000
+
+CHUNK_SIZE = 1000
+
+CHUNK_SIZES = [100, 1000, 10000]
+
+
+def build_values(name):
+    """Return ``COUNT`` distinct values for the validator ``name``."""
+    templates = VALUES[name]
+    return [templates[index % len(templates)] % index for index in range(COUNT)]
+
+
+def validate(validator_many, values, **pool):
+    """Validate ``values`` with ``validator_many``, returning the values and the
+    types of the errors."""
+    result = validator_many(values, collect_errors = True, **pool)
+
+    return result.values, dict((index, type(error))
+                               for index, error in result.errors.items())
+
+
+def seconds(function, *args, **kwargs):
+    """Return the best time taken by ``function``, in seconds."""
+    return min(timeit.repeat(lambda: function(*args, **kwargs), number = 1, repeat = 3))
+
+
+def worker_counts():
+    """Return the numbers of processes to compare: powers of two up to twice
+    the number of processor cores."""
+    counts = [1]
+    while counts[-1] < 2 * multiprocessing.cpu_count():
+        counts.append(counts[-1] * 2)
+
+    return counts
+
+
+def scaling():
+    """Print the time taken with an increasing number of processes."""
+    counts = worker_counts()
+    print('%-10s %12s' % ('%d values' % COUNT, 'in process') +
+          ''.join('%12s' % ('%d procs' % count) for count in counts))
+    differences = 0
+    for name in sorted(VALUES):
+        validator_many = getattr(validators, '%s_many' % name)
+        values = build_values(name)
+        expected = validate(validator_many, values)
+        timings = [seconds(validate, validator_many, values)]
+        for count in counts:
+            pool = dict(processes = True, max_workers = count, chunk_size = CHUNK_SIZE)
+            if validate(validator_many, values, **pool) != expected:
+                differences += 1
+                print('DIFFERENCE: %s with %d processes' % (name, count))
+            timings.append(seconds(validate, validator_many, values, **pool))
+
+        print('%-10s' % name + ''.join('%11.2fs' % timing for timing in timings))
+
+    return differences
+
+
+def chunk_sizes(count):
+    """Print the time taken with ``count`` processes and different chunk
+    sizes."""
+    print()
+    print('%-10s' % ('%d procs' % count) +
+          ''.join('%16s' % ('chunks of %d' % size) for size in CHUNK_SIZES))
+    for name in sorted(VALUES):
+        validator_many = getattr(validators, '%s_many' % name)
+        values = build_values(name)
+        timings = [seconds(validate, validator_many, values, processes = True,
+                           max_workers = count, chunk_size = size)
+                   for size in CHUNK_SIZES]
+        print('%-10s' % name + ''.join('%15.2fs' % timing for timing in timings))
+
+
+def main():
+    print('%d processor core(s)' % multiprocessing.cpu_count())
+    print()
+    differences = scaling()
+    if '--chunk-sizes' in sys.argv:
+        chunk_sizes(int(sys.argv[sys.argv.index('--chunk-sizes') + 1]))
+
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
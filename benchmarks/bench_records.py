@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_records.py
+***********************************
+
+Compares :meth:`RecordValidator.validate()
+<validator_collection.records.RecordValidator.validate>` against the
+hand-written loop it replaces: calling each field's validator in turn and
+collecting the errors.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_records.py
+
+The script exits with a non-zero status if the record validator is slower than
+the hand-written loop for any of the generated corpora.
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators, RecordValidator                    # pylint: disable=C0413
+
+FIELDS = {
+    'email': validators.compile('email'),
+    'age': validators.compile('integer', minimum = 0, maximum = 150),
+    'name': validators.compile('string', minimum_length = 1, maximum_length = 64),
+}
+
+# The share of the generated records that fail validation (``None`` for none).
+INVALID_EVERY = [None, 10, 2]
+
+NUMBER = 5
+RECORD_COUNT = 20000
+
+
+def hand_validate(record):
+    """Validate ``record`` one field at a time, as the record validator does."""
+    result = dict(record)
+    failures = {}
+    try:
+        result['email'] = validators.email(record.get('email'))
+    except (ValueError, TypeError) as error:
+        failures['email'] = error
+    try:
+        result['age'] = validators.integer(record.get('age'),
+                                           minimum = 0,
+                                           maximum = 150)
+    except (ValueError, TypeError) as error:
+        failures['age'] = error
+    try:
+        result['name'] = validators.string(record.get('name'),
+                                           minimum_length = 1,
+                                           maximum_length = 64)
+    except (ValueError, TypeError) as error:
+        failures['name'] = error
+
+    if failures:
+        raise ValueError(failures)
+
+    return result
+
+
+def build_records(invalid_every):
+    """Return ``RECORD_COUNT`` generated records, every ``invalid_every``-th of
+    which fails validation."""
+    records = []
+    for index in range(RECORD_COUNT):
+        record = {
+            'email': 'user%d@example.com' % index,
+            'age': index % 100,
+            'name': 'User %d' % index,
+        }
+        if invalid_every and not index % invalid_every:
+            record['email'] = 'not an email %d' % index
+            record['age'] = 500
+
+        records.append(record)
+
+    return records
+
+
+def run(validate, records):
+    """Validate every member of ``records`` with ``validate``, returning the
+    number that failed."""
+    failed = 0
+    for record in records:
+        try:
+            validate(record)
+        except ValueError:
+            failed += 1
+
+    return failed
+
+
+def main():
+    record_validator = RecordValidator(FIELDS)
+    failures = []
+
+    print('%-14s %12s %12s %10s' % ('invalid', 'hand loop', 'records', 'speedup'))
+    for invalid_every in INVALID_EVERY:
+        records = build_records(invalid_every)
+        assert run(hand_validate, records) == run(record_validator.validate, records)
+
+        hand = min(timeit.repeat(lambda: run(hand_validate, records),
+                                 number = 1, repeat = NUMBER))
+        compiled = min(timeit.repeat(lambda: run(record_validator.validate, records),
+                                     number = 1, repeat = NUMBER))
+
+        label = 'none' if not invalid_every else '1 in %d' % invalid_every
+        print('%-14s %10.1fms %10.1fms %9.2fx' % (label, hand * 1000,
+                                                  compiled * 1000, hand / compiled))
+        if compiled > hand:
+            failures.append(label)
+
+    if failures:
+        print()
+        print('FAIL: the record validator is slower than the hand-written loop '
+              'for %s' % ', '.join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
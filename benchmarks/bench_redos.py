@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_redos.py
+***********************************
+
+Feeds adversarial strings to the validators that parse untrusted input, and
+checks that their running time stays within two bounds:
+
+* it grows (close to) linearly: an input ``GROWTH_FACTOR`` times longer may take
+  at most ``MAX_GROWTH`` times as long (a quadratic parser would take
+  ``GROWTH_FACTOR ** 2`` times as long); and
+* it never exceeds ``MAX_RELATIVE_COST`` times the time taken by a Python loop
+  that visits each character of the same input, so that the bound scales with
+  the speed of the machine running the benchmark.
+
+It also reports the time taken for the longest inputs in hardened mode (see
+:func:`validators.harden() <validator_collection.validators.harden>`), where
+they are rejected before being parsed.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_redos.py
+
+The script exits with a non-zero status if any bound is exceeded.
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import checkers, validators                           # pylint: disable=C0413
+
+# (validator, description, function building an input from a repeat count)
+CASES = [
+    ('email', 'long local part', lambda count: 'a' * count + ',@example.com'),
+    ('email', 'dotted local part', lambda count: 'a.' * count + ',@example.com'),
+    ('email', 'unterminated quote', lambda count: '"' + 'a' * count + '@example.com'),
+    ('email', 'hyphenated domain', lambda count: 'a@' + 'a-' * count + '!'),
+    ('email', 'quoted @', lambda count: '"a@"' * count + '@example.com'),
+    ('url', 'labels', lambda count: 'http://' + 'aa.' * count + 'a!'),
+    ('url', 'hyphens', lambda count: 'http://' + 'a-_' * count + '.a1'),
+    ('url', 'user information', lambda count: 'http://' + 'a@' * count + ' '),
+    ('domain', 'labels', lambda count: 'a.' * count + '1'),
+    ('domain', 'hyphens', lambda count: 'a-_' * count + '.a1'),
+    ('ip_address', 'octets', lambda count: '1.' * count + '1'),
+    ('ipv6', 'groups', lambda count: '1:' * count + 'x'),
+    ('ipv6', 'zone ID', lambda count: 'fe80::1%25' + 'a' * count + '!'),
+    ('mac_address', 'groups', lambda count: 'aa:' * count),
+    ('mimetype', 'subtype', lambda count: 'a' * count + '/' + 'a' * count + ' '),
+    ('variable_name', 'identifier', lambda count: 'a' * count + '!'),
+    ('timedelta', 'digits', lambda count: '1' * count + ':1' * count),
+]
+
+SMALL_COUNT = 2000
+GROWTH_FACTOR = 8
+MAX_GROWTH = 24
+
+# The slowest case (quoted local parts separated by ``@`` signs, each of which
+# is checked as the possible end of an address) takes about 90 times as long as
+# the reference loop, so this leaves more than twice that as headroom for timer
+# noise. A parser that is quadratic in the length of these inputs would take
+# thousands of times as long.
+MAX_RELATIVE_COST = 250
+
+# Runs faster than this are dominated by timer noise, so their growth is not
+# checked.
+MIN_MEASURABLE_MICROSECONDS = 500
+
+
+def microseconds(validator, value):
+    """Return the best time taken to check ``value`` with ``validator``, in
+    microseconds."""
+    checker = getattr(checkers, 'is_%s' % validator)
+    timings = timeit.repeat(lambda: checker(value), number = 1, repeat = 5)
+
+    return min(timings) * 1e6
+
+
+def reference_microseconds(value):
+    """Return the best time taken by a Python loop that visits each character of
+    ``value``, in microseconds."""
+    def visit():
+        for _ in value:
+            pass
+
+    timings = timeit.repeat(visit, number = 1, repeat = 5)
+
+    return min(timings) * 1e6
+
+
+def main():
+    print('%-14s %-20s %9s %10s %10s %7s %9s %9s %10s' % ('validator', 'input',
+                                                           'length', 'small', 'large',
+                                                           'growth', 'per char',
+                                                           'relative', 'hardened'))
+    failures = []
+    for validator, description, build in CASES:
+        small_value = build(SMALL_COUNT)
+        large_value = build(SMALL_COUNT * GROWTH_FACTOR)
+
+        small = microseconds(validator, small_value)
+        large = microseconds(validator, large_value)
+        growth = large / small
+        per_character = large / len(large_value)
+        relative = large / reference_microseconds(large_value)
+
+        validators.harden()
+        try:
+            hardened = microseconds(validator, large_value)
+        finally:
+            validators.harden(False)
+
+        status = ''
+        if large >= MIN_MEASURABLE_MICROSECONDS and growth > MAX_GROWTH:
+            status = 'FAIL: grows faster than linearly'
+        elif relative > MAX_RELATIVE_COST:
+            status = 'FAIL: too slow'
+
+        if status:
+            failures.append((validator, description))
+
+        print('%-14s %-20s %9d %8.0fus %8.0fus %6.1fx %7.3fus %8.1fx %8.1fus %s' % (
+            validator, description, len(large_value), small, large, growth,
+            per_character, relative, hardened, status
+        ))
+
+    if failures:
+        print()
+        print('%s case(s) exceeded their bounds' % len(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
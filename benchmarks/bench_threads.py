@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+***********************************
+benchmarks.bench_threads.py
+***********************************
+
+Compares validating a batch of paths in the calling thread against validating
+it in a pool of threads (with ``max_workers``), and checks that both give the
+same results.
+
+Local file systems answer in microseconds, so each call to
+:func:`os.stat() <python:os.stat>` and :func:`os.access() <python:os.access>`
+is delayed by ``LATENCY`` seconds to simulate a round trip to the server of a
+network file system.
+
+Run from the repository root::
+
+  $ python benchmarks/bench_threads.py
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from validator_collection import validators                                     # pylint: disable=C0413
+
+# The simulated round trip to the file server, in seconds.
+LATENCY = 0.001
+
+PATHS = 200
+
+# The share of the validated paths that do not exist.
+MISSING_EVERY = 10
+
+VALIDATORS = ['path_exists', 'file_exists', 'readable']
+
+WORKERS = [1, 4, 16, 64]
+
+
+def build_paths():
+    """Return paths to validate, of which every ``MISSING_EVERY``-th does not
+    exist."""
+    path = os.path.abspath(__file__)
+    return [path if index % MISSING_EVERY else path + '.missing'
+            for index in range(PATHS)]
+
+
+def delayed(function):
+    """Return ``function`` delayed by ``LATENCY`` seconds on each call."""
+    def call(*args, **kwargs):
+        time.sleep(LATENCY)
+        return function(*args, **kwargs)
+
+    return call
+
+
+def validate(validator_many, paths, max_workers = None):
+    """Validate ``paths`` with ``validator_many``, returning the values and the
+    types of the errors."""
+    result = validator_many(paths, collect_errors = True, max_workers = max_workers)
+
+    return result.values, dict((index, type(error))
+                               for index, error in result.errors.items())
+
+
+def microseconds(function, *args):
+    """Return the best time taken by ``function`` per path, in microseconds."""
+    timings = timeit.repeat(lambda: function(*args), number = 1, repeat = 3)
+
+    return min(timings) / PATHS * 1e6
+
+
+def main():
+    paths = build_paths()
+    originals = (os.stat, os.access)
+    os.stat, os.access = [delayed(original) for original in originals]
+    try:
+        print('%-14s %12s' % ('%d paths' % PATHS, 'in thread') +
+              ''.join('%12s' % ('%d workers' % workers) for workers in WORKERS))
+        differences = 0
+        for name in VALIDATORS:
+            validator_many = getattr(validators, '%s_many' % name)
+            expected = validate(validator_many, paths)
+            timings = [microseconds(validate, validator_many, paths)]
+            for workers in WORKERS:
+                if validate(validator_many, paths, workers) != expected:
+                    differences += 1
+                    print('DIFFERENCE: %s with %d workers' % (name, workers))
+                timings.append(microseconds(validate, validator_many, paths, workers))
+
+            print('%-14s' % name + ''.join('%10.0fus' % timing for timing in timings))
+    finally:
+        os.stat, os.access = originals
+
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -149,7 +149,8 @@ setup(
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
         'jsonschema',
-        'regex;python_version<"3"'
+        'regex;python_version<"3"',
+        'futures;python_version<"3"'
     ],
 
     # List additional groups of dependencies here (e.g. development
@@ -161,6 +162,7 @@ setup(
     # Similar to `install_requires` above, these must be valid existing
     # projects.
     extras_require={  # Optional
+        'arrays': ['numpy', 'pyarrow'],
         'dev': ['check-manifest','sphinx','sphinx-rtd-theme','sphinx-tabs'],
         'test': ['coverage',
                  'pytest',
@@ -178,10 +180,9 @@ setup(
     #
     # If using Python 2.6 or earlier, then these have to be included in
     # MANIFEST.in as well.
-    #package_data={
-    #    '': ['_README.rst', 'README.md'],
-    #    '': ['LICENSE', 'VERSION'],
-    #},
+    package_data={
+        'validator_collection': ['public_suffix_list.dat'],
+    },
 
     #include_package_data = True,
 
@@ -202,13 +203,13 @@ setup(
     # `pip` to create the appropriate form of executable for the target
     # platform.
     #
-    # For example, the following would provide a command called `sample` which
-    # executes the function `main` from this package when invoked:
-    #entry_points={  # Optional
-    #    'console_scripts': [
-    #        'sample=sample:main',
-    #    ],
-    #},
+    # The following provides a command called `validator-collection` which
+    # executes the function `main` from `validator_collection.cli` when invoked:
+    entry_points={
+        'console_scripts': [
+            'validator-collection=validator_collection.cli:main',
+        ],
+    },
 
     # List additional URLs that are relevant to your project as a dict.
     #
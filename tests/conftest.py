@@ -13,9 +13,16 @@ import abc
 import collections
 import os
 
+import sys
+
 import pytest
 from validator_collection._compat import is_py2
 
+# validator_collection.aio requires asynchronous generators (Python 3.6+).
+collect_ignore = []
+if sys.version_info < (3, 6):
+    collect_ignore.append('test_aio.py')
+
 if is_py2:
     Iterable = collections.Iterable
 else:
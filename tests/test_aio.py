@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_aio
+***********************************
+
+Tests for the awaitable validators and checkers.
+
+"""
+
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from validator_collection import aio, checkers, errors, validators
+
+
+def run(coroutine):
+    """Run ``coroutine`` to completion in a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(results):
+    """Return the members of the asynchronous iterator ``results``."""
+    return [result async for result in results]
+
+
+@pytest.mark.parametrize('function_name, value', [
+    ('path_exists', '/var/data/xx1.txt'),
+    ('path_exists', '/var/data/xx2.txt'),
+    ('file_exists', '/var/data'),
+    ('directory_exists', '/var/data'),
+    ('readable', '/var/data/xx1.txt'),
+    ('executable', '/var/data/xx1.txt'),
+    ('is_on_filesystem', '/var/data/xx1.txt'),
+    ('is_file', '/var/data'),
+    ('is_directory', '/var/data'),
+    ('is_readable', '/var/data/xx2.txt'),
+    ('is_executable', '/var/data/xx1.txt'),
+])
+def test_awaitable(fs, function_name, value):
+    """Do the awaitable functions return (or raise) what their synchronous
+    equivalents do?"""
+    fs.create_file('/var/data/xx1.txt')
+    module = checkers if function_name.startswith('is_') else validators
+    function = getattr(module, function_name)
+
+    try:
+        expected = function(value)
+    except (ValueError, TypeError, IOError) as error:
+        with pytest.raises(type(error)):
+            run(getattr(aio, function_name)(value))
+    else:
+        assert run(getattr(aio, function_name)(value)) == expected
+
+
+def test_configure(fs):
+    """Are blocking functions run in the configured executor?"""
+    fs.create_file('/var/data/xx1.txt')
+    executor = ThreadPoolExecutor(max_workers = 1)
+    try:
+        aio.configure(executor)
+        assert aio.get_executor() is executor
+        assert run(aio.is_file('/var/data/xx1.txt')) is True
+
+        aio.configure(max_workers = 2)
+        assert aio.get_executor() is not executor
+        assert run(aio.is_file('/var/data/xx1.txt')) is True
+        assert executor.submit(len, 'ab').result() == 2
+    finally:
+        aio.configure()
+        executor.shutdown()
+
+    with pytest.raises(errors.MinimumValueError):
+        aio.configure(max_workers = 0)
+
+
+@pytest.mark.parametrize('validator_name, values, kwargs', [
+    ('file_exists', ['/var/data/xx1.txt', '/var/data', '/var/data/xx2.txt', None], {}),
+    ('readable', ['/var/data/xx1.txt'] * 50 + ['/var/data/xx2.txt'], {}),
+    ('email', ['test@domain.dev', 'not-an-email', 'test@domain.com'], {}),
+    ('integer', ['1', 'x', 3.0, 500], { 'maximum': 100 }),
+    ('uuid', [123, 'not-a-uuid'], {}),
+    ('email', [], {}),
+])
+def test_stream_many(fs, validator_name, values, kwargs):
+    """Does streaming a batch give the same results as validating it?"""
+    fs.create_file('/var/data/xx1.txt')
+    expected = getattr(validators, '%s_many' % validator_name)(values,
+                                                               collect_errors = True,
+                                                               **kwargs)
+
+    results = run(collect(aio.stream_many(validator_name,
+                                          iter(values),
+                                          max_concurrency = 4,
+                                          **kwargs)))
+    assert sorted(result.index for result in results) == list(range(len(values)))
+    for result in results:
+        assert result.value == expected.values[result.index]
+        assert type(result.error) is type(expected.errors.get(result.index))
+        assert result.is_valid is (result.index not in expected.errors)
+
+    if validator_name not in aio.BLOCKING_FUNCTIONS:
+        assert [result.index for result in results] == list(range(len(values)))
+
+
+def test_stream_many_backpressure(fs):
+    """Does streaming a batch read its values only as results are consumed?"""
+    fs.create_file('/var/data/xx1.txt')
+    values = itertools.repeat('/var/data/xx1.txt')
+
+    async def take(count):
+        results = aio.stream_many('file_exists', values, max_concurrency = 4)
+        taken = []
+        async for result in results:
+            taken.append(result)
+            if len(taken) == count:
+                break
+        await results.aclose()
+        return taken
+
+    assert len(run(take(10))) == 10
+
+
+@pytest.mark.parametrize('max_workers, expected_reads', [
+    (None, aio.DEFAULT_MAX_WORKERS),
+    (2, 2),
+])
+def test_stream_many_default_concurrency(fs, max_workers, expected_reads):
+    """Does streaming a batch default to the configured number of workers?"""
+    fs.create_file('/var/data/xx1.txt')
+    reads = []
+
+    def values():
+        while True:
+            reads.append(None)
+            yield '/var/data/xx1.txt'
+
+    async def first():
+        results = aio.stream_many('file_exists', values())
+        result = await results.__anext__()
+        await results.aclose()
+        return result
+
+    aio.configure(max_workers = max_workers)
+    try:
+        assert run(first()).is_valid is True
+    finally:
+        aio.configure()
+
+    assert len(reads) == expected_reads
+
+
+def test_stream_many_errors():
+    """Are unknown validators and invalid settings rejected?"""
+    with pytest.raises(errors.ValidatorUsageError):
+        run(collect(aio.stream_many('is_file', ['/'])))
+    with pytest.raises(errors.MinimumValueError):
+        run(collect(aio.stream_many('file_exists', ['/'], max_concurrency = 0)))
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_arrays
+***********************************
+
+Tests for the vectorized validators in :mod:`validator_collection.arrays`.
+
+"""
+
+import math
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from validator_collection import arrays, validators, errors                    # pylint: disable=C0413
+from validator_collection._decorators import reload_disabled                   # pylint: disable=C0413
+
+FLOATS = [0.0, -0.0, 0.5, -0.5, 1.0, 2.5, -3.0, 0.1, 1e300, -1e300,
+          float('inf'), float('-inf'), float('nan'), 2.0 ** 63, -2.0 ** 63,
+          9007199254740992.0, 1e-320]
+
+INTEGERS = [0, 1, -1, 7, 100, -100, 2 ** 62, -2 ** 63, 2 ** 63 - 1]
+
+BOUNDS = [None, 0, -1, 0.1, 0.5, 2 ** 63, -2 ** 63, 10 ** 400, Decimal('0.1'),
+          Decimal('-7.5'), Fraction(1, 3), float('inf'), '12.5', 9007199254740993]
+
+
+def scalar_results(name, values, **kwargs):
+    """Return the verdict and value of the scalar validator ``name`` for each
+    element of ``values``."""
+    validator = getattr(validators, name)
+    results = []
+    for value in values:
+        try:
+            results.append((True, validator(value, force_run = True, **kwargs)))
+        except (ValueError, TypeError, AttributeError, ArithmeticError):
+            results.append((False, None))
+
+    return results
+
+
+def vectorized_results(result):
+    """Return the verdict and value of each element of ``result``."""
+    return [(is_valid, value if is_valid else None)
+            for is_valid, value in zip(result.valid.tolist(), result.values.tolist())]
+
+
+def assert_same(actual, expected):
+    """Assert that the ``(verdict, value)`` pairs in ``actual`` and ``expected``
+    match, treating NaNs as equal."""
+    assert len(actual) == len(expected)
+    for (is_valid, value), (expected_valid, expected_value) in zip(actual, expected):
+        assert is_valid == expected_valid
+        if isinstance(expected_value, (float, Decimal)) and expected_value != expected_value:
+            assert value != value
+        else:
+            assert value == expected_value
+            assert type(value) is type(expected_value)
+
+
+@pytest.mark.parametrize('name, kwargs', [
+    ('numeric', {}),
+    ('integer', {}),
+    ('integer', {'coerce_value': True}),
+    ('float', {}),
+    ('decimal', {}),
+])
+@pytest.mark.parametrize('dtype, elements', [
+    ('float64', FLOATS),
+    ('float32', [0.1, 2.5, -3.0, 16777217.0, float('nan')]),
+    ('int64', INTEGERS),
+    ('uint8', [0, 1, 128, 255]),
+    ('uint64', [0, 2 ** 63, 2 ** 64 - 1]),
+    ('bool', [True, False]),
+    (object, [1, None, 2.5, '3', 'not a number', Decimal('1.5'), 10 ** 30]),
+    ('U', ['1', '2.5', 'abc', 'nan']),
+])
+@pytest.mark.parametrize('minimum, maximum',
+                         [(bound, None) for bound in BOUNDS] +
+                         [(None, bound) for bound in BOUNDS[1:]] +
+                         [(-1, 0.5), (Fraction(1, 3), Decimal('0.1'))])
+def test_matches_scalar(name, kwargs, dtype, elements, minimum, maximum):
+    values = numpy.array(elements, dtype = dtype)
+    expected = scalar_results(name, values.tolist(),
+                              minimum = minimum, maximum = maximum, **kwargs)
+
+    result = getattr(arrays, name)(values, minimum = minimum, maximum = maximum, **kwargs)
+
+    assert result.valid.shape == values.shape
+    assert result.values.shape == values.shape
+    assert_same(vectorized_results(result), expected)
+
+
+@pytest.mark.parametrize('name, expected_dtype', [
+    ('numeric', 'float64'),
+    ('integer', 'int64'),
+    ('float', 'float64'),
+    ('decimal', 'object'),
+])
+def test_dtypes(name, expected_dtype):
+    result = getattr(arrays, name)(numpy.array([1.0, 2.0, 3.0]))
+    assert result.values.dtype == numpy.dtype(expected_dtype)
+    assert result.is_valid
+
+
+def test_integer_too_large_for_int64():
+    result = arrays.integer(numpy.array([1.0, 1e30]))
+    assert result.is_valid
+    assert result.values.dtype == object
+    assert result.values.tolist() == [1, int(1e30)]
+
+
+def test_multidimensional():
+    values = numpy.array([[1.0, 2.5], [-1.0, float('nan')]])
+    result = arrays.integer(values, minimum = 0)
+    assert result.valid.tolist() == [[True, False], [False, False]]
+    assert result.values[0, 0] == 1
+
+
+@pytest.mark.parametrize('allow_empty, nan_is_empty, expected', [
+    (False, False, [True, True]),
+    (False, True, [True, False]),
+    (True, True, [True, True]),
+])
+def test_nan_is_empty(allow_empty, nan_is_empty, expected):
+    result = arrays.float(numpy.array([1.0, float('nan')]),
+                          allow_empty = allow_empty,
+                          nan_is_empty = nan_is_empty)
+    assert result.valid.tolist() == expected
+    assert math.isnan(result.values[1])
+
+
+def test_empty_integers_are_none():
+    result = arrays.integer(numpy.array([1.0, float('nan')]),
+                            allow_empty = True,
+                            nan_is_empty = True)
+    assert result.is_valid
+    assert result.values.tolist() == [1, None]
+
+
+@pytest.mark.parametrize('bound', ['not a number', [1]])
+def test_invalid_bound(bound):
+    with pytest.raises(errors.CannotCoerceError):
+        arrays.numeric(numpy.array([1.0]), maximum = bound)
+
+
+def test_disabled(monkeypatch):
+    monkeypatch.setenv('VALIDATORS_DISABLED', 'integer')
+    reload_disabled()
+    values = numpy.array([1.5, 2.5])
+    try:
+        result = arrays.integer(values)
+        assert result.is_valid
+        assert result.values is values
+
+        result = arrays.integer(values, force_run = True)
+        assert not result.valid.any()
+    finally:
+        monkeypatch.delenv('VALIDATORS_DISABLED')
+        reload_disabled()
+
+
+def test_series():
+    pandas = pytest.importorskip('pandas')
+
+    series = pandas.Series([1.0, 2.5, None], index = ['a', 'b', 'c'], name = 'age')
+    result = arrays.integer(series)
+    assert isinstance(result.valid, pandas.Series)
+    assert isinstance(result.values, pandas.Series)
+    assert result.valid.index.tolist() == ['a', 'b', 'c']
+    assert result.values.name == 'age'
+    assert result.valid.tolist() == [True, False, False]
+    assert series[result.valid].tolist() == [1.0]
+
+
+@pytest.mark.parametrize('allow_empty, expected_valid', [
+    (False, [True, False, True]),
+    (True, [True, True, True]),
+])
+def test_series_missing_values(allow_empty, expected_valid):
+    pandas = pytest.importorskip('pandas')
+
+    series = pandas.Series([1, None, 3], dtype = 'Int64')
+    result = arrays.integer(series, allow_empty = allow_empty)
+    assert result.valid.tolist() == expected_valid
+    if allow_empty:
+        assert result.values.tolist() == [1, None, 3]
+
+
+STRINGS = [
+    'test@domain.dev', 'first.last+tag@sub.example.co.uk', 'John.Smith@example.com',
+    'joE@example.com', 'john@Example.com', '"quoted name"@example.com',
+    'name(comment)@example.com', 'a..b@example.com', 'a@b--c.example.com',
+    'test@[192.168.1.1]', 'not an email', 'no-at-sign.example.com', 'a@b@c.com',
+    'x@' + 'a' * 64 + '.com',
+    '12345678-1234-5678-1234-567812345678', '12345678-1234-5678-1234-56781234567G',
+    '{12345678-1234-5678-1234-567812345678}', '12345678123456781234567812345678',
+    'urn:uuid:12345678-1234-5678-1234-567812345678', 'urn:uuid:12345678123456781234567812345678',
+    '1234567_-1234-5678-1234-567812345678', ' 12345678-1234-5678-1234-56781234567',
+    '{0123456789abcdef0123456789abcdef}', 'uuid:0123456789abcdef0123456789abcdef',
+    'urn:uuid:{0123456789abcdef0123456789abcdef}', '0123456789abcdef0123456789abcde',
+    '00:1A:2b:3c:4D:5e', '00-1a-2b-3c-4d-5e', '00:1a-2b:3c-4d:5e', ' 00:1a:2b:3c:4d:5e\n',
+    '\x1c00:1a:2b:3c:4d:5e', '00:1a:2b:3c:4d', '00:1a:2b:3c:4d:5e:6f', u'00:1a:2b:3c:4d:5é',
+    '', 'a', 'ab', 'abcdef', u'éééé', u'　', None,
+]
+
+STRING_VALIDATORS = [
+    ('string', {}),
+    ('string', {'minimum_length': 3, 'maximum_length': 20}),
+    ('string', {'minimum_length': 40, 'whitespace_padding': True}),
+    ('email', {}),
+    ('uuid', {}),
+    ('mac_address', {}),
+]
+
+
+def scalar_string_results(name, values, **kwargs):
+    """Return the verdict and value of the scalar validator ``name`` for each
+    of ``values``, with UUIDs as strings."""
+    return [(is_valid, str(value) if name == 'uuid' and value is not None else value)
+            for is_valid, value in scalar_results(name, values, **kwargs)]
+
+
+def as_lists(result):
+    """Return the members of ``result`` (which may hold Arrow arrays or a
+    :class:`pandas.Series`) as lists, with missing values as
+    :obj:`None <python:None>`."""
+    if hasattr(result.valid, 'to_pylist'):
+        return [member.to_pylist() for member in result]
+
+    return result.valid.tolist(), [None if value is getattr(sys.modules.get('pandas'), 'NA', None)
+                                   else value for value in result.values.tolist()]
+
+
+@pytest.mark.parametrize('name, kwargs', STRING_VALIDATORS)
+@pytest.mark.parametrize('allow_empty', [False, True])
+@pytest.mark.parametrize('form', ['numpy', 'arrow', 'chunked', 'series'])
+def test_strings_match_scalar(name, kwargs, allow_empty, form):
+    pyarrow = pytest.importorskip('pyarrow')
+    if form == 'numpy':
+        values = numpy.array(STRINGS, dtype = object)
+    elif form == 'arrow':
+        values = pyarrow.array(STRINGS)
+    elif form == 'chunked':
+        values = pyarrow.chunked_array([STRINGS[:10], STRINGS[10:]])
+    else:
+        pandas = pytest.importorskip('pandas')
+        values = pandas.Series(STRINGS, dtype = 'string')
+
+    expected = scalar_string_results(name, STRINGS, allow_empty = allow_empty, **kwargs)
+
+    result = getattr(arrays, name)(values, allow_empty = allow_empty, **kwargs)
+    if form in ('arrow', 'chunked'):
+        assert isinstance(result.valid, pyarrow.ChunkedArray) == (form == 'chunked')
+    valid, results = as_lists(result)
+
+    assert [(is_valid, value if is_valid else None)
+            for is_valid, value in zip(valid, results)] == \
+        [(is_valid, value if is_valid else None) for is_valid, value in expected]
+
+
+@pytest.mark.parametrize('name, kwargs', STRING_VALIDATORS)
+def test_strings_without_pyarrow(monkeypatch, name, kwargs):
+    monkeypatch.setattr(arrays, '_import_pyarrow', lambda: (None, None))
+    values = numpy.array([value for value in STRINGS if value is not None])
+
+    result = getattr(arrays, name)(values, **kwargs)
+
+    assert vectorized_results(result) == \
+        scalar_string_results(name, values.tolist(), **kwargs)
+
+
+@pytest.mark.parametrize('name', ['string', 'email', 'uuid', 'mac_address'])
+@pytest.mark.parametrize('values', [
+    [1, 2.5, b'bytes', float('nan'), None, 'test@domain.dev'],
+    [],
+])
+def test_strings_non_string_elements(name, values):
+    values = numpy.array(values, dtype = object)
+    expected = scalar_string_results(name, values.tolist())
+
+    assert vectorized_results(getattr(arrays, name)(values)) == expected
+
+
+@pytest.mark.parametrize('nan_is_empty, expected', [
+    (False, [True, False]),
+    (True, [True, True]),
+])
+def test_strings_nan_is_empty(nan_is_empty, expected):
+    values = numpy.array(['abc', float('nan')], dtype = object)
+    result = arrays.string(values, allow_empty = True, nan_is_empty = nan_is_empty)
+    assert result.valid.tolist() == expected
+
+
+def test_strings_max_length():
+    pyarrow = pytest.importorskip('pyarrow')
+    values = pyarrow.array(['test@domain.dev', 'a' * 300 + '@domain.dev'])
+
+    validators.harden()
+    try:
+        result = arrays.email(values)
+    finally:
+        validators.harden(False)
+
+    assert result.valid.to_pylist() == [True, False]
+
+
+def test_strings_is_valid():
+    pyarrow = pytest.importorskip('pyarrow')
+
+    assert arrays.email(pyarrow.array(['test@domain.dev'])).is_valid
+    assert not arrays.email(pyarrow.array(['test@domain.dev', 'invalid'])).is_valid
+    assert arrays.email(pyarrow.array([], type = pyarrow.string())).is_valid
@@ -23,6 +23,7 @@ from datetime import datetime, date, time, tzinfo, timedelta
 import pytest
 
 import validator_collection.checkers as checkers
+from validator_collection import errors
 
 from validator_collection._compat import TimeZone
 
@@ -435,6 +436,9 @@ def test_is_callable(value, fails, allow_empty):
 @pytest.mark.parametrize('value, fails, allow_empty', [
     (uuid.uuid4(), False, False),
     ('123e4567-e89b-12d3-a456-426655440000', False, False),
+    ('{0123456789abcdef0123456789abcdef}', False, False),
+    ('uuid:0123456789abcdef0123456789abcdef', False, False),
+    ('urn:uuid:123e4567-e89b-12d3-a456-426655440000', False, False),
     ('not-a-uuid', True, False),
     ('', True, False),
     (None, True, False),
@@ -1524,6 +1528,16 @@ def test_is_domain(value, fails, allow_empty, allow_ips):
     assert result == expects
 
 
+@pytest.mark.parametrize('value, expects', [
+    (u"foo.com", True),
+    (u"localhost", True),
+    (u"foo.notarealtld", False),
+])
+def test_is_domain_strict(value, expects):
+    assert checkers.is_domain(value, strict = True) == expects
+    assert checkers.is_domain(value) is True
+
+
 @pytest.mark.parametrize('value, fails, allow_empty', [
     ('0.0.0.0', False, False),
     ('10.10.10.10', False, False),
@@ -1588,6 +1602,20 @@ def test_is_ipv4(value, fails, allow_empty):
     assert result == expects
 
 
+@pytest.mark.parametrize('value, output, expects', [
+    ('192.168.1.1', 'integer', True),
+    ('256.168.1.1', 'integer', False),
+    ('192.168.1.1', 'not-an-output', errors.ValidatorUsageError),
+    ('256.168.1.1', 'not-an-output', errors.ValidatorUsageError),
+])
+def test_is_ipv4_output(value, output, expects):
+    if expects is errors.ValidatorUsageError:
+        with pytest.raises(expects):
+            checkers.is_ipv4(value, output = output)
+    else:
+        assert checkers.is_ipv4(value, output = output) is expects
+
+
 @pytest.mark.parametrize('value, fails, allow_empty', [
     ('::1', False, False),
     ('abcd:ffff:0:0:0:0:41:2', False, False),
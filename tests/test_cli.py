@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_cli
+***********************************
+
+Tests for the ``validator-collection`` command.
+
+"""
+
+import pytest
+
+from validator_collection import cli
+
+EMAILS = u'test@domain.dev\nnot-an-email\ntest@domain.com\n'
+
+CSV = u'name,age\nJane,42\nJohn,x\n"Multi\nLine",500\n'
+
+JSONL = (u'{"source": "10.0.0.1"}\n'
+         u'not json\n'
+         u'\n'
+         u'["a", "list"]\n'
+         u'{"source": "256.0.0.1"}\n'
+         u'{"other": 1}\n')
+
+
+@pytest.mark.parametrize('arguments, contents, expected_status, expected_output, expected_valid', [
+    (['email'], EMAILS, 1, ['2: InvalidEmailError'], 2),
+    (['is_email'], EMAILS, 1, ['2: Invalid'], 2),
+    (['email', '--print', 'valid'], EMAILS, 1, ['test@domain.dev', 'test@domain.com'], 2),
+    (['email', '--print', 'none'], EMAILS, 1, [], 2),
+    (['string', '-o', 'minimum_length=3'], u'abc\nabcd\n', 0, [], 2),
+    (['is_string', '-o', 'minimum_length=4'], u'abc\nabcd\n', 1, ['1: Invalid'], 1),
+    (['integer', '--csv-column', 'age', '-o', 'maximum=100'], CSV, 1,
+     ['3: CannotCoerceError', '5: MaximumValueError'], 1),
+    (['ip_address', '--jsonl-field', 'source'], JSONL, 1,
+     ['2: ReadError', '4: ReadError', '5: InvalidIPAddressError', '6: EmptyValueError'], 1),
+    (['email', '--jobs', '2', '--chunk-size', '1'], EMAILS, 1, ['2: InvalidEmailError'], 2),
+    (['is_email', '--jobs', '2', '--chunk-size', '1'], EMAILS, 1, ['2: Invalid'], 2),
+    (['ip_address', '--jsonl-field', 'source', '--jobs', '2', '--chunk-size', '2'], JSONL, 1,
+     ['2: ReadError', '4: ReadError', '5: InvalidIPAddressError', '6: EmptyValueError'], 1),
+    (['is_integer', '-o', 'minimum=5'], u'7\n3\n', 1, ['2: Invalid'], 1),
+    (['decimal', '-o', 'minimum=1'], u'nan\n2\n', 1, ['1: CannotCoerceError'], 1),
+])
+def test_main(tmpdir, capsys, arguments, contents, expected_status, expected_output, expected_valid):
+    """Does the command report the invalid values and exit accordingly?"""
+    path = tmpdir.join('values')
+    path.write_binary(contents.encode('utf-8'))
+
+    status = cli.main(arguments + [str(path)])
+    output, summary = capsys.readouterr()
+
+    assert status == expected_status
+    prefix = str(path) + ':'
+    assert [line[len(prefix):].split(': ')[0] + ': ' + line.split(': ')[1]
+            if line.startswith(prefix) else line
+            for line in output.splitlines()] == expected_output
+    assert 'valid: %s\n' % expected_valid in summary
+    assert 'p99 latency: ' in summary
+
+
+@pytest.mark.parametrize('arguments', [
+    ['not_a_validator'],
+    ['_email_core'],
+    ['email', '--jobs', '0'],
+    ['integer', '-o', 'minimum=x'],
+    ['integer', '-o', 'minimum'],
+    ['email', '-o', 'bogus=1'],
+    ['date', '-o', 'minimum_length=1'],
+    ['is_email', '-o', 'bogus=1'],
+    ['is_file', '-o', 'minimum=1'],
+    ['is_integer', '-o', 'minimum=x'],
+    ['is_ipv4', '-o', 'output=bogus'],
+    ['email', '--csv-column', 'a', '--jsonl-field', 'b'],
+])
+def test_main_usage(capsys, arguments):
+    """Is incorrect usage reported with exit status 2?"""
+    with pytest.raises(SystemExit) as error:
+        cli.main(arguments)
+
+    assert error.value.code == 2
+
+
+@pytest.mark.parametrize('arguments', [
+    ['email', '/var/data/missing'],
+    ['email', '--csv-column', 'missing', '/var/data/values'],
+])
+def test_main_errors(fs, capsys, arguments):
+    """Are unreadable files reported with exit status 2?"""
+    fs.create_file('/var/data/values', contents = CSV.encode('utf-8'))
+
+    assert cli.main(arguments) == 2
+    assert 'validator-collection: error:' in capsys.readouterr()[1]
@@ -9,7 +9,8 @@ Tests for decorators.
 
 import os
 
-from validator_collection._decorators import disable_on_env, disable_checker_on_env
+from validator_collection._decorators import disable_on_env, disable_checker_on_env, \
+    reload_disabled, watch_disabled
 
 import pytest
 
@@ -32,6 +33,8 @@ def test_disable_on_env(env_value, input_value, force_run, expects):
     if env_value:
         os.environ['VALIDATORS_DISABLED'] = env_value
 
+    reload_disabled()
+
     @disable_on_env
     def decorated_function(value, other_value = None):                          # pylint: disable=W0613
         return 123
@@ -43,6 +46,8 @@ def test_disable_on_env(env_value, input_value, force_run, expects):
     if env_value:
         del os.environ['VALIDATORS_DISABLED']
 
+    reload_disabled()
+
 
 @pytest.mark.parametrize('env_value, input_value, force_run, expects', [
     (None, 'test', False, 123),
@@ -62,6 +67,8 @@ def test_disable_checker_on_env(env_value, input_value, force_run, expects):
     if env_value:
         os.environ['CHECKERS_DISABLED'] = env_value
 
+    reload_disabled()
+
     @disable_checker_on_env
     def decorated_function(value, other_value = None, **kwargs):                          # pylint: disable=W0613
         return 123
@@ -72,3 +79,50 @@ def test_disable_checker_on_env(env_value, input_value, force_run, expects):
 
     if env_value:
         del os.environ['CHECKERS_DISABLED']
+
+    reload_disabled()
+
+
+def test_disabled_is_cached_until_reload():
+    if os.getenv('VALIDATORS_DISABLED', None):
+        del os.environ['VALIDATORS_DISABLED']
+    reload_disabled()
+
+    @disable_on_env
+    def decorated_function(value):                                              # pylint: disable=W0613
+        return 123
+
+    os.environ['VALIDATORS_DISABLED'] = 'decorated_function'
+    assert decorated_function('test') == 123
+
+    validators_disabled, checkers_disabled = reload_disabled()
+    assert validators_disabled == frozenset(['decorated_function'])
+    assert checkers_disabled == frozenset()
+    assert decorated_function('test') == 'test'
+
+    del os.environ['VALIDATORS_DISABLED']
+    reload_disabled()
+    assert decorated_function('test') == 123
+
+
+def test_watch_disabled():
+    if os.getenv('CHECKERS_DISABLED', None):
+        del os.environ['CHECKERS_DISABLED']
+    reload_disabled()
+
+    @disable_checker_on_env
+    def decorated_function(value, **kwargs):                                    # pylint: disable=W0613
+        return 123
+
+    watch_disabled()
+    try:
+        assert decorated_function('test') == 123
+        os.environ['CHECKERS_DISABLED'] = 'other_function, decorated_function'
+        assert decorated_function('test') is True
+        del os.environ['CHECKERS_DISABLED']
+        assert decorated_function('test') == 123
+    finally:
+        watch_disabled(False)
+        if os.getenv('CHECKERS_DISABLED', None):
+            del os.environ['CHECKERS_DISABLED']
+        reload_disabled()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""
+***********************************
+tests.test_pipeline
+***********************************
+
+Tests for validating CSV and NDJSON files.
+
+"""
+
+import io
+
+import pytest
+
+from validator_collection import errors, pipeline, validators
+from validator_collection.records import RecordValidator
+
+FIELDS = {
+    'email': 'email',
+    'age': validators.compile('integer', minimum = 0, maximum = 150, coerce_value = True),
+}
+
+CSV = (u'email,age,name\r\n'
+       u'test@domain.dev,42,"Doe, Jane"\r\n'
+       u'not-an-email,500,John\r\n'
+       u'other@domain.dev,,"multi\r\nline"\r\n'
+       u'second@domain.dev,7,Ann\r\n')
+
+NDJSON = (u'{"email": "test@domain.dev", "age": 42, "name": "Doe, Jane"}\n'
+          u'{"email": "not-an-email", "age": 500, "name": "John"}\n'
+          u'\n'
+          u'{"email": "other@domain.dev", "age": null}\n'
+          u'not json\n'
+          u'["a", "list"]\n'
+          u'{"email": "second@domain.dev", "age": "7"}\n')
+
+
+def errors_of(chunks):
+    """Return the failures in ``chunks`` as comparable tuples."""
+    return [(error.row, error.column, error.error_type)
+            for chunk in chunks for error in chunk.errors]
+
+
+def rows_of(chunks):
+    """Return the valid rows in ``chunks``."""
+    return [row for chunk in chunks for row in chunk.rows]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+@pytest.mark.parametrize('as_stream', [False, True])
+def test_validate_csv(fs, chunk_size, as_stream):
+    """Are the rows of a CSV file validated and reported by row and column?"""
+    fs.create_file('/var/data/users.csv', contents = CSV.encode('utf-8'))
+    if as_stream:
+        with open('/var/data/users.csv', 'rb') as stream:
+            chunks = list(pipeline.validate_csv(stream, FIELDS, chunk_size = chunk_size))
+            assert not stream.closed
+    else:
+        chunks = list(pipeline.validate_csv('/var/data/users.csv',
+                                            FIELDS,
+                                            chunk_size = chunk_size))
+
+    assert all(len(chunk.rows) + len(set(error.row for error in chunk.errors)) <= chunk_size
+               for chunk in chunks)
+    assert rows_of(chunks) == [
+        {'email': 'test@domain.dev', 'age': 42, 'name': 'Doe, Jane'},
+        {'email': 'second@domain.dev', 'age': 7, 'name': 'Ann'},
+    ]
+    assert errors_of(chunks) == [
+        (2, 'email', 'InvalidEmailError'),
+        (2, 'age', 'MaximumValueError'),
+        (3, 'age', 'CannotCoerceError'),
+    ]
+    assert [error.value for chunk in chunks for error in chunk.errors] == [
+        'not-an-email', '500', ''
+    ]
+
+
+def test_validate_csv_options():
+    """Are CSV reader options passed through?"""
+    source = io.BytesIO(u'email;age\ntest@domain.dev;1\n'.encode('utf-8'))
+    chunks = list(pipeline.validate_csv(source, FIELDS, delimiter = ';'))
+    assert rows_of(chunks) == [{'email': 'test@domain.dev', 'age': 1}]
+
+
+def test_validate_csv_byte_order_mark():
+    """Is a byte order mark at the start of a CSV file skipped?"""
+    source = io.BytesIO(u'email,age\ntest@domain.dev,1\n'.encode('utf-8-sig'))
+    chunks = list(pipeline.validate_csv(source, FIELDS))
+    assert rows_of(chunks) == [{'email': 'test@domain.dev', 'age': 1}]
+
+
+def test_validate_csv_missing_column():
+    """Is a mapped column missing from the header rejected?"""
+    source = io.BytesIO(u'email,years\ntest@domain.dev,1\n'.encode('utf-8'))
+    with pytest.raises(errors.ValidatorUsageError):
+        list(pipeline.validate_csv(source, FIELDS))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+def test_validate_ndjson(chunk_size):
+    """Are the records of an NDJSON file validated, and unreadable lines
+    reported?"""
+    source = io.BytesIO(NDJSON.encode('utf-8'))
+    chunks = list(pipeline.validate_ndjson(source, RecordValidator(FIELDS),
+                                           chunk_size = chunk_size))
+
+    assert rows_of(chunks) == [
+        {'email': 'test@domain.dev', 'age': 42, 'name': 'Doe, Jane'},
+        {'email': 'second@domain.dev', 'age': 7},
+    ]
+    assert errors_of(chunks) == [
+        (2, 'email', 'InvalidEmailError'),
+        (2, 'age', 'MaximumValueError'),
+        (3, 'age', 'EmptyValueError'),
+        (4, None, 'CannotCoerceError'),
+        (5, None, 'NotADictError'),
+    ]
+
+
+def test_validate_ndjson_empty_object():
+    """Is an empty JSON object validated as a record with every field missing?"""
+    source = io.BytesIO(u'{}\n'.encode('utf-8'))
+    chunks = list(pipeline.validate_ndjson(source, FIELDS))
+    assert errors_of(chunks) == [(1, 'email', 'EmptyValueError'),
+                                 (1, 'age', 'EmptyValueError')]
+
+    optional = { 'email': validators.compile('email', allow_empty = True) }
+    source = io.BytesIO(u'{}\n'.encode('utf-8'))
+    assert rows_of(pipeline.validate_ndjson(source, optional)) == [{'email': None}]
+
+
+@pytest.mark.parametrize('kwargs, error_type', [
+    ({ 'fields': {} }, errors.EmptyValueError),
+    ({ 'fields': { 'email': 123 } }, errors.ValidatorUsageError),
+    ({ 'fields': FIELDS, 'chunk_size': 0 }, errors.MinimumValueError),
+])
+def test_validate_errors(kwargs, error_type):
+    """Are invalid settings rejected?"""
+    with pytest.raises(error_type):
+        list(pipeline.validate_ndjson(io.BytesIO(NDJSON.encode('utf-8')), **kwargs))
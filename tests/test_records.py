@@ -0,0 +1,173 @@
+"""
+***********************************
+tests.test_records.py
+***********************************
+
+Tests for the record validator.
+
+"""
+
+import datetime
+import decimal
+import os
+import pickle
+
+import pytest
+
+from validator_collection import validators, errors
+from validator_collection.records import RecordValidator
+
+
+def to_upper(value):
+    return value.upper()
+
+
+FIELDS = {
+    'email': 'email',
+    'created': validators.compile('datetime', allow_empty = True),
+    'age': validators.compile('integer', minimum = 0, maximum = 150),
+    'code': to_upper,
+    'name': validators.string,
+}
+
+
+@pytest.mark.parametrize('record, expected, failed_fields', [
+    ({ 'email': 'test@domain.dev', 'age': '42', 'code': 'ab', 'name': 'Test' },
+     { 'email': 'test@domain.dev', 'created': None, 'age': 42, 'code': 'AB',
+       'name': 'Test' },
+     None),
+    ({ 'email': 'test@domain.dev', 'age': 42, 'code': 'ab', 'name': 'Test',
+       'created': '2018-01-01T00:00:00', 'extra': 123 },
+     { 'email': 'test@domain.dev', 'created': datetime.datetime(2018, 1, 1),
+       'age': 42, 'code': 'AB', 'name': 'Test', 'extra': 123 },
+     None),
+    ('{"email": "test@domain.dev", "age": 42, "code": "ab", "name": "Test"}',
+     { 'email': 'test@domain.dev', 'created': None, 'age': 42, 'code': 'AB',
+       'name': 'Test' },
+     None),
+    ({ 'email': 'not-an-email', 'age': 500, 'code': 'ab', 'name': 'Test' },
+     None,
+     { 'email': errors.InvalidEmailError, 'age': errors.MaximumValueError }),
+    ({ 'code': 123 },
+     None,
+     { 'email': errors.EmptyValueError, 'age': errors.EmptyValueError,
+       'code': AttributeError, 'name': errors.EmptyValueError }),
+])
+def test_validate(record, expected, failed_fields):
+    """Are records validated field by field, collecting every field error?"""
+    validator = RecordValidator(FIELDS)
+
+    if failed_fields is None or AttributeError not in failed_fields.values():
+        assert validator.check(record) is (failed_fields is None)
+
+    if failed_fields is None:
+        assert validator.validate(record) == expected
+        assert validator(record) == expected
+    elif AttributeError in failed_fields.values():
+        with pytest.raises(AttributeError):
+            validator.validate(record)
+    else:
+        with pytest.raises(errors.RecordValidationError) as error_info:
+            validator.validate(record)
+
+        error = error_info.value
+        assert sorted(error.errors.keys()) == sorted(failed_fields.keys())
+        for field_name in failed_fields:
+            assert isinstance(error.errors[field_name], failed_fields[field_name])
+
+
+@pytest.mark.parametrize('record, allow_empty, error', [
+    (None, True, None),
+    ({}, True, None),
+    (None, False, errors.EmptyValueError),
+    ('not-a-dict', False, errors.CannotCoerceError),
+    (123, False, errors.NotADictError),
+])
+def test_validate_empty(record, allow_empty, error):
+    """Are empty and non-dict records handled like validators.dict()?"""
+    validator = RecordValidator(FIELDS)
+    if error is None:
+        assert validator.validate(record, allow_empty = allow_empty) is None
+    else:
+        with pytest.raises(error):
+            validator.validate(record, allow_empty = allow_empty)
+
+
+@pytest.mark.parametrize('fields, error', [
+    ({}, errors.EmptyValueError),
+    ({ 'email': 123 }, errors.ValidatorUsageError),
+    ({ 'email': 'not_a_validator' }, errors.ValidatorUsageError),
+    ({ 'age': validators.compile('integer') }, None),
+])
+def test_fields(fields, error):
+    """Are invalid field mappings rejected?"""
+    if error is None:
+        assert sorted(RecordValidator(fields).fields.keys()) == sorted(fields.keys())
+    else:
+        with pytest.raises(error):
+            RecordValidator(fields)
+
+
+def test_many():
+    """Are batches of records validated in order, with errors keyed by index?"""
+    validator = RecordValidator({ 'email': 'email', 'age': 'integer' })
+    records = [{ 'email': 'test@domain.dev', 'age': '1' },
+               { 'email': 'not-an-email', 'age': 'x' },
+               { 'email': 'test@domain.com', 'age': 3 }]
+
+    result = validator.many(iter(records), collect_errors = True)
+    assert isinstance(result, validators.BatchResult)
+    assert sorted(result.errors.keys()) == [1]
+    assert sorted(result.errors[1].errors.keys()) == ['age', 'email']
+    assert result.values[0] == { 'email': 'test@domain.dev', 'age': 1 }
+    assert result.values[1] is None
+
+    with pytest.raises(errors.RecordValidationError):
+        validator.many(records)
+
+    assert validator.many(records[:1]) == [result.values[0]]
+    assert validator.many(None) == []
+
+
+def test_many_uncoercible():
+    """Are values a validator cannot even compare reported as field errors?"""
+    validator = RecordValidator({
+        'id': 'uuid',
+        'price': validators.compile('decimal', minimum = decimal.Decimal('1')),
+    })
+    records = [{ 'id': 123, 'price': float('nan') },
+               { 'id': '00000000-0000-0000-0000-000000000000', 'price': '2' }]
+
+    result = validator.many(records, collect_errors = True)
+    assert sorted(result.errors.keys()) == [0]
+    assert sorted(result.errors[0].errors.keys()) == ['id', 'price']
+    assert all(isinstance(error, errors.CannotCoerceError)
+               for error in result.errors[0].errors.values())
+
+
+def test_validate_disabled():
+    """Are fields whose validator is disabled passed through unchanged?"""
+    from validator_collection import reload_disabled
+
+    validator = RecordValidator({ 'email': 'email', 'age': 'integer' })
+    os.environ['VALIDATORS_DISABLED'] = 'email'
+    reload_disabled()
+    try:
+        assert validator.validate({ 'email': 'not-an-email', 'age': '1' }) == {
+            'email': 'not-an-email', 'age': 1
+        }
+    finally:
+        del os.environ['VALIDATORS_DISABLED']
+        reload_disabled()
+
+    assert validator.check({ 'email': 'not-an-email', 'age': '1' }) is False
+
+
+def test_error_pickle():
+    """Do record errors survive pickling with their field errors?"""
+    error = errors.RecordValidationError('message',
+                                         { 'email': errors.InvalidEmailError('x') })
+    result = pickle.loads(pickle.dumps(error))
+
+    assert str(result) == 'message'
+    assert isinstance(result.errors['email'], errors.InvalidEmailError)
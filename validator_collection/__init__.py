@@ -10,6 +10,7 @@ and ``validator_collection/checkers.py`` respectively.
 
 import os
 from validator_collection._version import __version__
+from validator_collection._decorators import reload_disabled, watch_disabled
 
 from validator_collection.validators import bytesIO, date, dict, decimal, \
     directory_exists, datetime, email, float, fraction, file_exists, ip_address, \
@@ -23,6 +24,8 @@ from validator_collection.checkers import is_between, has_length, is_uuid, is_em
     is_stringIO, is_bytesIO, is_pathlike, is_on_filesystem, is_file, is_directory, \
     is_type, are_dicts_equivalent, are_equivalent, is_domain
 
+from validator_collection.records import RecordValidator
+
 __all__ = [
     'bytesIO',
     'date',
@@ -86,5 +89,10 @@ __all__ = [
     'is_directory',
     'is_type',
     'are_dicts_equivalent',
-    'are_equivalent'
+    'are_equivalent',
+
+    'RecordValidator',
+
+    'reload_disabled',
+    'watch_disabled'
 ]
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+"""Runs the ``validator-collection`` command (see :mod:`validator_collection.cli`)
+as ``python -m validator_collection``."""
+
+import sys
+
+from validator_collection.cli import main
+
+sys.exit(main())
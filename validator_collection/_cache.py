@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._cache.py
+****************************************
+
+Defines a small, thread-safe, bounded LRU cache used internally to memoize
+expensive intermediate results (e.g. compiled JSON Schema validators), with
+optional expiry for results that can go stale (e.g. file system status).
+
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+_MISSING = object()
+
+_clock = getattr(time, 'monotonic', time.time)
+
+
+class LRUCache(object):
+    """A bounded, least-recently-used mapping with hit/miss statistics.
+
+    :param maxsize: The maximum number of entries to retain. If ``0``, nothing
+      is cached. If :obj:`None <python:None>`, the cache is unbounded.
+    :type maxsize: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param ttl: The number of seconds for which an entry remains valid after it
+      is cached. If :obj:`None <python:None>`, entries never expire. Changing
+      it affects entries cached afterwards.
+    :type ttl: numeric / :obj:`None <python:None>`
+
+    """
+
+    def __init__(self, maxsize = 128, ttl = None):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default = None):
+        """Return the value cached for ``key``, or ``default`` if not cached.
+
+        Counts as a hit or a miss in the cache statistics. An expired entry is
+        removed and counts as a miss.
+        """
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            if entry is _MISSING or \
+               (entry[1] is not None and entry[1] <= _clock()):
+                self.misses += 1
+                return default
+
+            self._data[key] = entry
+            self.hits += 1
+
+            return entry[0]
+
+    def set(self, key, value):
+        """Cache ``value`` for ``key``, evicting the least-recently-used entry if
+        the cache is full."""
+        if self.maxsize == 0:
+            return
+
+        expires = None
+        if self.ttl is not None:
+            expires = _clock() + self.ttl
+
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, expires)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last = False)
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return the cache statistics.
+
+        :rtype: :class:`CacheInfo` named tuple with ``hits``, ``misses``,
+          ``maxsize`` and ``currsize``
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key, None)
+        return entry is not None and (entry[1] is None or entry[1] > _clock())
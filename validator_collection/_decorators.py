@@ -11,6 +11,12 @@ validator_collection._decorators.py
 Defines the decorator used to prevent validator execution based on an available
 environment variable.
 
+The ``VALIDATORS_DISABLED`` and ``CHECKERS_DISABLED`` environment variables are
+read once (on import) and cached as :class:`frozenset <python:frozenset>` objects.
+Changes made to the environment afterwards are only picked up after calling
+:func:`reload_disabled`, or automatically if :func:`watch_disabled` has been
+switched on.
+
 """
 
 import os
@@ -18,6 +24,114 @@ from functools import wraps
 
 from validator_collection.errors import ValidatorUsageError
 
+_DISABLED_STATE = {
+    'VALIDATORS_DISABLED': frozenset(),
+    'CHECKERS_DISABLED': frozenset(),
+    'raw_validators': None,
+    'raw_checkers': None,
+    'watch': False
+}
+
+
+def _parse_disabled(env_value):
+    """Parse a comma-separated list of function names into a
+    :class:`frozenset <python:frozenset>`.
+
+    :param env_value: The raw value of the environment variable.
+    :type env_value: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :rtype: :class:`frozenset <python:frozenset>` of :class:`str <python:str>`
+    """
+    if not env_value:
+        return frozenset()
+
+    return frozenset(x.strip() for x in env_value.split(',') if x.strip())
+
+
+def reload_disabled():
+    """Re-read the ``VALIDATORS_DISABLED`` and ``CHECKERS_DISABLED`` environment
+    variables and refresh the cached sets of disabled functions.
+
+    .. hint::
+
+      The environment variables are read once when the library is imported. If
+      you change them at runtime, call this function to apply the change (or
+      switch on :func:`watch_disabled` to have it applied automatically).
+
+    :returns: The names of the disabled validators and the names of the disabled
+      checkers.
+    :rtype: 2-member :class:`tuple <python:tuple>` of
+      :class:`frozenset <python:frozenset>`
+
+    """
+    raw_validators = os.getenv('VALIDATORS_DISABLED', '')
+    raw_checkers = os.getenv('CHECKERS_DISABLED', '')
+
+    _DISABLED_STATE['VALIDATORS_DISABLED'] = _parse_disabled(raw_validators)
+    _DISABLED_STATE['CHECKERS_DISABLED'] = _parse_disabled(raw_checkers)
+    _DISABLED_STATE['raw_validators'] = raw_validators
+    _DISABLED_STATE['raw_checkers'] = raw_checkers
+
+    return (_DISABLED_STATE['VALIDATORS_DISABLED'],
+            _DISABLED_STATE['CHECKERS_DISABLED'])
+
+
+def watch_disabled(watch = True):
+    """Enable or disable watching the environment for live changes to
+    ``VALIDATORS_DISABLED`` and ``CHECKERS_DISABLED``.
+
+    When watching, every decorated call compares the raw environment variables
+    against the values last parsed and re-parses them only if they have changed.
+    This is cheaper than the parsing itself but not free, so it is switched off by
+    default.
+
+    :param watch: If ``True``, watch for changes. If ``False``, only use the
+      cached values (refreshed by :func:`reload_disabled`). Defaults to ``True``.
+    :type watch: :class:`bool <python:bool>`
+
+    """
+    _DISABLED_STATE['watch'] = bool(watch)
+    if watch:
+        reload_disabled()
+
+
+def _refresh_if_changed():
+    """Re-parse the environment variables if they differ from the cached values."""
+    if os.getenv('VALIDATORS_DISABLED', '') != _DISABLED_STATE['raw_validators'] or \
+       os.getenv('CHECKERS_DISABLED', '') != _DISABLED_STATE['raw_checkers']:
+        reload_disabled()
+
+
+def validator_is_disabled(function_name):
+    """Indicate whether the validator named ``function_name`` is disabled via
+    ``VALIDATORS_DISABLED``.
+
+    :param function_name: The name of the validator.
+    :type function_name: :class:`str <python:str>`
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if _DISABLED_STATE['watch']:
+        _refresh_if_changed()
+
+    return function_name in _DISABLED_STATE['VALIDATORS_DISABLED']
+
+
+def disabled_validators():
+    """Return the names of the validators disabled via ``VALIDATORS_DISABLED``.
+
+    Code that validates many values at once can call this once and test each
+    validator's name against the result, rather than calling
+    :func:`validator_is_disabled` for every value.
+
+    :rtype: :class:`frozenset <python:frozenset>` of :class:`str <python:str>`
+    """
+    if _DISABLED_STATE['watch']:
+        _refresh_if_changed()
+
+    return _DISABLED_STATE['VALIDATORS_DISABLED']
+
+
 def disable_on_env(func):
     """Disable the ``func`` called if its name is present in ``VALIDATORS_DISABLED``.
 
@@ -28,27 +142,24 @@ def disable_on_env(func):
       ``func``. If enabled, the result of ``func``.
 
     """
+    function_name = func.__name__
+    state = _DISABLED_STATE
+
     @wraps(func)
     def func_wrapper(*args, **kwargs):
         # pylint: disable=C0111, C0103
-        function_name = func.__name__
-        VALIDATORS_DISABLED = os.getenv('VALIDATORS_DISABLED', '')
-        disabled_functions = [x.strip() for x in VALIDATORS_DISABLED.split(',')]
+        if not args:
+            raise ValidatorUsageError('no value was supplied')
 
-        force_run = kwargs.get('force_run', False)
+        if state['watch']:
+            _refresh_if_changed()
 
-        try:
-            value = args[0]
-        except IndexError:
-            raise ValidatorUsageError('no value was supplied')
+        force_run = kwargs.pop('force_run', False) if kwargs else False
+
+        if not force_run and function_name in state['VALIDATORS_DISABLED']:
+            return args[0]
 
-        if function_name in disabled_functions and not force_run:
-            return value
-        else:
-            updated_kwargs = {key : kwargs[key]
-                              for key in kwargs
-                              if key != 'force_run'}
-            return func(*args, **updated_kwargs)
+        return func(*args, **kwargs)
 
     return func_wrapper
 
@@ -62,18 +173,22 @@ def disable_checker_on_env(func):
     :returns: If disabled, ``True``. If enabled, the result of ``func``.
 
     """
+    function_name = func.__name__
+    state = _DISABLED_STATE
+
     @wraps(func)
     def func_wrapper(*args, **kwargs):
         # pylint: disable=C0111, C0103
-        function_name = func.__name__
-        CHECKERS_DISABLED = os.getenv('CHECKERS_DISABLED', '')
-        disabled_functions = [x.strip() for x in CHECKERS_DISABLED.split(',')]
-
-        force_run = kwargs.get('force_run', False)
+        if state['watch']:
+            _refresh_if_changed()
 
-        if function_name in disabled_functions and not force_run:
+        if function_name in state['CHECKERS_DISABLED'] and \
+           not (kwargs and kwargs.get('force_run', False)):
             return True
-        else:
-            return func(*args, **kwargs)
+
+        return func(*args, **kwargs)
 
     return func_wrapper
+
+
+reload_disabled()
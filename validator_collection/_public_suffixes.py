@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection._public_suffixes.py
+****************************************
+
+Looks up the public suffix (e.g. ``co.uk``) and top-level domain of a domain
+name in the bundled copy of the `Public Suffix List <https://publicsuffix.org/>`_.
+
+The list is read on first use into a :class:`PublicSuffixIndex` of frozen sets,
+so that finding the public suffix of a domain name takes one set lookup per
+label.
+
+"""
+
+import io
+import os
+import threading
+from collections import namedtuple
+
+#: The bundled copy of the Public Suffix List.
+PUBLIC_SUFFIX_LIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       'public_suffix_list.dat')
+
+PublicSuffixIndex = namedtuple('PublicSuffixIndex', ['rules',
+                                                     'wildcards',
+                                                     'exceptions',
+                                                     'top_level_domains'])
+
+_INDEX = None
+_LOCK = threading.Lock()
+
+
+def _decode_label(label):
+    """Return ``label`` with an IDNA (``xn--``) prefix decoded from punycode, as
+    internationalized names appear in the Public Suffix List in Unicode."""
+    if not label.startswith('xn--'):
+        return label
+
+    try:
+        return label[4:].encode('ascii').decode('punycode')
+    except UnicodeError:
+        return label
+
+
+def load(path = PUBLIC_SUFFIX_LIST_PATH):
+    """Read the Public Suffix List at ``path``.
+
+    :param path: The path to a file in the format of the Public Suffix List.
+      Defaults to the bundled copy.
+    :type path: :class:`str <python:str>`
+
+    :rtype: :class:`PublicSuffixIndex`
+    """
+    rules = set()
+    wildcards = set()
+    exceptions = set()
+    with io.open(path, encoding = 'utf-8') as list_file:
+        for line in list_file:
+            line = line.strip()
+            if not line or line.startswith('//'):
+                continue
+
+            rule = line.split()[0].lower()
+            if rule.startswith('!'):
+                exceptions.add(rule[1:])
+            elif rule.startswith('*.'):
+                wildcards.add(rule[2:])
+            else:
+                rules.add(rule)
+
+    top_level_domains = frozenset(rule.rsplit('.', 1)[-1]
+                                  for rule in rules | wildcards | exceptions)
+
+    return PublicSuffixIndex(frozenset(rules),
+                             frozenset(wildcards),
+                             frozenset(exceptions),
+                             top_level_domains)
+
+
+def get_index():
+    """Return the index of the bundled Public Suffix List, reading it on the
+    first call.
+
+    :rtype: :class:`PublicSuffixIndex`
+    """
+    global _INDEX                                                               # pylint: disable=W0603
+
+    if _INDEX is None:
+        with _LOCK:
+            if _INDEX is None:
+                _INDEX = load()
+
+    return _INDEX
+
+
+def is_top_level_domain(label):
+    """Indicate whether ``label`` (in lower case) is a top-level domain on the
+    Public Suffix List.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    return _decode_label(label) in get_index().top_level_domains
+
+
+def public_suffix_length(labels):
+    """Return the number of labels in the public suffix of the domain name made
+    up of ``labels`` (in lower case).
+
+    Candidate suffixes are tried from the longest to the shortest, and the first
+    that matches a rule is the public suffix. A domain name that matches no rule
+    has its top-level domain as its public suffix.
+
+    :param labels: The labels of the domain name, from left to right.
+    :type labels: sequence of :class:`str <python:str>`
+
+    :rtype: :class:`int <python:int>`
+    """
+    index = get_index()
+    value = '.'.join(labels)
+    if 'xn--' in value:
+        labels = [_decode_label(label) for label in labels]
+        value = '.'.join(labels)
+
+    start = 0
+    for count in range(len(labels), 1, -1):
+        suffix = value[start:]
+        if suffix in index.exceptions:
+            return count - 1
+
+        parent_start = start + len(labels[-count]) + 1
+        if suffix in index.rules or value[parent_start:] in index.wildcards:
+            return count
+
+        start = parent_start
+
+    return 1
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection.aio
+****************************************
+
+Awaitable versions of the validators and checkers that touch the file system,
+for use from :mod:`asyncio <python:asyncio>` coroutines.
+
+Validators like :func:`file_exists() <validator_collection.validators.file_exists>`
+block while the operating system answers, which on slow or network storage
+stalls every other task on the event loop. The functions in this module run them
+in a pool of threads instead, and can be awaited:
+
+.. code-block:: python
+
+  from validator_collection import aio
+
+  path = await aio.file_exists(path)
+  if await aio.is_readable(path):
+      ...
+
+:func:`stream_many` validates a batch of values with any validator, and yields
+the results as they complete. Validators that do not touch the file system only
+compute, so they are run inline, without the overhead of a thread pool.
+
+This module requires Python 3.6 or later.
+
+"""
+
+import asyncio
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+
+from validator_collection import checkers, validators
+
+#: The number of threads in the pool created by this module, unless changed
+#: with :func:`configure`.
+DEFAULT_MAX_WORKERS = 16
+
+#: The validators and checkers that block on the file system, and are run in the
+#: thread pool.
+BLOCKING_FUNCTIONS = frozenset([
+    'path_exists', 'file_exists', 'directory_exists', 'readable', 'writeable',
+    'executable',
+    'is_on_filesystem', 'is_file', 'is_directory', 'is_readable',
+    'is_writeable', 'is_executable',
+])
+
+_EXECUTOR = None
+_OWNS_EXECUTOR = False
+_MAX_WORKERS = DEFAULT_MAX_WORKERS
+_LOCK = threading.Lock()
+
+
+def configure(executor = None, max_workers = None):
+    """Set the :class:`Executor <python:concurrent.futures.Executor>` in which
+    the functions in this module run the validators and checkers that block on
+    the file system.
+
+    The number of threads in the pool bounds how many of them run at once. A
+    pool previously created by this module is shut down (without waiting for
+    the work already submitted to it).
+
+    :param executor: The executor to use, which this module will not shut down.
+      If :obj:`None <python:None>`, this module creates a
+      :class:`ThreadPoolExecutor <python:concurrent.futures.ThreadPoolExecutor>`
+      of ``max_workers`` threads when it is next needed. Defaults to
+      :obj:`None <python:None>`.
+    :type executor: :class:`Executor <python:concurrent.futures.Executor>` /
+      :obj:`None <python:None>`
+
+    :param max_workers: The number of threads in the pool created by this module,
+      which is also the default ``max_concurrency`` of :func:`stream_many`.
+      If :obj:`None <python:None>`, uses :data:`DEFAULT_MAX_WORKERS`. Defaults to
+      :obj:`None <python:None>`.
+    :type max_workers: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :raises ValueError: (or a sub-class) if ``max_workers`` is not a positive
+      integer
+    """
+    global _EXECUTOR, _OWNS_EXECUTOR, _MAX_WORKERS                              # pylint: disable=W0603
+
+    max_workers = validators.integer(max_workers,
+                                     allow_empty = True,
+                                     minimum = 1,
+                                     force_run = True)                          # pylint: disable=E1123
+
+    with _LOCK:
+        if _OWNS_EXECUTOR:
+            _EXECUTOR.shutdown(wait = False)
+
+        _EXECUTOR = executor
+        _OWNS_EXECUTOR = False
+        _MAX_WORKERS = max_workers or DEFAULT_MAX_WORKERS
+
+
+def get_executor():
+    """Return the :class:`Executor <python:concurrent.futures.Executor>` in which
+    blocking validators and checkers are run, creating it on the first call if
+    none was set with :func:`configure`.
+
+    :rtype: :class:`Executor <python:concurrent.futures.Executor>`
+    """
+    global _EXECUTOR, _OWNS_EXECUTOR                                            # pylint: disable=W0603
+
+    if _EXECUTOR is None:
+        with _LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers = _MAX_WORKERS)
+                _OWNS_EXECUTOR = True
+
+    return _EXECUTOR
+
+
+def _run_blocking(function, *args, **kwargs):
+    """Run ``function`` in the executor, returning an awaitable for its result."""
+    loop = asyncio.get_event_loop()
+    return loop.run_in_executor(get_executor(), partial(function, *args, **kwargs))
+
+
+def _awaitable(function):
+    """Build the awaitable version of the (blocking) validator or checker
+    ``function``.
+
+    :rtype: coroutine function
+    """
+    @wraps(function)
+    async def run(value, **kwargs):
+        return await _run_blocking(function, value, **kwargs)
+
+    run.__doc__ = """Awaitable version of
+    :func:`{name}() <validator_collection.{module}.{name}>`, which is run in the
+    executor (see :func:`configure`).
+
+    Accepts the same arguments, and returns or raises the same values.
+    """.format(name = function.__name__, module = function.__module__.split('.')[-1])
+
+    return run
+
+
+path_exists = _awaitable(validators.path_exists)
+file_exists = _awaitable(validators.file_exists)
+directory_exists = _awaitable(validators.directory_exists)
+readable = _awaitable(validators.readable)
+writeable = _awaitable(validators.writeable)
+executable = _awaitable(validators.executable)
+
+is_on_filesystem = _awaitable(checkers.is_on_filesystem)
+is_file = _awaitable(checkers.is_file)
+is_directory = _awaitable(checkers.is_directory)
+is_readable = _awaitable(checkers.is_readable)
+is_writeable = _awaitable(checkers.is_writeable)
+is_executable = _awaitable(checkers.is_executable)
+
+
+class StreamedResult(namedtuple('StreamedResult', ['index', 'value', 'error'])):
+    """A result yielded by :func:`stream_many`.
+
+    :ivar index: The index of the member in the input.
+    :vartype index: :class:`int <python:int>`
+
+    :ivar value: The validated (coerced) value, or :obj:`None <python:None>` if
+      the member failed validation.
+
+    :ivar error: The exception raised if the member failed validation, or
+      :obj:`None <python:None>`.
+    :vartype error: :class:`Exception <python:Exception>` /
+      :obj:`None <python:None>`
+
+    """
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        """``True`` if the member passed validation."""
+        return self.error is None
+
+
+def _validate(validator, index, value):
+    """Validate ``value`` with the compiled ``validator``, returning a
+    :class:`StreamedResult`."""
+    try:
+        return StreamedResult(index, validator(value), None)
+    except (ValueError, TypeError, IOError) as error:
+        return StreamedResult(index, None, error)
+
+
+async def stream_many(validator, values, max_concurrency = None, **kwargs):
+    """Validate every member of ``values`` with ``validator``, yielding a
+    :class:`StreamedResult` for each member as it completes.
+
+    .. code-block:: python
+
+      from validator_collection import aio
+
+      async for result in aio.stream_many('readable', paths, max_concurrency = 64):
+          if not result.is_valid:
+              print(paths[result.index], result.error)
+
+    Validators that block on the file system (see :data:`BLOCKING_FUNCTIONS`)
+    are run in the executor (see :func:`configure`), and their results are
+    yielded in the order they complete, which may differ from the input order.
+    Other validators are run inline, and their results are yielded in input
+    order.
+
+    Keyword arguments are validated and normalized **once** for the whole batch
+    (see :func:`compile() <validator_collection.validators.compile>`).
+
+    :param validator: The validator to apply, or its name.
+    :type validator: callable / :class:`str <python:str>`
+
+    :param values: The values to validate. They are read as earlier results are
+      yielded, so ``values`` may be a (lazy) iterable of any length.
+    :type values: iterable
+
+    :param max_concurrency: The maximum number of members being validated at
+      once. If :obj:`None <python:None>`, uses the ``max_workers`` set with
+      :func:`configure` (by default, :data:`DEFAULT_MAX_WORKERS`). Defaults to
+      :obj:`None <python:None>`.
+    :type max_concurrency: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param kwargs: Keyword arguments accepted by ``validator``.
+
+    :returns: An asynchronous iterator of :class:`StreamedResult`
+
+    :raises ValidatorUsageError: if ``validator`` is not a known validator
+    :raises ValueError: (or a sub-class) if a keyword argument is invalid
+    """
+    compiled = validators.compile(validator, **kwargs)
+    max_concurrency = validators.integer(max_concurrency,
+                                         allow_empty = True,
+                                         minimum = 1,
+                                         force_run = True)                      # pylint: disable=E1123
+    max_concurrency = max_concurrency or _MAX_WORKERS
+
+    if compiled.name not in BLOCKING_FUNCTIONS:
+        for index, value in enumerate(values):
+            yield _validate(compiled, index, value)
+
+        return
+
+    pending = set()
+    try:
+        for index, value in enumerate(values):
+            pending.add(_run_blocking(_validate, compiled, index, value))
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(pending,
+                                                   return_when = asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = await asyncio.wait(pending,
+                                               return_when = asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,1054 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection.arrays
+****************************************
+
+Vectorized versions of validators, which validate every element of a
+:class:`numpy.ndarray`, :class:`pandas.Series` or Arrow array with array
+operations rather than one Python call per element.
+
+.. code-block:: python
+
+  from validator_collection import arrays
+
+  result = arrays.integer(frame['age'], minimum = 0, maximum = 150)
+  frame['age'] = result.values
+  invalid_rows = frame[~result.valid]
+
+  result = arrays.email(table.column('email'))
+  table = table.filter(result.valid)
+
+Each function returns an :class:`ArrayResult` holding a boolean mask of the
+valid elements and an array of the validated (coerced) values. Each element is
+judged exactly as the corresponding scalar validator judges the element's
+Python value (i.e. as found in ``values.tolist()``), so that
+``result.valid[i]`` is ``True`` if and only if the scalar validator accepts
+``values[i]``, and ``result.values[i]`` is then the value it returns.
+
+Arrays of booleans, integers and floats are validated with array operations by
+the numeric validators. Arrays of strings are validated by the string
+validators with `Apache Arrow <https://arrow.apache.org/>`_ compute functions,
+which measure lengths and match regular expressions over the array's buffers
+without creating a Python object per element. Strings that these checks
+cannot decide (e.g. email addresses with comments or quoted local parts) are
+validated one at a time with the scalar validator, as are arrays of other
+types (e.g. of Python objects).
+
+`NumPy <https://numpy.org/>`_ is imported when one of these functions is first
+called, and is required only by this module. The string validators also use
+`PyArrow <https://arrow.apache.org/docs/python/>`_ if it is installed, and
+otherwise validate every element with the scalar validator.
+`pandas <https://pandas.pydata.org/>`_ is never imported by this module: a
+:class:`pandas.Series` is recognized only if pandas has already been imported.
+
+"""
+
+import math
+import sys
+from collections import namedtuple
+from fractions import Fraction
+
+from validator_collection._compat import float_, integer_types
+from validator_collection._decorators import validator_is_disabled
+from validator_collection import validators
+
+_FLOAT_MAX = sys.float_info.max
+_INFINITY = float_('inf')
+
+# The kinds of NumPy dtype validated with array operations (booleans, signed
+# and unsigned integers, and floats).
+_NUMERIC_KINDS = 'biuf'
+
+# The kinds of NumPy dtype whose elements are neither numbers nor arbitrary
+# Python objects (complex numbers, dates and times, and structured values), and
+# so always fail numeric validation.
+_NON_NUMERIC_KINDS = 'cmMV'
+
+
+class ArrayResult(namedtuple('ArrayResult', ['valid', 'values'])):
+    """The result of validating an array.
+
+    Both members have the shape of the array validated, and are
+    :class:`pandas.Series` with its index if it was a :class:`pandas.Series`,
+    or Arrow arrays (chunked if it was chunked) if it was an Arrow array.
+
+    :ivar valid: ``True`` for each element that passed validation.
+    :vartype valid: :class:`numpy.ndarray` of :class:`bool <python:bool>` /
+      :class:`pandas.Series` / :class:`pyarrow.BooleanArray`
+
+    :ivar values: The validated (and possibly coerced) value of each element
+      that passed validation. Where ``valid`` is ``False``, holds a placeholder
+      (or null, in an Arrow array).
+    :vartype values: :class:`numpy.ndarray` / :class:`pandas.Series` /
+      :class:`pyarrow.Array`
+
+    """
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        """``True`` if every element passed validation."""
+        if hasattr(self.valid, 'all'):
+            return bool(self.valid.all())
+
+        return self.valid.null_count == 0 and \
+            sys.modules['pyarrow.compute'].all(self.valid).as_py() is not False
+
+
+def _import_numpy():
+    """Import and return :mod:`numpy`.
+
+    :raises ImportError: if NumPy is not installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('validator_collection.arrays requires NumPy, which can '
+                          'be installed with: pip install validator-collection[arrays]')
+
+    return numpy
+
+
+def _import_pyarrow():
+    """Import and return :mod:`pyarrow` and :mod:`pyarrow.compute`, or
+    :obj:`None <python:None>` for both if PyArrow is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError:
+        return None, None
+
+    return pyarrow, pyarrow.compute
+
+
+def _prepare(values, nan_is_empty):
+    """Return ``values`` as a NumPy array, with a mask of its empty elements (or
+    :obj:`None <python:None>`) and a function that wraps result arrays to match
+    ``values``.
+
+    Missing values (``<NA>``) in a :class:`pandas.Series` with an extension dtype
+    (e.g. ``Int64``) are empty, as are NaNs if ``nan_is_empty`` is ``True``.
+    """
+    numpy = _import_numpy()
+    pandas = sys.modules.get('pandas', None)
+
+    empty = None
+    wrap = None
+    if pandas is not None and isinstance(values, pandas.Series):
+        series = values
+
+        def wrap(array):
+            return pandas.Series(array, index = series.index, name = series.name)
+
+        dtype = series.dtype
+        if isinstance(dtype, pandas.api.extensions.ExtensionDtype):
+            empty = series.isna().to_numpy(dtype = bool)
+            if dtype.kind in _NUMERIC_KINDS and hasattr(dtype, 'numpy_dtype'):
+                array = series.to_numpy(dtype = dtype.numpy_dtype, na_value = 0)
+            else:
+                array = series.to_numpy(dtype = object)
+        else:
+            array = series.to_numpy()
+    else:
+        array = numpy.asarray(values)
+
+    if nan_is_empty:
+        if array.dtype.kind == 'f':
+            nans = numpy.isnan(array)
+        elif array.dtype.kind == 'O':
+            nans = numpy.frompyfunc(_is_nan, 1, 1)(array).astype(bool)
+        else:
+            nans = None
+        if nans is not None:
+            empty = nans if empty is None else empty | nans
+
+    if empty is not None and not empty.any():
+        empty = None
+
+    return numpy, array, empty, wrap
+
+
+def _is_nan(value):
+    """Indicate whether ``value`` is a floating point NaN."""
+    return isinstance(value, float_) and value != value
+
+
+def _normalize_bound(bound):
+    """Return ``bound`` normalized as the scalar validators normalize
+    ``minimum`` and ``maximum``."""
+    bound = validators.numeric(bound, allow_empty = True, force_run = True)     # pylint: disable=E1123
+    if bound is not None and not isinstance(bound, float_):
+        try:
+            Fraction(bound)
+        except (ValueError, OverflowError):
+            # A NaN or infinite Decimal compares as the equivalent float does.
+            bound = float_(bound)
+
+    return bound
+
+
+def _float_limit(exact, upper):
+    """Return the float that ``exact`` (a non-float bound) is replaced with when
+    comparing it to floats.
+
+    For an ``upper`` bound, this is the largest float that is less than or equal
+    to ``exact``, so that ``value > limit`` exactly when ``value > exact`` for
+    every float ``value``. For a lower bound, it is the smallest float that is
+    greater than or equal to ``exact``.
+    """
+    numpy = _import_numpy()
+
+    exact = Fraction(exact)
+    try:
+        limit = float_(exact)
+    except OverflowError:
+        limit = _INFINITY if exact > 0 else -_INFINITY
+
+    if math.isinf(limit):
+        if upper:
+            return _FLOAT_MAX if limit > 0 else limit
+        return limit if limit > 0 else -_FLOAT_MAX
+
+    if upper and Fraction(limit) > exact:
+        limit = float_(numpy.nextafter(limit, -_INFINITY))
+    elif not upper and Fraction(limit) < exact:
+        limit = float_(numpy.nextafter(limit, _INFINITY))
+
+    return limit
+
+
+def _out_of_bounds(numpy, array, bound, upper):
+    """Return a mask of the elements of ``array`` (of booleans, integers or
+    floats) that are greater than ``bound`` (if ``upper``) or less than it,
+    compared exactly as Python compares the elements' values."""
+    def compare(limit):
+        return array > limit if upper else array < limit
+
+    if isinstance(bound, float_) and (math.isnan(bound) or math.isinf(bound)):
+        return compare(bound)
+
+    if array.dtype.kind == 'f':
+        if isinstance(bound, float_):
+            return compare(bound)
+        return compare(_float_limit(bound, upper))
+
+    # An integer exceeds a bound exactly when it exceeds the bound's floor (or
+    # falls below its ceiling), which is compared without rounding. Integers
+    # beyond the range of the array's dtype are compared without NumPy.
+    exact = Fraction(bound)
+    limit = int(math.floor(exact)) if upper else int(math.ceil(exact))
+    info = numpy.iinfo(array.dtype)
+    if limit > info.max or limit < info.min:
+        return numpy.full(array.shape, (limit < info.min) if upper else (limit > info.max))
+
+    return compare(limit)
+
+
+def _in_bounds(numpy, array, minimum, maximum):
+    """Return a mask of the elements of ``array`` (of booleans, integers or
+    floats) that are within ``minimum`` and ``maximum``."""
+    if array.dtype.kind == 'b':
+        array = array.astype(numpy.int8)
+    elif array.dtype.kind == 'f' and array.dtype.itemsize != 8:
+        array = array.astype(numpy.float64)
+
+    valid = numpy.ones(array.shape, dtype = bool)
+    if maximum is not None:
+        valid &= ~_out_of_bounds(numpy, array, maximum, upper = True)
+    if minimum is not None:
+        valid &= ~_out_of_bounds(numpy, array, minimum, upper = False)
+
+    # NaN cannot be ordered against a Decimal, which the scalar validators
+    # report by raising InvalidOperation.
+    if array.dtype.kind == 'f' and (isinstance(minimum, validators.decimal_.Decimal) or
+                                    isinstance(maximum, validators.decimal_.Decimal)):
+        valid &= ~numpy.isnan(array)
+
+    return valid
+
+
+def _apply_each(numpy, core, array, empty, nan_is_empty, **kwargs):
+    """Validate each element of ``array`` with the scalar validator ``core``,
+    returning a mask of the valid elements and an object array of the results."""
+    elements = array.ravel().tolist()
+    if empty is not None:
+        for index in numpy.flatnonzero(empty):
+            elements[index] = None
+
+    valid = numpy.zeros(len(elements), dtype = bool)
+    results = numpy.empty(len(elements), dtype = object)
+    for index, element in enumerate(elements):
+        if nan_is_empty and _is_nan(element):
+            element = None
+        try:
+            result = core(element, **kwargs)
+        except (ValueError, TypeError, AttributeError, ArithmeticError):
+            continue
+        if isinstance(result, validators._Invalid):                             # pylint: disable=W0212
+            continue
+
+        valid[index] = True
+        results[index] = result
+
+    return valid.reshape(array.shape), results.reshape(array.shape)
+
+
+def _set_empty(numpy, valid, results, empty, allow_empty):
+    """Mark the ``empty`` elements as valid (if ``allow_empty``) with a result of
+    :obj:`None <python:None>` (or NaN in an array of floats)."""
+    if empty is None:
+        return valid, results
+
+    valid[empty] = allow_empty
+    if results.dtype.kind == 'f':
+        results = results.copy()
+        results[empty] = numpy.nan
+    else:
+        results = results.astype(object)
+        results[empty] = None
+
+    return valid, results
+
+
+def _validate(name, core, vectorized, values, allow_empty, nan_is_empty, force_run,
+              **kwargs):
+    """Validate ``values`` with the vectorized implementation ``vectorized`` of
+    the validator ``name``, falling back to its scalar ``core`` for arrays that
+    are not of booleans, integers or floats."""
+    numpy, array, empty, wrap = _prepare(values, nan_is_empty)
+
+    if not force_run and validator_is_disabled(name):
+        valid = numpy.ones(array.shape, dtype = bool)
+        results = array
+    elif array.dtype.kind in _NUMERIC_KINDS and vectorized is not None:
+        valid, results = vectorized(numpy, array, **kwargs)
+        valid, results = _set_empty(numpy, valid, results, empty, allow_empty)
+    elif array.dtype.kind in _NON_NUMERIC_KINDS:
+        valid = numpy.zeros(array.shape, dtype = bool)
+        results = numpy.empty(array.shape, dtype = object)
+        valid, results = _set_empty(numpy, valid, results, empty, allow_empty)
+    else:
+        valid, results = _apply_each(numpy, core, array, empty, nan_is_empty,
+                                     allow_empty = allow_empty, **kwargs)
+
+    if wrap is not None:
+        valid, results = wrap(valid), wrap(results)
+
+    return ArrayResult(valid, results)
+
+
+def _vectorized_numeric(numpy, array, minimum = None, maximum = None):
+    return _in_bounds(numpy, array, minimum, maximum), array
+
+
+def _vectorized_float(numpy, array, minimum = None, maximum = None):
+    return _in_bounds(numpy, array, minimum, maximum), array.astype(numpy.float64)
+
+
+def _vectorized_decimal(numpy, array, minimum = None, maximum = None):
+    valid = _in_bounds(numpy, array, minimum, maximum)
+    decimals = numpy.empty(int(valid.sum()), dtype = object)
+    decimals[:] = [validators.decimal_.Decimal(element)
+                   for element in array[valid].tolist()]
+    results = numpy.empty(array.shape, dtype = object)
+    results[valid] = decimals
+
+    return valid, results
+
+
+def _vectorized_integer(numpy, array, minimum = None, maximum = None,
+                        coerce_value = False):
+    valid = _in_bounds(numpy, array, minimum, maximum)
+    if array.dtype.kind in 'iu':
+        return valid, array
+    if array.dtype.kind == 'b':
+        # validators.integer() returns a bool unchanged, unless it rounds it up
+        # (coerce_value) or, on Python 3.12+, converts it as an integral number.
+        if coerce_value or hasattr(True, 'is_integer'):
+            return valid, array.astype(numpy.int64)
+        return valid, array
+
+    array = array.astype(numpy.float64)
+    finite = numpy.isfinite(array)
+    if coerce_value:
+        # NaN and infinity cannot be rounded up to an integer.
+        valid &= finite
+        results = numpy.ceil(array)
+    else:
+        valid &= finite & (numpy.floor(array) == array)
+        results = array
+
+    results = numpy.where(valid, results, 0)
+    if results.size and (results.max() >= 2.0 ** 63 or results.min() < -2.0 ** 63):
+        integers = numpy.empty(results.shape, dtype = object)
+        integers.ravel()[:] = [int(element) for element in results.ravel().tolist()]
+        return valid, integers
+
+    return valid, results.astype(numpy.int64)
+
+
+def numeric(values,
+            allow_empty = False,
+            minimum = None,
+            maximum = None,
+            nan_is_empty = False,
+            force_run = False):
+    """Validate that each element of ``values`` is numeric, as
+    :func:`validators.numeric() <validator_collection.validators.numeric>`
+    does.
+
+    :param values: The values to validate.
+    :type values: :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements (:obj:`None <python:None>`,
+      missing values in a :class:`pandas.Series` with an extension dtype, and
+      NaNs if ``nan_is_empty`` is ``True``) are valid. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param minimum: If supplied, elements less than this value are invalid.
+    :type minimum: numeric
+
+    :param maximum: If supplied, elements greater than this value are invalid.
+    :type maximum: numeric
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than as
+      numbers (which, like the scalar validator, :func:`numeric` accepts).
+      Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and ``values`` as an array.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``minimum`` or ``maximum`` is not numeric
+    """
+    return _validate('numeric', validators._numeric_core, _vectorized_numeric,    # pylint: disable=W0212
+                     values, allow_empty, nan_is_empty, force_run,
+                     minimum = _normalize_bound(minimum),
+                     maximum = _normalize_bound(maximum))
+
+
+def integer(values,
+            allow_empty = False,
+            coerce_value = False,
+            minimum = None,
+            maximum = None,
+            base = 10,
+            nan_is_empty = False,
+            force_run = False):
+    """Validate that each element of ``values`` is an integer, as
+    :func:`validators.integer() <validator_collection.validators.integer>`
+    does.
+
+    Floats that are whole numbers are valid, and converted to integers. NaN and
+    infinity are invalid, even if ``coerce_value`` is ``True``.
+
+    :param values: The values to validate.
+    :type values: :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements are valid. See
+      :func:`numeric`. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param coerce_value: If ``True``, rounds floats that are not whole numbers
+      up to the next integer. If ``False``, they are invalid. Defaults to
+      ``False``.
+    :type coerce_value: :class:`bool <python:bool>`
+
+    :param minimum: If supplied, elements less than this value are invalid.
+    :type minimum: numeric
+
+    :param maximum: If supplied, elements greater than this value are invalid.
+    :type maximum: numeric
+
+    :param base: The base used to interpret coerced integers, as for
+      :func:`validators.integer() <validator_collection.validators.integer>`.
+      Arrays are only vectorized for base ``10``. Defaults to ``10``.
+    :type base: :class:`int <python:int>`
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than
+      invalid. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their values as integers (with
+      dtype ``int64``, or ``object`` if an integer does not fit in ``int64`` or
+      an empty element is valid). A boolean array keeps its ``bool`` dtype,
+      as :func:`validators.integer()
+      <validator_collection.validators.integer>` returns a
+      :class:`bool <python:bool>` unchanged, unless ``coerce_value`` is
+      ``True`` or the version of Python treats booleans as integral numbers
+      (3.12 and later).
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``minimum`` or ``maximum`` is not numeric
+    """
+    vectorized = _vectorized_integer if base == 10 else None
+    return _validate('integer', validators._integer_core, vectorized,             # pylint: disable=W0212
+                     values, allow_empty, nan_is_empty, force_run,
+                     minimum = _normalize_bound(minimum),
+                     maximum = _normalize_bound(maximum),
+                     coerce_value = coerce_value,
+                     **({} if base == 10 else {'base': base}))
+
+
+def float(values,                                                               # pylint: disable=W0622
+          allow_empty = False,
+          minimum = None,
+          maximum = None,
+          nan_is_empty = False,
+          force_run = False):
+    """Validate that each element of ``values`` is numeric and convert it to a
+    float, as :func:`validators.float() <validator_collection.validators.float>`
+    does.
+
+    :param values: The values to validate.
+    :type values: :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements are valid (with a value of
+      NaN). See :func:`numeric`. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param minimum: If supplied, elements less than this value are invalid.
+    :type minimum: numeric
+
+    :param maximum: If supplied, elements greater than this value are invalid.
+    :type maximum: numeric
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than as
+      numbers. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their values as ``float64``.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``minimum`` or ``maximum`` is not numeric
+    """
+    return _validate('float', validators._float_core, _vectorized_float,          # pylint: disable=W0212
+                     values, allow_empty, nan_is_empty, force_run,
+                     minimum = _normalize_bound(minimum),
+                     maximum = _normalize_bound(maximum))
+
+
+def decimal(values,
+            allow_empty = False,
+            minimum = None,
+            maximum = None,
+            nan_is_empty = False,
+            force_run = False):
+    """Validate that each element of ``values`` is numeric and convert it to a
+    :class:`Decimal <python:decimal.Decimal>`, as
+    :func:`validators.decimal() <validator_collection.validators.decimal>` does.
+
+    The bounds are checked with array operations, but as a
+    :class:`Decimal <python:decimal.Decimal>` is a Python object, one is created
+    for each element.
+
+    :param values: The values to validate.
+    :type values: :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements are valid. See
+      :func:`numeric`. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param minimum: If supplied, elements less than this value are invalid.
+    :type minimum: numeric
+
+    :param maximum: If supplied, elements greater than this value are invalid.
+    :type maximum: numeric
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than as
+      numbers. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their values as an ``object``
+      array of :class:`Decimal <python:decimal.Decimal>`.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    :raises CannotCoerceError: if ``minimum`` or ``maximum`` is not numeric
+    """
+    return _validate('decimal', validators._decimal_core, _vectorized_decimal,    # pylint: disable=W0212
+                     values, allow_empty, nan_is_empty, force_run,
+                     minimum = _normalize_bound(minimum),
+                     maximum = _normalize_bound(maximum))
+
+
+## STRINGS
+
+# Regular expressions (in the RE2 syntax of Arrow's compute functions) matching
+# strings that the scalar validators are certain to accept.
+#
+# An email address whose local part is lowercase dot-atoms and whose domain is
+# lowercase labels of at most 63 characters (without consecutive hyphens, which
+# are checked separately) ending in an alphabetic top-level domain.
+_EMAIL_ATOM_PATTERN = r"[a-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_EMAIL_PATTERN = (r'^' + _EMAIL_ATOM_PATTERN + r'(?:\.' + _EMAIL_ATOM_PATTERN + r')*@'
+                  r'(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}$')
+_EMAIL_DOMAIN_DOUBLE_HYPHEN_PATTERN = r'@.*--'
+
+# Six pairs of hexadecimal digits separated by colons or hyphens.
+_MAC_ADDRESS_PATTERN = r'^[0-9a-fA-F]{2}(?:[:-][0-9a-fA-F]{2}){5}$'
+
+# Printable ASCII without spaces, which is unchanged by the lowercasing and
+# stripping done by the scalar validators before matching their own regular
+# expression.
+_PRINTABLE_ASCII_PATTERN = r'^[\x21-\x7e]*$'
+
+# 32 hexadecimal digits, alone or hyphenated (8-4-4-4-12) and optionally in
+# braces or after "urn:uuid:".
+_UUID_HYPHENATED_PATTERN = (r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+                            r'[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+_UUID_PATTERN = (r'^(?:[0-9a-fA-F]{32}|' + _UUID_HYPHENATED_PATTERN +
+                 r'|\{' + _UUID_HYPHENATED_PATTERN + r'\}|urn:uuid:' +
+                 _UUID_HYPHENATED_PATTERN + r')$')
+
+# A UUID in the canonical form returned by str(), e.g.
+# "12345678-1234-5678-1234-567812345678".
+_UUID_CANONICAL_PATTERN = ('^' + _UUID_HYPHENATED_PATTERN.replace('A-F', '') + '$')
+
+# The length of the shortest string that the scalar uuid() validator will
+# parse. uuid.UUID() only removes characters (prefixes, braces and hyphens)
+# before requiring 32 hexadecimal digits.
+_UUID_MIN_LENGTH = 32
+
+
+def _is_string_type(pyarrow, data_type):
+    """Indicate whether ``data_type`` is an Arrow string type."""
+    return pyarrow.types.is_string(data_type) or pyarrow.types.is_large_string(data_type)
+
+
+def _prepare_strings(numpy, pyarrow, values, nan_is_empty):
+    """Return ``values`` as an Arrow array of strings if possible, or otherwise
+    as a one-dimensional NumPy array, along with a ``(kind, shape, series)``
+    tuple describing the form of ``values`` for :func:`_string_result`.
+
+    Nulls in an Arrow array and missing values in a :class:`pandas.Series` with
+    an extension dtype (e.g. ``string``) are empty, as are NaNs if
+    ``nan_is_empty`` is ``True``.
+    """
+    pandas = sys.modules.get('pandas', None)
+
+    if pyarrow is not None and isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray)):
+        if _is_string_type(pyarrow, values.type):
+            return values, ('arrow', None, None)
+        return numpy.array(values.to_pylist(), dtype = object), ('arrow', None, None)
+
+    if pandas is not None and isinstance(values, pandas.Series):
+        form = ('series', None, values)
+        if pyarrow is not None and \
+           isinstance(values.dtype, pandas.api.extensions.ExtensionDtype):
+            try:
+                data = pyarrow.array(values)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                data = None
+            if data is not None and _is_string_type(pyarrow, data.type):
+                return data, form
+        array = values.to_numpy(dtype = object)
+    else:
+        array = numpy.asarray(values)
+        form = ('numpy', array.shape, None)
+        array = array.ravel()
+
+    if pyarrow is not None and array.dtype.kind in 'UO':
+        try:
+            data = pyarrow.array(array, from_pandas = nan_is_empty)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            data = None
+        if data is not None and _is_string_type(pyarrow, data.type):
+            return data, form
+
+    return array, form
+
+
+def _arrow_string(pyarrow, compute, chunk,
+                  minimum_length = None,
+                  maximum_length = None,
+                  whitespace_padding = False,
+                  **kwargs):
+    valid = compute.is_valid(chunk)
+    results = chunk
+    lengths = compute.utf8_length(chunk)
+    if maximum_length:
+        valid = compute.and_(valid, compute.less_equal(lengths, maximum_length))
+    if minimum_length:
+        if not whitespace_padding:
+            valid = compute.and_(valid, compute.greater_equal(lengths, minimum_length))
+        elif minimum_length > 0:
+            results = compute.utf8_rpad(chunk, width = minimum_length, padding = ' ')
+
+    return valid, None, results
+
+
+def _too_long(compute, name, chunk):
+    """Return a mask of the strings in ``chunk`` that are longer than the limit
+    set in :data:`MAX_LENGTHS <validator_collection.validators.MAX_LENGTHS>`
+    for the validator ``name``, or :obj:`None <python:None>` if there is none."""
+    max_length = validators.MAX_LENGTHS.get(name)
+    if max_length is None:
+        return None
+
+    return compute.greater(compute.utf8_length(chunk), max_length)
+
+
+def _arrow_email(pyarrow, compute, chunk, **kwargs):
+    valid = compute.and_not(compute.match_substring_regex(chunk, _EMAIL_PATTERN),
+                            compute.match_substring_regex(chunk, _EMAIL_DOMAIN_DOUBLE_HYPHEN_PATTERN))
+    # An address without an @ sign is invalid.
+    possible = compute.match_substring(chunk, '@')
+
+    too_long = _too_long(compute, 'email', chunk)
+    if too_long is not None:
+        valid = compute.and_not(valid, too_long)
+        possible = compute.and_not(possible, too_long)
+
+    # The domain is also subject to the limit for domain().
+    too_long = _too_long(compute, 'domain', chunk)
+    if too_long is not None:
+        valid = compute.and_not(valid, too_long)
+
+    return valid, compute.and_not(possible, valid), chunk
+
+
+def _arrow_mac_address(pyarrow, compute, chunk, **kwargs):
+    valid = compute.match_substring_regex(chunk, _MAC_ADDRESS_PATTERN)
+    decided = compute.match_substring_regex(chunk, _PRINTABLE_ASCII_PATTERN)
+
+    too_long = _too_long(compute, 'mac_address', chunk)
+    if too_long is not None:
+        valid = compute.and_not(valid, too_long)
+        decided = compute.or_(decided, too_long)
+
+    results = compute.ascii_lower(compute.replace_substring(chunk, '-', ':'))
+
+    return valid, compute.invert(decided), results
+
+
+def _arrow_uuid(pyarrow, compute, chunk, **kwargs):
+    valid = compute.match_substring_regex(chunk, _UUID_PATTERN)
+    possible = compute.greater_equal(compute.utf8_length(chunk), _UUID_MIN_LENGTH)
+
+    # Only UUIDs that are not already in their canonical form are reformatted.
+    reformat = compute.and_not(valid, compute.match_substring_regex(chunk,
+                                                                   _UUID_CANONICAL_PATTERN))
+    results = chunk
+    if reformat.true_count:
+        digits = compute.ascii_lower(compute.replace_substring_regex(chunk.filter(reformat),
+                                                                     r'^urn:uuid:|[-{}]', ''))
+        groups = [compute.utf8_slice_codeunits(digits, start, stop)
+                  for start, stop in ((0, 8), (8, 12), (12, 16), (16, 20), (20, 32))]
+        separator = pyarrow.scalar('-', type = chunk.type)
+        results = compute.replace_with_mask(chunk, reformat,
+                                            compute.binary_join_element_wise(*(groups + [separator])))
+
+    return valid, compute.and_not(possible, valid), results
+
+
+def _validate_arrow_chunk(pyarrow, compute, vectorized, core, convert, chunk,
+                          allow_empty, **kwargs):
+    """Validate the Arrow array of strings ``chunk`` with ``vectorized``, which
+    returns a mask of the strings it accepts, a mask of the strings it cannot
+    decide (which are validated with the scalar ``core``) and the results."""
+    valid, undecided, results = vectorized(pyarrow, compute, chunk, **kwargs)
+
+    empty = compute.fill_null(compute.equal(compute.binary_length(chunk), 0), True)
+    valid = compute.and_not(compute.fill_null(valid, False), empty)
+
+    if undecided is not None:
+        undecided = compute.and_not(compute.fill_null(undecided, False), empty)
+        if undecided.true_count:
+            verdicts = []
+            replacements = []
+            strings = chunk.filter(undecided).to_pylist()
+            for value in strings:
+                result = core(value, allow_empty = allow_empty, **kwargs)
+                is_valid = not isinstance(result, validators._Invalid)          # pylint: disable=W0212
+                verdicts.append(is_valid)
+                replacements.append(convert(result) if is_valid else None)
+
+            valid = compute.replace_with_mask(valid, undecided,
+                                              pyarrow.array(verdicts, type = pyarrow.bool_()))
+            results = compute.replace_with_mask(results, undecided,
+                                                pyarrow.array(replacements,
+                                                              type = results.type))
+
+    results = compute.if_else(valid, results, pyarrow.scalar(None, type = results.type))
+    if allow_empty:
+        valid = compute.or_(valid, empty)
+
+    return valid, results
+
+
+def _string_result(numpy, pyarrow, form, valid, results):
+    """Return ``valid`` and ``results`` (NumPy or Arrow arrays) in the form of
+    the values validated, as an :class:`ArrayResult`."""
+    kind, shape, series = form
+    if kind == 'arrow':
+        if isinstance(valid, numpy.ndarray):
+            valid = pyarrow.array(valid)
+            results = pyarrow.array(results, from_pandas = False)
+        return ArrayResult(valid, results)
+
+    if not isinstance(valid, numpy.ndarray):
+        valid = numpy.asarray(valid, dtype = bool)
+        results = results.to_numpy(zero_copy_only = False)
+        if results.dtype != object:
+            results = results.astype(object)
+
+    if kind == 'numpy':
+        return ArrayResult(valid.reshape(shape), results.reshape(shape))
+
+    pandas = sys.modules['pandas']
+    dtype = series.dtype
+    if not (isinstance(dtype, pandas.api.extensions.ExtensionDtype) and
+            pandas.api.types.is_string_dtype(dtype)):
+        dtype = None
+
+    return ArrayResult(pandas.Series(valid, index = series.index, name = series.name),
+                       pandas.Series(results, index = series.index, name = series.name,
+                                     dtype = dtype))
+
+
+def _validate_strings(name, core, vectorized, values, allow_empty, nan_is_empty,
+                      force_run, convert = None, **kwargs):
+    """Validate ``values`` with the vectorized implementation ``vectorized`` of
+    the validator ``name`` (see :func:`_validate_arrow_chunk`) if they can be
+    read as an Arrow array of strings, or otherwise with its scalar ``core``.
+
+    :param convert: If supplied, is applied to each result of ``core``.
+    """
+    numpy = _import_numpy()
+    pyarrow, compute = _import_pyarrow()
+    data, form = _prepare_strings(numpy, pyarrow, values, nan_is_empty)
+    convert = convert or (lambda result: result)
+
+    if not force_run and validator_is_disabled(name):
+        valid = numpy.ones(len(data), dtype = bool)
+        placeholders = numpy.empty(len(data), dtype = object)
+        valid = _string_result(numpy, pyarrow, form, valid, placeholders).valid
+        if pyarrow is not None and isinstance(values, pyarrow.ChunkedArray):
+            valid = pyarrow.chunked_array([valid])
+
+        return ArrayResult(valid, values)
+
+    if isinstance(data, numpy.ndarray):
+        valid, results = _apply_each(numpy, core, data, None, nan_is_empty,
+                                     allow_empty = allow_empty, **kwargs)
+        for index in numpy.flatnonzero(valid):
+            if results[index] is not None:
+                results[index] = convert(results[index])
+    elif isinstance(data, pyarrow.ChunkedArray):
+        chunks = [_validate_arrow_chunk(pyarrow, compute, vectorized, core, convert,
+                                        chunk, allow_empty, **kwargs)
+                  for chunk in data.chunks]
+        valid = pyarrow.chunked_array([chunk[0] for chunk in chunks],
+                                      type = pyarrow.bool_())
+        results = pyarrow.chunked_array([chunk[1] for chunk in chunks],
+                                        type = chunks[0][1].type if chunks else data.type)
+    else:
+        valid, results = _validate_arrow_chunk(pyarrow, compute, vectorized, core,
+                                               convert, data, allow_empty, **kwargs)
+
+    return _string_result(numpy, pyarrow, form, valid, results)
+
+
+def string(values,
+           allow_empty = False,
+           coerce_value = False,
+           minimum_length = None,
+           maximum_length = None,
+           whitespace_padding = False,
+           nan_is_empty = False,
+           force_run = False):
+    """Validate that each element of ``values`` is a valid string, as
+    :func:`validators.string() <validator_collection.validators.string>` does.
+
+    Lengths are measured with array operations on the strings' buffers.
+
+    :param values: The values to validate.
+    :type values: :class:`pyarrow.Array` / :class:`pyarrow.ChunkedArray` /
+      :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements (empty strings,
+      :obj:`None <python:None>`, nulls, missing values in a
+      :class:`pandas.Series` with an extension dtype, and NaNs if
+      ``nan_is_empty`` is ``True``) are valid. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param coerce_value: If ``True``, converts elements that are not strings to
+      strings. Defaults to ``False``.
+    :type coerce_value: :class:`bool <python:bool>`
+
+    :param minimum_length: If supplied, strings with fewer characters are
+      invalid (or padded, if ``whitespace_padding`` is ``True``).
+    :type minimum_length: :class:`int <python:int>`
+
+    :param maximum_length: If supplied, strings with more characters are
+      invalid.
+    :type maximum_length: :class:`int <python:int>`
+
+    :param whitespace_padding: If ``True``, pads strings shorter than
+      ``minimum_length`` with spaces. Defaults to ``False``.
+    :type whitespace_padding: :class:`bool <python:bool>`
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than
+      invalid. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their values.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    :raises ValueError: (or a sub-class) if ``minimum_length`` or
+      ``maximum_length`` is not an integer
+    """
+    lengths = [length if length is None or isinstance(length, integer_types)
+               else validators.integer(length, allow_empty = True, force_run = True)  # pylint: disable=E1123
+               for length in (minimum_length, maximum_length)]
+
+    return _validate_strings('string', validators._string_core, _arrow_string,    # pylint: disable=W0212
+                             values, allow_empty, nan_is_empty, force_run,
+                             coerce_value = coerce_value,
+                             minimum_length = lengths[0],
+                             maximum_length = lengths[1],
+                             whitespace_padding = whitespace_padding)
+
+
+def email(values,
+          allow_empty = False,
+          nan_is_empty = False,
+          force_run = False):
+    """Validate that each element of ``values`` is a valid email address, as
+    :func:`validators.email() <validator_collection.validators.email>` does.
+
+    Addresses made of lowercase ASCII dot-atoms and domain labels (which most
+    are) are accepted, and strings without an ``@`` sign rejected, by regular
+    expressions applied to the strings' buffers. The scalar validator checks the
+    rest.
+
+    :param values: The values to validate.
+    :type values: :class:`pyarrow.Array` / :class:`pyarrow.ChunkedArray` /
+      :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements are valid. See
+      :func:`string`. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than
+      invalid. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their values.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    """
+    return _validate_strings('email', validators._email_core, _arrow_email,       # pylint: disable=W0212
+                             values, allow_empty, nan_is_empty, force_run)
+
+
+def uuid(values,
+         allow_empty = False,
+         nan_is_empty = False,
+         force_run = False):
+    """Validate that each element of ``values`` is a valid UUID, as
+    :func:`validators.uuid() <validator_collection.validators.uuid>` does.
+
+    Rather than a :class:`UUID <python:uuid.UUID>` object, the value of each
+    valid element is the UUID's canonical string form (e.g.
+    ``'12345678-1234-5678-1234-567812345678'``), as returned by
+    :class:`str <python:str>`. UUIDs of 32 hexadecimal digits (alone or
+    hyphenated, in braces or after ``urn:uuid:``) are accepted, and strings of
+    fewer than 32 characters rejected, with array operations. The scalar
+    validator checks the rest (e.g. ``'uuid:'``-prefixed or unhyphenated UUIDs
+    in braces).
+
+    :param values: The values to validate.
+    :type values: :class:`pyarrow.Array` / :class:`pyarrow.ChunkedArray` /
+      :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements are valid. See
+      :func:`string`. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than
+      invalid. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their values.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    """
+    return _validate_strings('uuid', validators._uuid_core, _arrow_uuid,          # pylint: disable=W0212
+                             values, allow_empty, nan_is_empty, force_run,
+                             convert = str)
+
+
+def mac_address(values,
+                allow_empty = False,
+                nan_is_empty = False,
+                force_run = False):
+    """Validate that each element of ``values`` is a valid MAC address, as
+    :func:`validators.mac_address() <validator_collection.validators.mac_address>`
+    does.
+
+    Strings of printable ASCII characters are matched by a regular expression
+    applied to the strings' buffers. The scalar validator checks the rest.
+
+    :param values: The values to validate.
+    :type values: :class:`pyarrow.Array` / :class:`pyarrow.ChunkedArray` /
+      :class:`numpy.ndarray` / :class:`pandas.Series` / array-like
+
+    :param allow_empty: If ``True``, empty elements are valid. See
+      :func:`string`. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param nan_is_empty: If ``True``, treats NaN elements as empty rather than
+      invalid. Defaults to ``False``.
+    :type nan_is_empty: :class:`bool <python:bool>`
+
+    :param force_run: If ``True``, validates ``values`` even if the validator has
+      been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+    :type force_run: :class:`bool <python:bool>`
+
+    :returns: A mask of the valid elements, and their (lowercase, colon-separated)
+      values.
+    :rtype: :class:`ArrayResult`
+
+    :raises ImportError: if NumPy is not installed
+    """
+    return _validate_strings('mac_address', validators._mac_address_core,        # pylint: disable=W0212
+                             _arrow_mac_address, values, allow_empty, nan_is_empty,
+                             force_run)
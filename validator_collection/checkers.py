@@ -12,9 +12,29 @@ import sys
 
 import validator_collection.validators as validators
 from validator_collection._compat import integer_types, basestring
-from validator_collection._decorators import disable_checker_on_env
+from validator_collection._decorators import disable_checker_on_env, \
+    validator_is_disabled
 
 # pylint: disable=W0613
+
+
+def _passes(core, validator_name, value, **kwargs):
+    """Indicate whether ``value`` passes ``core``, the non-raising core of the
+    validator named ``validator_name``.
+
+    Unlike calling the validator itself, an invalid ``value`` does not raise (and
+    catch) an exception, so rejecting a value is as cheap as accepting it.
+
+    :returns: ``True`` if ``value`` is valid (or the validator is disabled),
+      ``False`` if it is not.
+    :rtype: :class:`bool <python:bool>`
+    """
+    if not kwargs.pop('force_run', False) and validator_is_disabled(validator_name):
+        return True
+
+    return not isinstance(core(value, **kwargs), validators._Invalid)             # pylint: disable=W0212
+
+
 ## CORE
 
 @disable_checker_on_env
@@ -369,14 +389,12 @@ def is_dict(value, **kwargs):
         return True
 
     try:
-        value = validators.dict(value, **kwargs)
+        return _passes(validators._dict_core, 'dict', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_json(value,
@@ -405,17 +423,15 @@ def is_json(value,
 
     """
     try:
-        value = validators.json(value,
-                                schema = schema,
-                                json_serializer = json_serializer,
-                                **kwargs)
+        return _passes(validators._json_core, 'json', value,
+                       schema = schema,
+                       json_serializer = json_serializer,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_string(value,
@@ -464,19 +480,17 @@ def is_string(value,
         return True
 
     try:
-        value = validators.string(value,
-                                  coerce_value = coerce_value,
-                                  minimum_length = minimum_length,
-                                  maximum_length = maximum_length,
-                                  whitespace_padding = whitespace_padding,
-                                  **kwargs)
+        return _passes(validators._string_core, 'string', value,
+                       coerce_value = coerce_value,
+                       minimum_length = minimum_length,
+                       maximum_length = maximum_length,
+                       whitespace_padding = whitespace_padding,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_iterable(obj,
@@ -513,19 +527,17 @@ def is_iterable(obj,
         return False
 
     try:
-        obj = validators.iterable(obj,
-                                  allow_empty = True,
-                                  forbid_literals = forbid_literals,
-                                  minimum_length = minimum_length,
-                                  maximum_length = maximum_length,
-                                  **kwargs)
+        return _passes(validators._iterable_core, 'iterable', obj,
+                       allow_empty = True,
+                       forbid_literals = forbid_literals,
+                       minimum_length = minimum_length,
+                       maximum_length = maximum_length,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_not_empty(value, **kwargs):
@@ -541,14 +553,12 @@ def is_not_empty(value, **kwargs):
 
     """
     try:
-        value = validators.not_empty(value, **kwargs)
+        return _passes(validators._not_empty_core, 'not_empty', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_none(value, allow_empty = False, **kwargs):
@@ -569,14 +579,14 @@ def is_none(value, allow_empty = False, **kwargs):
 
     """
     try:
-        validators.none(value, allow_empty = allow_empty, **kwargs)
+        return _passes(validators._none_core, 'none', value,
+                       allow_empty = allow_empty,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_variable_name(value, **kwargs):
@@ -598,14 +608,12 @@ def is_variable_name(value, **kwargs):
 
     """
     try:
-        validators.variable_name(value, **kwargs)
+        return _passes(validators._variable_name_core, 'variable_name', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_callable(value, **kwargs):
@@ -637,14 +645,12 @@ def is_uuid(value, **kwargs):
 
     """
     try:
-        validators.uuid(value, **kwargs)
+        return _passes(validators._uuid_core, 'uuid', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 ## DATE / TIME
 
@@ -684,18 +690,16 @@ def is_date(value,
 
     """
     try:
-        value = validators.date(value,
-                                minimum = minimum,
-                                maximum = maximum,
-                                coerce_value = coerce_value,
-                                **kwargs)
+        return _passes(validators._date_core, 'date', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       coerce_value = coerce_value,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_datetime(value,
@@ -733,18 +737,16 @@ def is_datetime(value,
 
     """
     try:
-        value = validators.datetime(value,
-                                    minimum = minimum,
-                                    maximum = maximum,
-                                    coerce_value = coerce_value,
-                                    **kwargs)
+        return _passes(validators._datetime_core, 'datetime', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       coerce_value = coerce_value,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_time(value,
@@ -783,18 +785,16 @@ def is_time(value,
 
     """
     try:
-        value = validators.time(value,
-                                minimum = minimum,
-                                maximum = maximum,
-                                coerce_value = coerce_value,
-                                **kwargs)
+        return _passes(validators._time_core, 'time', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       coerce_value = coerce_value,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_timezone(value,
@@ -824,16 +824,14 @@ def is_timezone(value,
 
     """
     try:
-        value = validators.timezone(value,
-                                    positive = positive,
-                                    **kwargs)
+        return _passes(validators._timezone_core, 'timezone', value,
+                       positive = positive,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_timedelta(value,
@@ -871,16 +869,14 @@ def is_timedelta(value,
 
     """
     try:
-        value = validators.timedelta(value,
-                                     resolution = resolution,
-                                     **kwargs)
+        return _passes(validators._timedelta_core, 'timedelta', value,
+                       resolution = resolution,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 ## NUMBERS
 
@@ -909,17 +905,15 @@ def is_numeric(value,
 
     """
     try:
-        value = validators.numeric(value,
-                                   minimum = minimum,
-                                   maximum = maximum,
-                                   **kwargs)
+        return _passes(validators._numeric_core, 'numeric', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_integer(value,
@@ -961,19 +955,17 @@ def is_integer(value,
 
     """
     try:
-        value = validators.integer(value,
-                                   coerce_value = coerce_value,
-                                   minimum = minimum,
-                                   maximum = maximum,
-                                   base = base,
-                                   **kwargs)
+        return _passes(validators._integer_core, 'integer', value,
+                       coerce_value = coerce_value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       base = base,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_float(value,
@@ -1000,17 +992,15 @@ def is_float(value,
 
     """
     try:
-        value = validators.float(value,
-                                 minimum = minimum,
-                                 maximum = maximum,
-                                 **kwargs)
+        return _passes(validators._float_core, 'float', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_fraction(value,
@@ -1037,17 +1027,15 @@ def is_fraction(value,
 
     """
     try:
-        value = validators.fraction(value,
-                                    minimum = minimum,
-                                    maximum = maximum,
-                                    **kwargs)
+        return _passes(validators._fraction_core, 'fraction', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_decimal(value,
@@ -1074,17 +1062,15 @@ def is_decimal(value,
 
     """
     try:
-        value = validators.decimal(value,
-                                   minimum = minimum,
-                                   maximum = maximum,
-                                   **kwargs)
+        return _passes(validators._decimal_core, 'decimal', value,
+                       minimum = minimum,
+                       maximum = maximum,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 ## FILE-RELATED
 
@@ -1144,14 +1130,12 @@ def is_pathlike(value, **kwargs):
 
     """
     try:
-        value = validators.path(value, **kwargs)
+        return _passes(validators._path_core, 'path', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_on_filesystem(value, **kwargs):
@@ -1168,14 +1152,12 @@ def is_on_filesystem(value, **kwargs):
 
     """
     try:
-        value = validators.path_exists(value, **kwargs)
+        return _passes(validators._path_exists_core, 'path_exists', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_file(value, **kwargs):
@@ -1191,14 +1173,12 @@ def is_file(value, **kwargs):
 
     """
     try:
-        value = validators.file_exists(value, **kwargs)
+        return _passes(validators._file_exists_core, 'file_exists', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_directory(value, **kwargs):
@@ -1214,14 +1194,12 @@ def is_directory(value, **kwargs):
 
     """
     try:
-        value = validators.directory_exists(value, **kwargs)
+        return _passes(validators._directory_exists_core, 'directory_exists', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_readable(value, **kwargs):
@@ -1261,14 +1239,12 @@ def is_readable(value, **kwargs):
 
     """
     try:
-        validators.readable(value, **kwargs)
+        return _passes(validators._readable_core, 'readable', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_writeable(value,
@@ -1335,16 +1311,14 @@ def is_writeable(value,
         raise NotImplementedError('not supported on Windows')
 
     try:
-        validators.writeable(value,
-                             allow_empty = False,
-                             **kwargs)
+        return _passes(validators._writeable_core, 'writeable', value,
+                       allow_empty = False,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 @disable_checker_on_env
 def is_executable(value,
                   **kwargs):
@@ -1402,15 +1376,13 @@ def is_executable(value,
         raise NotImplementedError('not supported on Windows')
 
     try:
-        validators.executable(value,
-                              **kwargs)
+        return _passes(validators._executable_core, 'executable', value,
+                       **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 ## INTERNET-RELATED
 
@@ -1422,15 +1394,15 @@ def is_email(value, **kwargs):
 
       Email address validation is...complicated. The methodology that we have
       adopted here is *generally* compliant with
-      `RFC 5322 <https://tools.ietf.org/html/rfc5322>`_ and uses a combination of
-      string parsing and regular expressions.
+      `RFC 5322 <https://tools.ietf.org/html/rfc5322>`_ and reads the address
+      in a single left-to-right scan.
 
-      String parsing in particular is used to validate certain *highly unusual*
-      but still valid email patterns, including the use of escaped text and
-      comments within an email address' local address (the user name part).
+      The scan also validates certain *highly unusual* but still valid email
+      patterns, including the use of escaped text and comments within an email
+      address' local address (the user name part).
 
-      This approach ensures more complete coverage for unusual edge cases, while
-      still letting us use regular expressions that perform quickly.
+      Its running time grows linearly with the length of the value, so even very
+      long or malicious values are validated quickly.
 
     :param value: The value to evaluate.
 
@@ -1442,14 +1414,12 @@ def is_email(value, **kwargs):
 
     """
     try:
-        value = validators.email(value, **kwargs)
+        return _passes(validators._email_core, 'email', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_url(value, **kwargs):
@@ -1461,11 +1431,11 @@ def is_url(value, **kwargs):
       adopted here is *generally* compliant with
       `RFC 1738 <https://tools.ietf.org/html/rfc1738>`_,
       `RFC 6761 <https://tools.ietf.org/html/rfc6761>`_,
-      `RFC 2181 <https://tools.ietf.org/html/rfc2181>`_  and uses a combination of
-      string parsing and regular expressions,
+      `RFC 2181 <https://tools.ietf.org/html/rfc2181>`_.
 
-      This approach ensures more complete coverage for unusual edge cases, while
-      still letting us use regular expressions that perform quickly.
+      The URL is split into its scheme, user information, host, port and path in
+      a single pass and each component is checked on its own, so validation time
+      grows linearly with the length of ``value``.
 
     :param value: The value to evaluate.
 
@@ -1482,14 +1452,12 @@ def is_url(value, **kwargs):
 
     """
     try:
-        value = validators.url(value, **kwargs)
+        return _passes(validators._url_core, 'url', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_domain(value, **kwargs):
@@ -1522,6 +1490,18 @@ def is_domain(value, **kwargs):
       If ``False``, will fail if ``value`` is an IP address. Defaults to ``False``.
     :type allow_ips: :class:`bool <python:bool>`
 
+    :param strict: If ``True``, will fail if ``value`` does not end in a top-level
+      domain on the bundled copy of the
+      `Public Suffix List <https://publicsuffix.org/>`_. Special-use domain names
+      (e.g. ``localhost``) and IP addresses allowed by ``allow_ips`` still
+      succeed. Defaults to ``False``.
+    :type strict: :class:`bool <python:bool>`
+
+    :param idna: If ``True``, will fail if an internationalized label of
+      ``value`` cannot be converted to or from its ASCII (``xn--``) form under
+      `IDNA <https://tools.ietf.org/html/rfc3490>`_. Defaults to ``False``.
+    :type idna: :class:`bool <python:bool>`
+
     :returns: ``True`` if ``value`` is valid, ``False`` if it is not.
     :rtype: :class:`bool <python:bool>`
 
@@ -1530,14 +1510,12 @@ def is_domain(value, **kwargs):
 
     """
     try:
-        value = validators.domain(value, **kwargs)
+        return _passes(validators._domain_core, 'domain', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_ip_address(value, **kwargs):
@@ -1553,14 +1531,12 @@ def is_ip_address(value, **kwargs):
 
     """
     try:
-        value = validators.ip_address(value, **kwargs)
+        return _passes(validators._ip_address_core, 'ip_address', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_ipv4(value, **kwargs):
@@ -1573,17 +1549,19 @@ def is_ipv4(value, **kwargs):
 
     :raises SyntaxError: if ``kwargs`` contains duplicate keyword parameters or duplicates
       keyword parameters passed to the underlying validator
+    :raises ValidatorUsageError: if ``output`` is not a supported value
 
     """
+    if 'output' in kwargs:
+        validators._ipv4_output(kwargs['output'])
+
     try:
-        value = validators.ipv4(value, **kwargs)
+        return _passes(validators._ipv4_core, 'ipv4', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_ipv6(value, **kwargs):
@@ -1598,14 +1576,12 @@ def is_ipv6(value, **kwargs):
       keyword parameters passed to the underlying validator
     """
     try:
-        value = validators.ipv6(value, **kwargs)
+        return _passes(validators._ipv6_core, 'ipv6', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_mac_address(value, **kwargs):
@@ -1620,14 +1596,12 @@ def is_mac_address(value, **kwargs):
       keyword parameters passed to the underlying validator
     """
     try:
-        value = validators.mac_address(value, **kwargs)
+        return _passes(validators._mac_address_core, 'mac_address', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
 
-    return True
-
 
 @disable_checker_on_env
 def is_mimetype(value, **kwargs):
@@ -1642,10 +1616,8 @@ def is_mimetype(value, **kwargs):
       keyword parameters passed to the underlying validator
     """
     try:
-        value = validators.mimetype(value, **kwargs)
+        return _passes(validators._mimetype_core, 'mimetype', value, **kwargs)
     except SyntaxError as error:
         raise error
     except Exception:
         return False
-
-    return True
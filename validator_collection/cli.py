@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+
+"""
+****************************************
+validator_collection.cli
+****************************************
+
+Implements the ``validator-collection`` command, which applies a validator or
+checker to every value in one or more files (or standard input) and reports
+the values that fail, followed by summary statistics.
+
+.. code-block:: bash
+
+  $ validator-collection email addresses.txt
+  $ validator-collection is_url --csv-column homepage users.csv
+  $ cat events.jsonl | validator-collection ip_address --jsonl-field source --jobs 8
+
+"""
+
+from __future__ import print_function
+
+import argparse
+import csv
+import io
+import random
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+from validator_collection._compat import json_
+from validator_collection import checkers, validators, errors
+
+#: The default number of values validated by each task when ``--jobs`` is used.
+DEFAULT_CHUNK_SIZE = 1000
+
+# The number of per-value latencies kept (by reservoir sampling) to estimate the
+# latency percentiles reported in the summary.
+_LATENCY_SAMPLES = 100000
+
+_clock = getattr(time, 'perf_counter', time.time)
+
+_STDIN = '-'
+
+
+def _parse_option(text):
+    """Parse a ``--option`` argument of the form ``name=value``, decoding
+    ``value`` as JSON where possible (so that ``minimum=0`` passes an integer and
+    ``allow_empty=true`` a boolean)."""
+    name, separator, value = text.partition('=')
+    if not separator or not name:
+        raise argparse.ArgumentTypeError('option (%s) is not of the form name=value' % text)
+
+    try:
+        value = json_.loads(value)
+    except ValueError:
+        pass
+
+    return name, value
+
+
+def _build_parser():
+    """Return the :class:`ArgumentParser <python:argparse.ArgumentParser>` for
+    the command."""
+    parser = argparse.ArgumentParser(
+        prog = 'validator-collection',
+        description = 'Apply a validator or checker from the Validator Collection '
+                      'to every value in the given files (or standard input). '
+                      'Exits with status 1 if any value is invalid.'
+    )
+    parser.add_argument('function',
+                        help = 'the name of a validator (e.g. email) or checker '
+                               '(e.g. is_email)')
+    parser.add_argument('files',
+                        nargs = '*',
+                        default = [_STDIN],
+                        help = 'the files to read values from, or - for standard '
+                               'input (the default)')
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--csv-column',
+                      metavar = 'NAME',
+                      help = 'read values from the column NAME of CSV files with '
+                             'a header row, rather than one value per line')
+    mode.add_argument('--jsonl-field',
+                      metavar = 'NAME',
+                      help = 'read values from the field NAME of files with one '
+                             'JSON object per line, rather than one value per line')
+
+    parser.add_argument('-o', '--option',
+                        action = 'append',
+                        default = [],
+                        type = _parse_option,
+                        metavar = 'NAME=VALUE',
+                        help = 'a keyword argument for the validator or checker, '
+                               'e.g. minimum=0 (VALUE is decoded as JSON where '
+                               'possible); may be repeated')
+    parser.add_argument('-j', '--jobs',
+                        type = int,
+                        default = 1,
+                        metavar = 'N',
+                        help = 'validate in N processes (default: 1)')
+    parser.add_argument('--chunk-size',
+                        type = int,
+                        default = DEFAULT_CHUNK_SIZE,
+                        metavar = 'N',
+                        help = 'the number of values sent to a process at a time '
+                               'with --jobs (default: %s)' % DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--print',
+                        dest = 'output',
+                        choices = ['invalid', 'valid', 'none'],
+                        default = 'invalid',
+                        help = 'print the invalid values with their errors (the '
+                               'default), the valid values, or nothing')
+    parser.add_argument('--no-summary',
+                        dest = 'summary',
+                        action = 'store_false',
+                        help = 'do not print summary statistics to standard error')
+    parser.add_argument('--encoding',
+                        default = 'utf-8',
+                        help = 'the encoding of the files (default: utf-8)')
+
+    return parser
+
+
+# The validators applied by the checkers whose names are not is_<validator>.
+_CHECKED_VALIDATORS = {
+    'is_pathlike': 'path',
+    'is_on_filesystem': 'path_exists',
+    'is_file': 'file_exists',
+    'is_directory': 'directory_exists',
+}
+
+
+def _checker_options(name):
+    """Return the names of the options accepted by the checker ``name``: its own
+    keyword arguments, and those of the validator it applies."""
+    options = validators._option_names(getattr(checkers, name))                  # pylint: disable=W0212
+    validator_name = _CHECKED_VALIDATORS.get(name, name[3:])
+    if validator_name in validators._VALIDATOR_NAMES:                           # pylint: disable=W0212
+        options |= validators._option_names(getattr(validators, validator_name))  # pylint: disable=W0212
+
+    return options | frozenset(['force_run'])
+
+
+def _resolve(parser, name, options):
+    """Return the function that validates a value for ``name`` with ``options``,
+    and whether it is a checker."""
+    if name.startswith(('is_', 'has_')) and callable(getattr(checkers, name, None)):
+        unknown = sorted(set(options) - _checker_options(name))
+        if unknown:
+            parser.error('invalid option for %s: checker (%s) does not accept the '
+                         'keyword argument %s' % (name, name, unknown[0]))
+
+        # Normalize the options once, as compile() does for a validator, so that
+        # an invalid value is reported here rather than as every value failing.
+        try:
+            validators._resolve_options(_CHECKED_VALIDATORS.get(name, name[3:]),   # pylint: disable=W0212
+                                        options)
+        except (errors.ValidatorUsageError, ValueError, TypeError) as error:
+            parser.error('invalid option for %s: %s' % (name, error))
+
+        return _Checker(name, options), True
+
+    if name not in validators._VALIDATOR_NAMES:                                 # pylint: disable=W0212
+        parser.error('function (%s) is not a validator or checker' % name)
+
+    try:
+        return validators.compile(name, **options), False
+    except (errors.ValidatorUsageError, ValueError, TypeError) as error:
+        parser.error('invalid option for %s: %s' % (name, error))
+
+
+class _Checker(object):
+    """A checker with its keyword arguments bound. Unlike the (decorated)
+    checker function, it can be pickled to send it to worker processes."""
+
+    def __init__(self, name, options):
+        self.name = name
+        self.options = options
+
+    def __call__(self, value):
+        return getattr(checkers, self.name)(value, **self.options)
+
+
+def _read_values(source, stream, arguments):
+    """Yield a ``(source, line, value, read_error)`` tuple for each value in
+    ``stream``, where ``read_error`` describes why the value could not be read
+    (or is :obj:`None <python:None>`)."""
+    if arguments.csv_column is not None:
+        reader = csv.DictReader(stream)
+        if reader.fieldnames is None or arguments.csv_column not in reader.fieldnames:
+            raise errors.ValidatorUsageError(
+                'column (%s) not found in %s' % (arguments.csv_column, source)
+            )
+        for row in reader:
+            yield source, reader.line_num, row[arguments.csv_column], None
+
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        line = line.rstrip('\r\n')
+        if arguments.jsonl_field is None:
+            yield source, line_number, line, None
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            record = json_.loads(line)
+        except ValueError:
+            yield source, line_number, line, 'line is not valid JSON'
+            continue
+
+        if not isinstance(record, dict):
+            yield source, line_number, line, 'line is not a JSON object'
+            continue
+
+        yield source, line_number, record.get(arguments.jsonl_field), None
+
+
+def _open(source, encoding):
+    """Return a text stream for ``source``, and whether it should be closed."""
+    if source == _STDIN:
+        if hasattr(sys.stdin, 'buffer'):
+            return io.TextIOWrapper(sys.stdin.buffer, encoding = encoding, newline = ''), False
+        return sys.stdin, False
+
+    return io.open(source, 'r', encoding = encoding, newline = ''), True
+
+
+def _iter_values(arguments):
+    """Yield the values to validate from every file in ``arguments``."""
+    for source in arguments.files:
+        stream, opened = _open(source, arguments.encoding)
+        label = '<stdin>' if source == _STDIN else source
+        try:
+            for item in _read_values(label, stream, arguments):
+                yield item
+        finally:
+            if opened:
+                stream.close()
+
+
+def _validate_chunk(function, is_checker, chunk):
+    """Validate every value in ``chunk``, timing each.
+
+    :returns: A ``(source, line, value, error_type, message, seconds)`` tuple for
+      each value, where ``error_type`` is :obj:`None <python:None>` if the value
+      is valid, and ``value`` is the validated value.
+    :rtype: :class:`list <python:list>`
+    """
+    results = []
+    append = results.append
+    for source, line, value, read_error in chunk:
+        if read_error is not None:
+            append((source, line, value, 'ReadError', read_error, 0.0))
+            continue
+
+        start = _clock()
+        try:
+            if is_checker:
+                if function(value):
+                    error_type = message = None
+                else:
+                    error_type, message = 'Invalid', 'value (%s) failed the check' % value
+            else:
+                value = function(value)
+                error_type = message = None
+        except (ValueError, TypeError, IOError) as error:
+            error_type, message = type(error).__name__, str(error)
+        append((source, line, value, error_type, message, _clock() - start))
+
+    return results
+
+
+def _validate_in_pool(function, values, executor, jobs, chunk_size):
+    """Yield the results of applying the compiled validator ``function`` to
+    ``values`` (see :func:`_validate_chunk`) in the processes of ``executor``.
+
+    ``values`` are read ``4 * jobs`` chunks at a time, and each batch is
+    validated by :meth:`CompiledValidator.many()
+    <validator_collection.validators.CompiledValidator.many>`. The latency of
+    each value is its share of the time the processes spent on its batch.
+    """
+    batch_size = 4 * jobs * chunk_size
+    batch = list(islice(values, batch_size))
+    while batch:
+        readable = [value for _, _, value, read_error in batch if read_error is None]
+        start = _clock()
+        result = function.many(readable,
+                               collect_errors = True,
+                               executor = executor,
+                               max_pending = 4 * jobs,
+                               processes = True,
+                               chunk_size = chunk_size)
+        seconds = (_clock() - start) * jobs / len(readable) if readable else 0.0
+
+        index = 0
+        for source, line, value, read_error in batch:
+            if read_error is not None:
+                yield source, line, value, 'ReadError', read_error, 0.0
+                continue
+
+            error = result.errors.get(index)
+            if error is None:
+                yield source, line, result.values[index], None, None, seconds
+            else:
+                yield source, line, value, type(error).__name__, str(error), seconds
+            index += 1
+
+        batch = list(islice(values, batch_size))
+
+
+def _check_in_pool(function, values, executor, jobs, chunk_size):
+    """Yield the results of applying the checker ``function`` to ``values``
+    (see :func:`_validate_chunk`) in the processes of ``executor``, in input
+    order, with at most ``4 * jobs`` chunks pending at a time."""
+    pending = deque()
+    try:
+        chunk = list(islice(values, chunk_size))
+        while chunk:
+            pending.append(executor.submit(_validate_chunk, function, True, chunk))
+            if len(pending) >= 4 * jobs:
+                for result in pending.popleft().result():
+                    yield result
+
+            chunk = list(islice(values, chunk_size))
+
+        while pending:
+            for result in pending.popleft().result():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _results(function, is_checker, values, jobs, chunk_size):
+    """Yield the results of validating ``values`` (see :func:`_validate_chunk`)
+    in input order, in ``jobs`` processes if more than one."""
+    values = iter(values)
+    if jobs == 1:
+        chunk = list(islice(values, chunk_size))
+        while chunk:
+            for result in _validate_chunk(function, is_checker, chunk):
+                yield result
+            chunk = list(islice(values, chunk_size))
+
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    in_pool = _check_in_pool if is_checker else _validate_in_pool
+    executor = ProcessPoolExecutor(max_workers = jobs)
+    try:
+        for result in in_pool(function, values, executor, jobs, chunk_size):
+            yield result
+    finally:
+        executor.shutdown()
+
+
+def _percentile(samples, percent):
+    """Return the ``percent``-th percentile of the sorted ``samples``."""
+    if not samples:
+        return 0.0
+
+    index = int(round(percent / 100.0 * (len(samples) - 1)))
+
+    return samples[index]
+
+
+def main(argv = None):
+    """Run the ``validator-collection`` command.
+
+    :param argv: The command-line arguments, excluding the program name. If
+      :obj:`None <python:None>`, uses :data:`sys.argv <python:sys.argv>`.
+    :type argv: :class:`list <python:list>` of :class:`str <python:str>`
+
+    :returns: The exit status: ``0`` if every value is valid, ``1`` if any value
+      is invalid, and ``2`` if the command is used incorrectly.
+    :rtype: :class:`int <python:int>`
+    """
+    parser = _build_parser()
+    # Options may follow the files (e.g. "email users.txt --jobs 4"), which
+    # parse_args() does not allow for a variable number of positional arguments.
+    parse = getattr(parser, 'parse_intermixed_args', parser.parse_args)
+    arguments = parse(argv)
+    if arguments.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if arguments.chunk_size < 1:
+        parser.error('--chunk-size must be at least 1')
+
+    function, is_checker = _resolve(parser, arguments.function, dict(arguments.option))
+
+    valid = invalid = 0
+    latencies = []
+    sampler = random.Random(0)
+    start = _clock()
+    try:
+        for source, line, value, error_type, message, seconds in _results(
+                function, is_checker, _iter_values(arguments),
+                arguments.jobs, arguments.chunk_size):
+            if error_type is None:
+                valid += 1
+                if arguments.output == 'valid':
+                    print(value)
+            else:
+                invalid += 1
+                if arguments.output == 'invalid':
+                    print('%s:%s: %s: %s' % (source, line, error_type, message))
+
+            count = valid + invalid
+            if len(latencies) < _LATENCY_SAMPLES:
+                latencies.append(seconds)
+            else:
+                index = sampler.randint(0, count - 1)
+                if index < _LATENCY_SAMPLES:
+                    latencies[index] = seconds
+    except (IOError, OSError, errors.ValidatorUsageError) as error:
+        print('validator-collection: error: %s' % error, file = sys.stderr)
+        return 2
+
+    elapsed = _clock() - start
+    if arguments.summary:
+        latencies.sort()
+        count = valid + invalid
+        print('valid: %s' % valid, file = sys.stderr)
+        print('invalid: %s' % invalid, file = sys.stderr)
+        print('rate: %.0f values/s' % (count / elapsed if elapsed else 0),
+              file = sys.stderr)
+        print('p50 latency: %.1fus' % (_percentile(latencies, 50) * 1e6),
+              file = sys.stderr)
+        print('p99 latency: %.1fus' % (_percentile(latencies, 99) * 1e6),
+              file = sys.stderr)
+
+    return 1 if invalid else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -72,6 +72,23 @@ class JSONValidationError(ValueError):
     """
     pass
 
+class RecordValidationError(ValueError):
+    """Exception raised when one or more fields of a record fail validation.
+
+    :ivar errors: The exception raised for each field that failed validation,
+      keyed by field name.
+    :vartype errors: :class:`dict <python:dict>`
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>`
+
+    """
+    def __init__(self, message, errors = None):
+        super(RecordValidationError, self).__init__(message)
+        self.errors = errors or {}
+
+    def __reduce__(self):
+        return (self.__class__, (self.args[0], self.errors))
+
 class InvalidEmailError(ValueError):
     """Exception raised when an email fails validation.
 
@@ -132,6 +149,16 @@ class WhitespaceInDomainError(InvalidDomainError):
     """
     pass
 
+class UnknownTopLevelDomainError(InvalidDomainError):
+    """Exception raised when a domain value does not end in a known top-level
+    domain.
+
+    **INHERITS FROM:** :class:`ValueError <python:ValueError>` ->
+    :class:`InvalidDomainError`
+
+    """
+    pass
+
 class InvalidIPAddressError(ValueError):
     """Exception raised when a value is not a valid IP address.
 
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+# The lack of a module docstring for this module is **INTENTIONAL**.
+# The module is imported into the documentation using Sphinx's autodoc
+# extension, and its member class documentation is automatically incorporated
+# there as needed.
+
+import csv
+import io
+from collections import namedtuple
+from itertools import islice
+
+from validator_collection._compat import json_
+from validator_collection import validators, errors
+from validator_collection.records import RecordValidator
+
+#: The default number of records read, validated and yielded at a time.
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class RowError(namedtuple('RowError', ['row', 'column', 'value', 'error'])):
+    """A failure reported by :func:`validate_csv` or :func:`validate_ndjson`.
+
+    :ivar row: The number of the record in the file, counting from ``1`` (and
+      not counting the header row of a CSV file).
+    :vartype row: :class:`int <python:int>`
+
+    :ivar column: The column (or field) that failed validation, or
+      :obj:`None <python:None>` if the record as a whole could not be read
+      (e.g. a line of an NDJSON file that is not a JSON object).
+    :vartype column: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :ivar value: The value that failed validation.
+
+    :ivar error: The exception raised for ``value``.
+    :vartype error: :class:`Exception <python:Exception>`
+
+    """
+    __slots__ = ()
+
+    @property
+    def error_type(self):
+        """The name of the class of :attr:`error`, e.g. ``'InvalidEmailError'``.
+
+        :rtype: :class:`str <python:str>`
+        """
+        return type(self.error).__name__
+
+
+class ValidatedChunk(namedtuple('ValidatedChunk', ['rows', 'errors'])):
+    """A chunk of records validated by :func:`validate_csv` or
+    :func:`validate_ndjson`.
+
+    :ivar rows: The records in the chunk that passed validation, in file order,
+      with each mapped column replaced by its validated (and possibly coerced)
+      value.
+    :vartype rows: :class:`list <python:list>` of :class:`dict <python:dict>`
+
+    :ivar errors: The failures in the chunk, in file order. A record that fails
+      validation in several columns has one :class:`RowError` per column.
+    :vartype errors: :class:`list <python:list>` of :class:`RowError`
+
+    """
+    __slots__ = ()
+
+
+def _open(source, encoding, newline = None):
+    """Return ``source`` as a text stream, and whether it was opened here (and
+    should be closed once read).
+
+    :param source: A path, or a binary stream.
+    """
+    if hasattr(source, 'read'):
+        return io.TextIOWrapper(source, encoding = encoding, newline = newline), False
+
+    source = validators.path(source, force_run = True)                          # pylint: disable=E1123
+
+    return io.open(source, 'r', encoding = encoding, newline = newline), True
+
+
+def _validate_records(records, fields, chunk_size):
+    """Validate the numbered ``records`` in chunks of ``chunk_size``, yielding a
+    :class:`ValidatedChunk` for each.
+
+    :param records: An iterable of ``(row, record)`` pairs, where ``record`` is
+      a :class:`dict <python:dict>` or a :class:`RowError` if it could not be
+      read.
+
+    :param fields: The :class:`RecordValidator
+      <validator_collection.records.RecordValidator>` to validate each record
+      with.
+    """
+    chunk_size = validators.integer(chunk_size,                                 # pylint: disable=E1123
+                                    minimum = 1,
+                                    force_run = True)
+
+    validate = fields._validate_fields                                          # pylint: disable=W0212
+    records = iter(records)
+    chunk = list(islice(records, chunk_size))
+    while chunk:
+        rows = []
+        failures = []
+        for row, record in chunk:
+            if isinstance(record, RowError):
+                failures.append(record)
+                continue
+
+            try:
+                rows.append(validate(record))
+            except errors.RecordValidationError as error:
+                failures.extend(RowError(row, column, record.get(column), error.errors[column])
+                                for column in fields.fields
+                                if column in error.errors)
+            except (ValueError, TypeError) as error:
+                failures.append(RowError(row, None, record, error))
+
+        yield ValidatedChunk(rows, failures)
+
+        chunk = list(islice(records, chunk_size))
+
+
+def validate_csv(source,
+                 fields,
+                 chunk_size = DEFAULT_CHUNK_SIZE,
+                 encoding = 'utf-8-sig',
+                 **kwargs):
+    """Validate the rows of a CSV file, reading it one chunk of rows at a time.
+
+    The first row of the file names its columns. Each following row is read as a
+    :class:`dict <python:dict>` keyed by column name and validated by a
+    :class:`RecordValidator <validator_collection.records.RecordValidator>`, so
+    columns that are not mapped to a validator are passed through unchanged and
+    empty values are validated as :obj:`None <python:None>`. Every mapped column
+    must be named in the first row. At most
+    ``chunk_size`` rows are held in memory at once, whatever the size of the
+    file.
+
+    .. code-block:: python
+
+      from validator_collection import pipeline, validators
+
+      fields = {
+          'email': 'email',
+          'age': validators.compile('integer', minimum = 0, maximum = 150)
+      }
+
+      for chunk in pipeline.validate_csv('users.csv', fields):
+          load(chunk.rows)
+          for error in chunk.errors:
+              log(error.row, error.column, error.error_type)
+
+    :param source: The path of the CSV file, or a binary stream (e.g. a file
+      opened in ``'rb'`` mode) to read it from. A path is opened and closed by
+      this function; a stream is left open.
+    :type source: Path-like object / binary stream
+
+    :param fields: The validator to apply to each column, keyed by column name
+      (accepting anything accepted by :class:`RecordValidator
+      <validator_collection.records.RecordValidator>`), or a
+      :class:`RecordValidator <validator_collection.records.RecordValidator>`.
+    :type fields: :class:`dict <python:dict>` /
+      :class:`RecordValidator <validator_collection.records.RecordValidator>`
+
+    :param chunk_size: The number of rows read, validated and yielded at a time.
+      Defaults to :data:`DEFAULT_CHUNK_SIZE`.
+    :type chunk_size: :class:`int <python:int>`
+
+    :param encoding: The encoding of the file. Defaults to ``'utf-8-sig'``
+      (UTF-8, skipping a byte order mark if the file starts with one).
+    :type encoding: :class:`str <python:str>`
+
+    :param kwargs: Keyword arguments accepted by
+      :class:`csv.DictReader <python:csv.DictReader>` (e.g. ``delimiter``).
+
+    :returns: A generator of :class:`ValidatedChunk`
+
+    :raises EmptyValueError: if ``fields`` is empty
+    :raises ValidatorUsageError: if a validator in ``fields`` is not callable,
+      or if a column mapped in ``fields`` is not named in the first row of the
+      file
+    :raises ValueError: (or a sub-class) if ``chunk_size`` is not a positive
+      integer
+    """
+    if not isinstance(fields, RecordValidator):
+        fields = RecordValidator(fields)
+
+    stream, opened = _open(source, encoding, newline = '')
+    try:
+        reader = csv.DictReader(stream, **kwargs)
+        if reader.fieldnames is not None:
+            missing = [column for column in fields.fields
+                       if column not in reader.fieldnames]
+            if missing:
+                raise errors.ValidatorUsageError(
+                    'column(s) %s not found in the CSV file' % ', '.join(missing)
+                )
+
+        for chunk in _validate_records(enumerate(reader, 1), fields, chunk_size):
+            yield chunk
+    finally:
+        if opened:
+            stream.close()
+        else:
+            stream.detach()
+
+
+def _read_ndjson(stream):
+    """Yield a ``(row, record)`` pair for each non-blank line of ``stream``,
+    where ``record`` is a :class:`RowError` if the line is not a JSON object."""
+    row = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+
+        row += 1
+        try:
+            record = json_.loads(line)
+        except ValueError:
+            yield row, RowError(row, None, line, errors.CannotCoerceError(
+                'value (%s) cannot be coerced to a dict' % line
+            ))
+            continue
+
+        if not isinstance(record, dict):
+            yield row, RowError(row, None, line, errors.NotADictError(
+                'value (%s) is not a dict' % line
+            ))
+            continue
+
+        yield row, record
+
+
+def validate_ndjson(source,
+                    fields,
+                    chunk_size = DEFAULT_CHUNK_SIZE,
+                    encoding = 'utf-8'):
+    """Validate the records of a newline-delimited JSON (NDJSON or JSON Lines)
+    file, reading it one chunk of records at a time.
+
+    Each non-blank line of the file must be a JSON object, which is validated by
+    a :class:`RecordValidator <validator_collection.records.RecordValidator>`.
+    Lines that are not JSON objects are reported as a :class:`RowError` with no
+    ``column``. At most ``chunk_size`` records are held in memory at once,
+    whatever the size of the file.
+
+    :param source: The path of the NDJSON file, or a binary stream (e.g. a file
+      opened in ``'rb'`` mode) to read it from. A path is opened and closed by
+      this function; a stream is left open.
+    :type source: Path-like object / binary stream
+
+    :param fields: The validator to apply to each field, keyed by field name
+      (accepting anything accepted by :class:`RecordValidator
+      <validator_collection.records.RecordValidator>`), or a
+      :class:`RecordValidator <validator_collection.records.RecordValidator>`.
+    :type fields: :class:`dict <python:dict>` /
+      :class:`RecordValidator <validator_collection.records.RecordValidator>`
+
+    :param chunk_size: The number of records read, validated and yielded at a
+      time. Defaults to :data:`DEFAULT_CHUNK_SIZE`.
+    :type chunk_size: :class:`int <python:int>`
+
+    :param encoding: The encoding of the file. Defaults to ``'utf-8'``.
+    :type encoding: :class:`str <python:str>`
+
+    :returns: A generator of :class:`ValidatedChunk`
+
+    :raises EmptyValueError: if ``fields`` is empty
+    :raises ValidatorUsageError: if a validator in ``fields`` is not callable
+    :raises ValueError: (or a sub-class) if ``chunk_size`` is not a positive
+      integer
+    """
+    if not isinstance(fields, RecordValidator):
+        fields = RecordValidator(fields)
+
+    stream, opened = _open(source, encoding)
+    try:
+        for chunk in _validate_records(_read_ndjson(stream), fields, chunk_size):
+            yield chunk
+    finally:
+        if opened:
+            stream.close()
+        else:
+            stream.detach()
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# The lack of a module docstring for this module is **INTENTIONAL**.
+# The module is imported into the documentation using Sphinx's autodoc
+# extension, and its member class documentation is automatically incorporated
+# there as needed.
+
+from validator_collection._compat import basestring, dict_
+from validator_collection._decorators import disabled_validators
+from validator_collection import validators, errors
+
+
+def _compile_field(field_name, validator):
+    """Return a callable that validates a single field value.
+
+    :param field_name: The name of the field (used in error messages).
+    :type field_name: :class:`str <python:str>`
+
+    :param validator: A :class:`CompiledValidator
+      <validator_collection.validators.CompiledValidator>`, the name of a
+      validator, a validator function, or any other callable that returns the
+      validated value or raises an exception.
+
+    :rtype: callable
+
+    :raises ValidatorUsageError: if ``validator`` is not callable and is not the
+      name of a validator
+    """
+    if isinstance(validator, validators.CompiledValidator):
+        return validator
+
+    if isinstance(validator, basestring):
+        return validators.compile(validator)
+
+    if not callable(validator):
+        raise errors.ValidatorUsageError(
+            'validator for field (%s) is not callable' % field_name
+        )
+
+    try:
+        return validators.compile(validator)
+    except errors.ValidatorUsageError:
+        return validator
+
+
+class RecordValidator(object):
+    """Validates :class:`dict <python:dict>` records field by field.
+
+    Each field is mapped to a validator, which is resolved (and, where
+    possible, compiled using :func:`compile()
+    <validator_collection.validators.compile>`) once when the
+    :class:`RecordValidator` is created. Every field of a record is then
+    validated, and all failures are reported together in a single
+    :class:`RecordValidationError <validator_collection.errors.RecordValidationError>`.
+
+    .. code-block:: python
+
+      from validator_collection import validators, RecordValidator
+
+      user = RecordValidator({
+          'email': 'email',
+          'created': validators.compile('datetime', allow_empty = True),
+          'age': validators.compile('integer', minimum = 0, maximum = 150)
+      })
+
+      record = user.validate({'email': 'test@domain.dev', 'age': '42'})
+
+    Fields that are missing from a record are validated as
+    :obj:`None <python:None>`, so whether they are required depends on the
+    ``allow_empty`` argument of their validator. Keys in a record that are not
+    mapped to a validator are passed through unchanged.
+
+    :param fields: The validator to apply to each field, keyed by field name.
+      Each validator may be a :class:`CompiledValidator
+      <validator_collection.validators.CompiledValidator>`, the name of a
+      validator, a validator function, or any other callable that returns the
+      validated value or raises an exception.
+    :type fields: :class:`dict <python:dict>`
+
+    :raises EmptyValueError: if ``fields`` is empty
+    :raises ValidatorUsageError: if a validator in ``fields`` is not callable
+
+    """
+
+    def __init__(self, fields):
+        fields = validators.dict(fields, force_run = True)                      # pylint: disable=E1123
+
+        self.fields = dict_((field_name, _compile_field(field_name, fields[field_name]))
+                            for field_name in fields)
+        self._fields = tuple(self.fields.items())
+
+        # Compiled fields are validated by calling their (non-raising) cores
+        # directly, with the validator's name used to skip disabled validators.
+        self._plan = tuple(
+            (field_name, validator.name, validator._core)                       # pylint: disable=W0212
+            if isinstance(validator, validators.CompiledValidator)
+            else (field_name, None, validator)
+            for field_name, validator in self._fields
+        )
+
+    def validate(self, record, allow_empty = False):
+        """Validate ``record``.
+
+        :param record: The record to validate.
+        :type record: :class:`dict <python:dict>` / JSON :class:`str <python:str>`
+
+        :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
+          ``record`` is empty. If ``False``, raises an
+          :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
+          if ``record`` is empty. Defaults to ``False``.
+        :type allow_empty: :class:`bool <python:bool>`
+
+        :returns: A copy of ``record`` with each mapped field replaced by its
+          validated (and possibly coerced) value / :obj:`None <python:None>`
+        :rtype: :class:`dict <python:dict>` / :obj:`None <python:None>`
+
+        :raises EmptyValueError: if ``record`` is empty and ``allow_empty`` is
+          ``False``
+        :raises NotADictError: if ``record`` is not a :class:`dict <python:dict>`
+        :raises RecordValidationError: if one or more fields fail validation
+        """
+        if not record or not isinstance(record, dict_):
+            record = validators.dict(record,                                    # pylint: disable=E1123
+                                     allow_empty = allow_empty,
+                                     force_run = True)
+            if record is None:
+                return None
+
+        return self._validate_fields(record)
+
+    __call__ = validate
+
+    def _validate_fields(self, record):
+        """Validate each mapped field of the :class:`dict <python:dict>`
+        ``record``, including when ``record`` is empty.
+
+        :returns: A copy of ``record`` with each mapped field replaced by its
+          validated (and possibly coerced) value
+        :rtype: :class:`dict <python:dict>`
+
+        :raises RecordValidationError: if one or more fields fail validation
+        """
+        result = dict_(record)
+        get = record.get
+        disabled = disabled_validators()
+        invalid = validators._Invalid                                           # pylint: disable=W0212
+        failures = None
+        for field_name, name, validator in self._plan:
+            value = get(field_name)
+            if name in disabled:
+                result[field_name] = value
+                continue
+
+            try:
+                value = validator(value)
+            except (ValueError, TypeError, IOError) as error:
+                if failures is None:
+                    failures = {}
+                failures[field_name] = error
+                continue
+
+            if isinstance(value, invalid):
+                if failures is None:
+                    failures = {}
+                failures[field_name] = value.error()
+                continue
+
+            result[field_name] = value
+
+        if failures:
+            raise errors.RecordValidationError(
+                'record failed validation for %s field(s): %s' % (
+                    len(failures),
+                    ', '.join(str(field_name) for field_name, _ in self._fields
+                              if field_name in failures)
+                ),
+                failures
+            )
+
+        return result
+
+    def check(self, record):
+        """Indicate whether ``record`` passes validation.
+
+        :param record: The record to check.
+        :type record: :class:`dict <python:dict>` / JSON :class:`str <python:str>`
+
+        :returns: ``True`` if every field of ``record`` is valid, ``False`` if not.
+        :rtype: :class:`bool <python:bool>`
+
+        :raises SyntaxError: if a validator raises a
+          :class:`SyntaxError <python:SyntaxError>`
+        """
+        try:
+            self.validate(record)
+        except SyntaxError as error:
+            raise error
+        except Exception:
+            return False
+
+        return True
+
+    def many(self, records, collect_errors = False):
+        """Validate every record in ``records``.
+
+        :param records: The records to validate.
+        :type records: iterable of :class:`dict <python:dict>`
+
+        :param collect_errors: If ``False``, raises the first error encountered.
+          If ``True``, validates every record and returns a
+          :class:`BatchResult <validator_collection.validators.BatchResult>` that
+          records each failure by index. Defaults to ``False``.
+        :type collect_errors: :class:`bool <python:bool>`
+
+        :returns: The validated records, in input order /
+          a :class:`BatchResult <validator_collection.validators.BatchResult>`
+          if ``collect_errors`` is ``True``
+        :rtype: :class:`list <python:list>` /
+          :class:`BatchResult <validator_collection.validators.BatchResult>`
+
+        :raises NotAnIterableError: if ``records`` is not iterable
+        :raises ValueError: (or a sub-class) if ``collect_errors`` is ``False``
+          and a record fails validation
+        """
+        records = validators.iterable(records,                                  # pylint: disable=E1123
+                                      allow_empty = True,
+                                      force_run = True)
+        if records is None:
+            records = []
+
+        validate = self.validate
+        if not collect_errors:
+            return [validate(record) for record in records]
+
+        results = []
+        append = results.append
+        failures = {}
+        for index, record in enumerate(records):
+            try:
+                append(validate(record))
+            except (ValueError, TypeError) as error:
+                append(None)
+                failures[index] = error
+
+        return validators.BatchResult(results, failures)
+
+    def __repr__(self):
+        return 'RecordValidator(%r)' % self.fields
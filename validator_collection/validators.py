@@ -10,90 +10,48 @@ import fractions
 import io
 import math
 import os
+import stat as stat_
 import uuid as uuid_
 import datetime as datetime_
 import string as string_
 import sys
 
+from encodings import idna as idna_
+from functools import partial
+from itertools import islice
+
 from ast import parse
+from collections import namedtuple, deque
 
 import jsonschema
 
 from validator_collection._compat import numeric_types, integer_types, datetime_types,\
     date_types, time_types, timestamp_types, tzinfo_types, POSITIVE_INFINITY, \
     NEGATIVE_INFINITY, TimeZone, json_, is_py2, is_py3, dict_, float_, basestring, re
-from validator_collection._decorators import disable_on_env
+from validator_collection._decorators import disable_on_env, validator_is_disabled
+from validator_collection._cache import LRUCache
+from validator_collection._public_suffixes import is_top_level_domain, \
+    public_suffix_length
 from validator_collection import errors
 
 URL_UNSAFE_CHARACTERS = ('[', ']', '{', '}', '|', '^', '%', '~')
 
-URL_REGEX = re.compile(
-    r"^"
-    # protocol identifier
-    r"(?:(?:https?|ftp)://)"
-    # user:pass authentication
-    r"(?:\S+(?::\S*)?@)?"
-    r"(?:"
-    # IP address exclusion
-    # private & local networks
-    r"(?!(?:10|127)(?:\.\d{1,3}){3})"
-    r"(?!(?:169\.254|192\.168)(?:\.\d{1,3}){2})"
-    r"(?!172\.(?:1[6-9]|2\d|3[0-1])(?:\.\d{1,3}){2})"
-    # IP address dotted notation octets
-    # excludes loopback network 0.0.0.0
-    # excludes reserved space >= 224.0.0.0
-    # excludes network & broadcast addresses
-    # (first & last IP address of each class)
-    r"(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])"
-    r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}"
-    r"(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))"
-    r"|"
-    r"(?:"
-    r"(?:localhost|invalid|test|example)|("
-    # host name
-    r"(?:(?:[A-z\u00a1-\uffff0-9]-*_*)*[A-z\u00a1-\uffff0-9]+)"
-    # domain name
-    r"(?:\.(?:[A-z\u00a1-\uffff0-9]-*)*[A-z\u00a1-\uffff0-9]+)*"
-    # TLD identifier
-    r"(?:\.(?:[A-z\u00a1-\uffff]{2,}))"
-    r")))"
-    # port number
-    r"(?::\d{2,5})?"
-    # resource path
-    r"(?:/\S*)?"
-    r"$"
-    , re.UNICODE)
-
-URL_SPECIAL_IP_REGEX = re.compile(
-    r"^"
-    # protocol identifier
-    r"(?:(?:https?|ftp)://)"
-    # user:pass authentication
-    r"(?:\S+(?::\S*)?@)?"
-    r"(?:"
-    # IP address dotted notation octets
-    # excludes loopback network 0.0.0.0
-    # excludes reserved space >= 224.0.0.0
-    # excludes network & broadcast addresses
-    # (first & last IP address of each class)
-    r"(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])"
-    r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}"
-    r"(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))"
-    r"|"
-    # host name
-    r"(?:(?:[a-z\u00a1-\uffff0-9]-*)*[a-z\u00a1-\uffff0-9]+)"
-    # domain name
-    r"(?:\.(?:[a-z\u00a1-\uffff0-9]-*)*[a-z\u00a1-\uffff0-9]+)*"
-    # TLD identifier
-    r"(?:\.(?:[a-z\u00a1-\uffff]{2,}))"
-    r")"
-    # port number
-    r"(?::\d{2,5})?"
-    # resource path
-    r"(?:/\S*)?"
-    r"$"
-    , re.UNICODE)
+# A character that cannot appear in the host of a URL. Besides ASCII letters,
+# digits, '-' and '.', hosts may contain the ASCII characters between 'Z' and 'a'
+# and any character from U+00A1 to U+FFFF.
+URL_HOST_INVALID_CHARACTER_REGEX = re.compile(r'[^A-z\u00a1-\uffff0-9.-]',
+                                              re.UNICODE)
+
+# As above, for hosts checked with ``allow_special_ips``: lower-case ASCII
+# letters only.
+URL_SPECIAL_IP_HOST_INVALID_CHARACTER_REGEX = re.compile(
+    r'[^a-z\u00a1-\uffff0-9.-]',
+    re.UNICODE
+)
+
+URL_AUTHORITY_DELIMITER_REGEX = re.compile(r'[:/@]')
 
+WHITESPACE_REGEX = re.compile(r'\s', re.UNICODE)
 
 DOMAIN_REGEX = re.compile(
     r"\b((?=[a-z\u00a1-\uffff0-9-]{1,63}\.)(xn--)?[a-z\u00a1-\uffff0-9]+"
@@ -111,15 +69,6 @@ SPECIAL_USE_DOMAIN_NAMES = ('localhost',
                             'test',
                             'example')
 
-EMAIL_REGEX = re.compile(
-    r"(?:[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*|\""
-    r"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*\")"
-    r"@(?:(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])"
-    r"?|\[(?:(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9]))\.){3}"
-    r"(?:(2(5[0-5]|[0-4][0-9])|1[0-9][0-9]|[1-9]?[0-9])|[a-z0-9-]*[a-z0-9]:"
-    r"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x5a\x53-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])+)\])"
-)
-
 VARIABLE_NAME_REGEX = re.compile(
     r"(^[a-zA-Z_])([a-zA-Z0-9_]*)"
 )
@@ -127,17 +76,160 @@ VARIABLE_NAME_REGEX = re.compile(
 
 MAC_ADDRESS_REGEX = re.compile(r'^(?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$')
 
-IPV6_REGEX = re.compile(
-    '^(?:(?:[0-9A-Fa-f]{1,4}:){6}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|::(?:[0-9A-Fa-f]{1,4}:){5}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){4}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){3}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,2}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){2}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,3}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}:(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,4}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,5}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}|(?:(?:[0-9A-Fa-f]{1,4}:){,6}[0-9A-Fa-f]{1,4})?::)(?:%25(?:[A-Za-z0-9\\-._~]|%[0-9A-Fa-f]{2})+)?$'
-)
-
 TIMEDELTA_REGEX = re.compile(r'((?P<days>\d+) days?, )?(?P<hours>\d+):'
                              r'(?P<minutes>\d+):(?P<seconds>\d+(\.\d+)?)')
 
 MIME_TYPE_REGEX = re.compile(r"^multipart|[-\w.]+/[-\w.\+]+$")
 
+#: Bounded cache of compiled JSON Schema validators, used by
+#: :func:`json() <validator_collection.validators.json>`. Set its ``maxsize``
+#: attribute to resize it.
+JSON_SCHEMA_CACHE = LRUCache(maxsize = 128)
+
+#: Bounded cache of internationalized domain names and their ASCII (IDNA) forms,
+#: used by :func:`domain() <validator_collection.validators.domain>` when called
+#: with ``idna = True``. Set its ``maxsize`` attribute to resize it.
+IDNA_CACHE = LRUCache(maxsize = 4096)
+
+#: Bounded cache of file system status results (from
+#: :func:`os.stat() <python:os.stat>`), shared by the file-related validators.
+#: It is disabled (its ``maxsize`` is ``0``) by default. Set its ``maxsize``
+#: attribute to enable it, and its ``ttl`` attribute to the number of seconds
+#: for which a result may be reused.
+STAT_CACHE = LRUCache(maxsize = 0, ttl = 1.0)
+
+#: The longest string (in characters) that each validator will parse, keyed by
+#: validator name. Longer strings are rejected with a
+#: :class:`MaximumLengthError <validator_collection.errors.MaximumLengthError>`
+#: before any parsing is done. Empty by default: change it with
+#: :func:`set_max_length` or :func:`harden`.
+MAX_LENGTHS = {}
+
+#: The limits applied by :func:`harden`: the longest valid value under the
+#: relevant standard, or a common practical limit where the standard sets none.
+HARDENED_MAX_LENGTHS = {
+    'domain': 253,                  # RFC 1035
+    'email': 254,                   # RFC 5321, less the path's angle brackets
+    'ip_address': 128,
+    'ipv4': 15,
+    'ipv6': 128,
+    'mac_address': 17,
+    'mimetype': 255,                # RFC 6838
+    'url': 2048,
+}
+
 # pylint: disable=W0613
 
+
+class _Invalid(object):
+    """The status returned by a validator's core when ``value`` fails validation.
+
+    Validator cores (``_<validator>_core()``) return either the validated value or
+    an :class:`_Invalid`, and never raise for an invalid ``value``. Checkers call
+    the cores directly, so rejecting a value costs them no more than accepting
+    it. Validators wrap the cores and raise :meth:`error` when they get an
+    :class:`_Invalid` back.
+
+    The error message is only formatted when :meth:`error` is called.
+
+    """
+    __slots__ = ('error_type', 'message', 'message_args')
+
+    def __init__(self, error_type, message, *message_args):
+        self.error_type = error_type
+        self.message = message
+        self.message_args = message_args
+
+    def error(self):
+        """Return the exception that the validator should raise.
+
+        :rtype: :class:`Exception <python:Exception>`
+        """
+        if self.message_args:
+            return self.error_type(self.message % self.message_args)
+
+        return self.error_type(self.message)
+
+    def __repr__(self):
+        return '_Invalid(%s)' % self.error_type.__name__
+
+
+def _check_length(validator_name, value):
+    """Return an :class:`_Invalid` if the string ``value`` is longer than the limit
+    set in :data:`MAX_LENGTHS` for the validator named ``validator_name``.
+
+    :rtype: :class:`_Invalid` / :obj:`None <python:None>`
+    """
+    max_length = MAX_LENGTHS.get(validator_name)
+    if max_length is not None and len(value) > max_length:
+        return _Invalid(errors.MaximumLengthError,
+                        'value is %s characters long, which exceeds the maximum '
+                        'length for %s (%s)', len(value), validator_name, max_length)
+
+    return None
+
+
+def set_max_length(validator, max_length):
+    """Set the longest string that ``validator`` will parse.
+
+    Longer strings are rejected with a
+    :class:`MaximumLengthError <validator_collection.errors.MaximumLengthError>`
+    before any parsing is done, which bounds the time spent on (possibly hostile)
+    oversized input.
+
+    .. code-block:: python
+
+      from validator_collection import validators
+
+      validators.set_max_length('url', 2048)
+      validators.set_max_length('url', None)        # removes the limit
+
+    :param validator: The name of the validator (e.g. ``'email'``).
+    :type validator: :class:`str <python:str>`
+
+    :param max_length: The maximum length, in characters. If
+      :obj:`None <python:None>`, removes the limit.
+    :type max_length: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :raises ValidatorUsageError: if ``validator`` is not the name of a validator,
+      or ``max_length`` is not a non-negative integer or
+      :obj:`None <python:None>`
+    """
+    if validator not in _VALIDATOR_NAMES:
+        raise errors.ValidatorUsageError('validator (%s) is not the name of a '
+                                         'validator' % validator)
+
+    if max_length is None:
+        MAX_LENGTHS.pop(validator, None)
+        return
+
+    if not isinstance(max_length, integer_types) or \
+       isinstance(max_length, bool) or \
+       max_length < 0:
+        raise errors.ValidatorUsageError('max_length (%s) must be a non-negative '
+                                         'integer or None' % max_length)
+
+    MAX_LENGTHS[validator] = max_length
+
+
+def harden(enabled = True):
+    """Switch hardened mode on or off.
+
+    In hardened mode, the validators that parse strings from untrusted sources
+    (``domain``, ``email``, ``ip_address``, ``ipv4``, ``ipv6``, ``mac_address``,
+    ``mimetype`` and ``url``) reject strings longer than their limits in
+    :data:`HARDENED_MAX_LENGTHS` before parsing them.
+
+    :param enabled: If ``True``, applies the limits in :data:`HARDENED_MAX_LENGTHS`.
+      If ``False``, removes the limits for those validators. Defaults to ``True``.
+    :type enabled: :class:`bool <python:bool>`
+    """
+    for validator_name, max_length in HARDENED_MAX_LENGTHS.items():
+        if enabled:
+            MAX_LENGTHS[validator_name] = max_length
+        else:
+            MAX_LENGTHS.pop(validator_name, None)
+
 ## CORE
 
 @disable_on_env
@@ -163,8 +255,17 @@ def uuid(value,
       :class:`UUID <python:uuid.UUID>`
 
     """
+    result = _uuid_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _uuid_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`uuid`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
@@ -173,8 +274,9 @@ def uuid(value,
 
     try:
         value = uuid_.UUID(value)
-    except ValueError:
-        raise errors.CannotCoerceError('value (%s) cannot be coerced to a valid UUID')
+    except (ValueError, TypeError, AttributeError):
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) cannot be coerced to a valid UUID', value)
 
     return value
 
@@ -227,31 +329,54 @@ def string(value,
     :raises MaximumLengthError: if ``maximum_length`` is supplied and the length of
       ``value`` is more than the ``maximum_length``
     """
+    result = _string_core(value,
+                          allow_empty = allow_empty,
+                          coerce_value = coerce_value,
+                          minimum_length = minimum_length,
+                          maximum_length = maximum_length,
+                          whitespace_padding = whitespace_padding)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _string_core(value,
+                 allow_empty = False,
+                 coerce_value = False,
+                 minimum_length = None,
+                 maximum_length = None,
+                 whitespace_padding = False,
+                 **kwargs):
+    """Non-raising core of :func:`string`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    minimum_length = integer(minimum_length, allow_empty = True)
-    maximum_length = integer(maximum_length, allow_empty = True)
+    if minimum_length is not None and not isinstance(minimum_length, integer_types):
+        minimum_length = integer(minimum_length, allow_empty = True)
+    if maximum_length is not None and not isinstance(maximum_length, integer_types):
+        maximum_length = integer(maximum_length, allow_empty = True)
 
     if coerce_value:
         value = str(value)
     elif not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value (%s) was not coerced to a string' % value)
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) was not coerced to a string', value)
 
     if value and maximum_length and len(value) > maximum_length:
-        raise errors.MaximumLengthError(
-            'value (%s) exceeds maximum length %s' % (value, maximum_length)
-        )
+        return _Invalid(errors.MaximumLengthError,
+                        'value (%s) exceeds maximum length %s',
+                        value, maximum_length)
 
     if value and minimum_length and len(value) < minimum_length:
         if whitespace_padding:
             value = value.ljust(minimum_length, ' ')
         else:
-            raise errors.MinimumLengthError(
-                'value (%s) is below the minimum length %s' % (value, minimum_length)
-            )
+            return _Invalid(errors.MinimumLengthError,
+                            'value (%s) is below the minimum length %s',
+                            value, minimum_length)
 
     return value
 
@@ -312,33 +437,57 @@ def iterable(value,
     :raises MaximumLengthError: if ``maximum_length`` is supplied and the length of
       ``value`` is more than the ``maximum_length``
     """
+    result = _iterable_core(value,
+                            allow_empty = allow_empty,
+                            forbid_literals = forbid_literals,
+                            minimum_length = minimum_length,
+                            maximum_length = maximum_length)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _iterable_core(value,
+                   allow_empty = False,
+                   forbid_literals = (str, bytes),
+                   minimum_length = None,
+                   maximum_length = None,
+                   **kwargs):
+    """Non-raising core of :func:`iterable`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif value is None:
         return None
 
-    minimum_length = integer(minimum_length, allow_empty = True, force_run = True) # pylint: disable=E1123
-    maximum_length = integer(maximum_length, allow_empty = True, force_run = True) # pylint: disable=E1123
+    if minimum_length is not None and not isinstance(minimum_length, integer_types):
+        minimum_length = integer(minimum_length, allow_empty = True, force_run = True) # pylint: disable=E1123
+    if maximum_length is not None and not isinstance(maximum_length, integer_types):
+        maximum_length = integer(maximum_length, allow_empty = True, force_run = True) # pylint: disable=E1123
 
     if isinstance(value, forbid_literals):
-        raise errors.NotAnIterableError('value type (%s) not iterable' % type(value))
+        return _Invalid(errors.NotAnIterableError,
+                        'value type (%s) not iterable', type(value))
 
     try:
         iter(value)
     except TypeError:
-        raise errors.NotAnIterableError('value type (%s) not iterable' % type(value))
+        return _Invalid(errors.NotAnIterableError,
+                        'value type (%s) not iterable', type(value))
     except Exception as error:
-        raise errors.IterationFailedError('iterating across value raised an unexpected Exception: "%s"' % error)
+        return _Invalid(errors.IterationFailedError,
+                        'iterating across value raised an unexpected Exception: "%s"',
+                        error)
 
     if value and minimum_length is not None and len(value) < minimum_length:
-        raise errors.MinimumLengthError(
-            'value has fewer items than the minimum length %s' % minimum_length
-        )
+        return _Invalid(errors.MinimumLengthError,
+                        'value has fewer items than the minimum length %s',
+                        minimum_length)
 
     if value and maximum_length is not None and len(value) > maximum_length:
-        raise errors.MaximumLengthError(
-            'value has more items than the maximum length %s' % maximum_length
-        )
+        return _Invalid(errors.MaximumLengthError,
+                        'value has more items than the maximum length %s',
+                        maximum_length)
 
     return value
 
@@ -363,10 +512,19 @@ def none(value,
       but **not** :obj:`None <python:None>` and
 
     """
+    result = _none_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return None
+
+
+def _none_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`none`."""
     if value is not None and not value and allow_empty:
         pass
     elif (value is not None and not value) or value:
-        raise errors.NotNoneError('value was not None')
+        return _Invalid(errors.NotNoneError, 'value was not None')
 
     return None
 
@@ -389,10 +547,19 @@ def not_empty(value,
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
     """
+    result = _not_empty_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _not_empty_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`not_empty`."""
     if not value and allow_empty:
         return None
     elif not value:
-        raise errors.EmptyValueError('value was empty')
+        return _Invalid(errors.EmptyValueError, 'value was empty')
 
     return value
 
@@ -423,24 +590,31 @@ def variable_name(value,
     :raises EmptyValueError: if ``allow_empty`` is ``False`` and ``value``
       is empty
     """
+    result = _variable_name_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _variable_name_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`variable_name`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     is_valid = VARIABLE_NAME_REGEX.fullmatch(value)
 
     if not is_valid:
-        raise errors.InvalidVariableNameError(
-            'value (%s) is not a valid variable name' % value
-        )
+        return _Invalid(errors.InvalidVariableNameError,
+                        'value (%s) is not a valid variable name', value)
 
     try:
         parse('%s = None' % value)
     except (SyntaxError, ValueError, TypeError):
-        raise errors.InvalidVariableNameError(
-            'value (%s) is not a valid variable name' % value
-        )
+        return _Invalid(errors.InvalidVariableNameError,
+                        'value (%s) is not a valid variable name', value)
 
     return value
 
@@ -483,9 +657,23 @@ def dict(value,
     :raises NotADictError: if ``value`` is not a :class:`dict <python:dict>`
 
     """
+    result = _dict_core(value,
+                        allow_empty = allow_empty,
+                        json_serializer = json_serializer)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _dict_core(value,
+               allow_empty = False,
+               json_serializer = None,
+               **kwargs):
+    """Non-raising core of :func:`dict`."""
     original_value = value
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
@@ -496,15 +684,17 @@ def dict(value,
         try:
             value = json_serializer.loads(value)
         except Exception:
-            raise errors.CannotCoerceError(
-                'value (%s) cannot be coerced to a dict' % original_value
-            )
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) cannot be coerced to a dict', original_value)
 
-        value = dict(value,
-                     json_serializer = json_serializer)
+        value = _dict_core(value,
+                           json_serializer = json_serializer)
+        if isinstance(value, _Invalid):
+            return value
 
     if not isinstance(value, dict_):
-        raise errors.NotADictError('value (%s) is not a dict' % original_value)
+        return _Invalid(errors.NotADictError,
+                        'value (%s) is not a dict', original_value)
 
     return value
 
@@ -559,11 +749,28 @@ def json(value,
     :raises JSONValidationError: if ``value`` does not validate against the JSON Schema
 
     """
+    result = _json_core(value,
+                        schema = schema,
+                        allow_empty = allow_empty,
+                        json_serializer = json_serializer,
+                        **kwargs)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _json_core(value,
+               schema = None,
+               allow_empty = False,
+               json_serializer = None,
+               **kwargs):
+    """Non-raising core of :func:`json`."""
     original_value = value
     original_schema = schema
 
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
@@ -574,10 +781,16 @@ def json(value,
         try:
             value = json_serializer.loads(value)
         except Exception:
-            raise errors.CannotCoerceError(
-                'value (%s) cannot be deserialized from JSON' % original_value
-            )
-    if isinstance(schema, str):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) cannot be deserialized from JSON', original_value)
+
+    compiled_schema = None
+    schema_cache_key = None
+    if schema and isinstance(schema, str):
+        schema_cache_key = ('str', schema, json_serializer)
+        compiled_schema = JSON_SCHEMA_CACHE.get(schema_cache_key)
+
+    if compiled_schema is None and isinstance(schema, str):
         try:
             schema = dict(schema,
                           allow_empty = allow_empty,
@@ -589,26 +802,254 @@ def json(value,
             )
 
     if not isinstance(value, (list, dict_)):
-        raise errors.NotJSONError('value (%s) is not a JSON object' % original_value)
+        return _Invalid(errors.NotJSONError,
+                        'value (%s) is not a JSON object', original_value)
 
-    if original_schema and not isinstance(schema, dict_):
-        raise errors.NotJSONError('schema (%s) is not a JSON object' % original_schema)
+    if compiled_schema is None:
+        if original_schema and not isinstance(schema, dict_):
+            raise errors.NotJSONError('schema (%s) is not a JSON object' % original_schema)
 
-    if not schema:
-        return value
+        if not schema:
+            return value
+
+        compiled_schema = _get_compiled_json_schema(schema,
+                                                    cache_key = schema_cache_key)
+
+    result = _apply_compiled_json_schema(value, compiled_schema)
+    if result is not None:
+        return result
+
+    return value
 
+
+def _get_compiled_json_schema(schema, cache_key = None):
+    """Return a :mod:`jsonschema` validator instance for ``schema``, retrieving
+    it from :data:`JSON_SCHEMA_CACHE` if it has already been compiled.
+
+    :param schema: The JSON Schema to compile.
+    :type schema: :class:`dict <python:dict>`
+
+    :param cache_key: The key under which to cache the compiled validator. If
+      :obj:`None <python:None>`, a canonical serialization of ``schema`` is used.
+      If ``schema`` cannot be serialized, the compiled validator is not cached.
+
+    :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema
+
+    """
+    if cache_key is None:
+        try:
+            cache_key = ('dict', json_.dumps(schema, sort_keys = True))
+        except (TypeError, ValueError):
+            cache_key = None
+        else:
+            compiled_schema = JSON_SCHEMA_CACHE.get(cache_key)
+            if compiled_schema is not None:
+                return compiled_schema
+
+            # Compile from the canonical copy, so that later changes to the
+            # caller's ``schema`` cannot leak into the cached validator.
+            schema = json_.loads(cache_key[1])
+
+    validator_class = jsonschema.validators.validator_for(schema)
     try:
-        jsonschema.validate(value, schema)
-    except jsonschema.exceptions.ValidationError as error:
-        raise errors.JSONValidationError(error.message)
+        validator_class.check_schema(schema)
     except jsonschema.exceptions.SchemaError as error:
         raise errors.NotJSONSchemaError(error.message)
 
-    return value
+    compiled_schema = validator_class(schema)
+
+    if cache_key is not None:
+        JSON_SCHEMA_CACHE.set(cache_key, compiled_schema)
+
+    return compiled_schema
+
+
+def _apply_compiled_json_schema(value, compiled_schema):
+    """Validate ``value`` against ``compiled_schema``.
+
+    :returns: :obj:`None <python:None>` if ``value`` validates, or an
+      :class:`_Invalid` recording a
+      :class:`JSONValidationError <validator_collection.errors.JSONValidationError>`
+    :rtype: :obj:`None <python:None>` / :class:`_Invalid`
+    """
+    if compiled_schema.is_valid(value):
+        return None
+
+    error = jsonschema.exceptions.best_match(compiled_schema.iter_errors(value))
+    return _Invalid(errors.JSONValidationError, error.message)
+
+
+def compile_json_schema(schema,
+                        json_serializer = None):
+    """Compile ``schema`` once and return a reusable validator function.
+
+    The returned function behaves like
+    :func:`json() <validator_collection.validators.json>` called with ``schema``,
+    but skips re-parsing and re-checking the schema on every call. Use it when
+    validating many values against the same schema.
+
+    .. code-block:: python
+
+      from validator_collection import validators
+
+      validate_payload = validators.compile_json_schema(PAYLOAD_SCHEMA)
+
+      for payload in payloads:
+          validate_payload(payload)
+
+    :param schema: The JSON Schema against which values will be validated.
+    :type schema: :class:`dict <python:dict>` / :class:`str <python:str>`
+
+    :param json_serializer: The JSON encoder/decoder to use to deserialize
+      ``schema`` and any string values passed to the returned function. If not
+      supplied, will default to the Python :class:`json <python:json>`
+      encoder/decoder.
+    :type json_serializer: callable
+
+    :returns: A function with the signature ``(value, allow_empty = False)`` that
+      returns ``value`` (deserialized if it was a string) / :obj:`None <python:None>`
+      and raises the same errors as
+      :func:`json() <validator_collection.validators.json>`.
+    :rtype: callable
+
+    :raises CannotCoerceError: if ``schema`` cannot be coerced to a
+      :class:`dict <python:dict>`
+    :raises NotJSONError: if ``schema`` is not a JSON object
+    :raises NotJSONSchemaError: if ``schema`` is not a valid JSON Schema
+
+    """
+    if not json_serializer:
+        json_serializer = json_
+
+    cache_key = None
+    if isinstance(schema, str):
+        cache_key = ('str', schema, json_serializer)
+        try:
+            schema = dict(schema, json_serializer = json_serializer, force_run = True)   # pylint: disable=E1123
+        except Exception:
+            raise errors.CannotCoerceError(
+                'schema (%s) cannot be coerced to a dict' % schema
+            )
+
+    if not isinstance(schema, dict_):
+        raise errors.NotJSONError('schema (%s) is not a JSON object' % schema)
+
+    compiled_schema = _get_compiled_json_schema(schema, cache_key = cache_key)
+
+    def validate_json(value, allow_empty = False):
+        """Validate that ``value`` conforms to the compiled JSON Schema."""
+        original_value = value
+        if not value and not allow_empty:
+            raise errors.EmptyValueError('value (%s) was empty' % value)
+        elif not value:
+            return None
+
+        if isinstance(value, str):
+            try:
+                value = json_serializer.loads(value)
+            except Exception:
+                raise errors.CannotCoerceError(
+                    'value (%s) cannot be deserialized from JSON' % original_value
+                )
+
+        if not isinstance(value, (list, dict_)):
+            raise errors.NotJSONError('value (%s) is not a JSON object' % original_value)
+
+        result = _apply_compiled_json_schema(value, compiled_schema)
+        if result is not None:
+            raise result.error()
+
+        return value
+
+    validate_json.schema = compiled_schema.schema
+
+    return validate_json
+
+
+def json_schema_cache_info():
+    """Return hit / miss statistics for the compiled JSON Schema cache used by
+    :func:`json() <validator_collection.validators.json>`.
+
+    :rtype: named tuple with ``hits``, ``misses``, ``maxsize``, and ``currsize``
+    """
+    return JSON_SCHEMA_CACHE.info()
+
+
+def clear_json_schema_cache():
+    """Remove all compiled JSON Schemas from the cache and reset its statistics."""
+    JSON_SCHEMA_CACHE.clear()
 
 
 ## DATE / TIME
 
+class FormatMemo(object):
+    """Remembers the format that most recently parsed a string in :func:`date`,
+    :func:`datetime` or :func:`time`, so that the same format is tried first for
+    the next string.
+
+    Values from a single source (e.g. one column of a file) almost always share a
+    format, so passing the same :class:`FormatMemo` to every call (as
+    ``format_memo``) skips the formats that would otherwise be tried and fail
+    first. Compiled validators created with ``compile('datetime', adaptive = True)``
+    do this for you.
+
+    .. code-block:: python
+
+      from validator_collection import validators
+
+      memo = validators.FormatMemo()
+      for value in column:
+          validators.datetime(value, format_memo = memo)
+
+      memo.format            # e.g. '%Y/%m/%d %H:%M:%S'
+
+    :ivar format: The format that last parsed a string successfully, as a
+      :func:`strptime <python:datetime.datetime.strptime>`-style format string, or
+      :obj:`None <python:None>` if no string has been parsed yet.
+    :vartype format: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    """
+    __slots__ = ('format',)
+
+    def __init__(self):
+        self.format = None
+
+    def __repr__(self):
+        return 'FormatMemo(%r)' % self.format
+
+
+_DATE_FORMAT = '%Y-%m-%d'
+
+# The strptime formats tried by datetime(), as (``T``-separated, space-separated)
+# pairs. Which one of a pair is used depends on whether the value contains a T.
+_DATETIME_FORMATS = (
+    ('%Y-%m-%dT%H:%M:%S.%f%z', '%Y-%m-%d %H:%M:%S.%f%z'),
+    ('%Y/%m/%dT%H:%M:%S%z', '%Y/%m/%d %H:%M:%S%z'),
+    ('%Y-%m-%dT%H:%M:%S%z', '%Y-%m-%d %H:%M:%S%z'),
+    ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%d %H:%M:%S.%f'),
+    ('%Y/%m/%dT%H:%M:%S', '%Y/%m/%d %H:%M:%S'),
+    ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'),
+)
+
+# The shortest string that can match any of _DATETIME_FORMATS
+# (e.g. '2018-1-1T1:1:1').
+_DATETIME_FORMATS_MIN_LENGTH = 14
+
+# Each format in _DATETIME_FORMATS, mapped to all of the pairs ordered so that
+# its own pair is tried first.
+_DATETIME_FORMATS_BY_FORMAT = dict_(
+    (date_format, (pair,) + tuple(x for x in _DATETIME_FORMATS if x is not pair))
+    for pair in _DATETIME_FORMATS
+    for date_format in pair
+)
+
+
+def _is_plain_date(value):
+    """Indicate whether ``value`` is a :class:`date <python:datetime.date>` that is
+    not also a :class:`datetime <python:datetime.datetime>`."""
+    return isinstance(value, datetime_.date) and \
+        not isinstance(value, datetime_.datetime)
+
 
 @disable_on_env
 def date(value,
@@ -616,6 +1057,7 @@ def date(value,
          minimum = None,
          maximum = None,
          coerce_value = True,
+         format_memo = None,
          **kwargs):
     """Validate that ``value`` is a valid date.
 
@@ -645,6 +1087,11 @@ def date(value,
       will not.
     :type coerce_value: :class:`bool <python:bool>`
 
+    :param format_memo: If supplied, the string format that parsed the previous
+      value is tried first, and the format that parses ``value`` is recorded on
+      it. Defaults to :obj:`None <python:None>`.
+    :type format_memo: :class:`FormatMemo` / :obj:`None <python:None>`
+
     :returns: ``value`` / :obj:`None <python:None>`
     :rtype: :class:`date <python:datetime.date>` / :obj:`None <python:None>`
 
@@ -657,248 +1104,399 @@ def date(value,
       ``maximum``
 
     """
-    # pylint: disable=too-many-branches
+    result = _date_core(value,
+                        allow_empty = allow_empty,
+                        minimum = minimum,
+                        maximum = maximum,
+                        coerce_value = coerce_value,
+                        format_memo = format_memo)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _date_core(value,
+               allow_empty = False,
+               minimum = None,
+               maximum = None,
+               coerce_value = True,
+               format_memo = None,
+               **kwargs):
+    """Non-raising core of :func:`date`."""
+    # pylint: disable=too-many-branches, too-many-return-statements
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    minimum = date(minimum, allow_empty = True, force_run = True)               # pylint: disable=E1123
-    maximum = date(maximum, allow_empty = True, force_run = True)               # pylint: disable=E1123
+    if minimum is not None and not _is_plain_date(minimum):
+        minimum = date(minimum, allow_empty = True, force_run = True)           # pylint: disable=E1123
+    if maximum is not None and not _is_plain_date(maximum):
+        maximum = date(maximum, allow_empty = True, force_run = True)           # pylint: disable=E1123
 
     if not isinstance(value, date_types):
-        raise errors.CannotCoerceError(
-            'value (%s) must be a date object, datetime object, '
-            'ISO 8601-formatted string, '
-            'or POSIX timestamp, but was %s' % (value, type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a date object, datetime object, '
+                        'ISO 8601-formatted string, '
+                        'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, datetime_.datetime) and not coerce_value:
-        raise errors.CannotCoerceError(
-            'value (%s) must be a date object, or '
-            'ISO 8601-formatted string, '
-            'but was %s' % (value, type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a date object, or '
+                        'ISO 8601-formatted string, '
+                        'but was %s', value, type(value))
     elif isinstance(value, datetime_.datetime) and coerce_value:
         value = value.date()
     elif isinstance(value, timestamp_types) and coerce_value:
         try:
             value = datetime_.date.fromtimestamp(value)
-        except ValueError:
-            raise errors.CannotCoerceError(
-                'value (%s) must be a date object, datetime object, '
-                'ISO 8601-formatted string, '
-                'or POSIX timestamp, but was %s' % (value, type(value))
-            )
+        except (ValueError, OverflowError, OSError):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a date object, datetime object, '
+                            'ISO 8601-formatted string, '
+                            'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, str):
         try:
+            if len(value) < 16:
+                # too short to match the format below (e.g. '2018-1-1T1:1:1.1')
+                raise ValueError()
             value = datetime_.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f')
             if coerce_value:
                 value = value.date()
+                if format_memo is not None:
+                    format_memo.format = '%Y-%m-%dT%H:%M:%S.%f'
             else:
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a date object, '
-                    'ISO 8601-formatted string, '
-                    'or POSIX timestamp, but was %s' % (value, type(value))
-                )
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a date object, '
+                                'ISO 8601-formatted string, '
+                                'or POSIX timestamp, but was %s', value, type(value))
         except ValueError:
             if len(value) > 10 and not coerce_value:
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a date object, or '
-                    'ISO 8601-formatted string, '
-                    'but was %s' % (value, type(value))
-                )
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a date object, or '
+                                'ISO 8601-formatted string, '
+                                'but was %s', value, type(value))
             if ' ' in value:
                 value = value.split(' ')[0]
             if 'T' in value:
                 value = value.split('T')[0]
 
             if len(value) != 10:
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a date object, datetime object, '
-                    'ISO 8601-formatted string, '
-                    'or POSIX timestamp, but was %s' % (value, type(value))
-                )
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a date object, datetime object, '
+                                'ISO 8601-formatted string, '
+                                'or POSIX timestamp, but was %s', value, type(value))
             try:
                 year = int(value[:4])
                 month = int(value[5:7])
                 day = int(value[-2:])
                 value = datetime_.date(year, month, day)
+                if format_memo is not None:
+                    format_memo.format = _DATE_FORMAT
             except (ValueError, TypeError):
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a date object, datetime object, '
-                    'ISO 8601-formatted string, '
-                    'or POSIX timestamp, but was %s' % (value, type(value))
-                )
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a date object, datetime object, '
+                                'ISO 8601-formatted string, '
+                                'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, numeric_types) and not coerce_value:
-        raise errors.CannotCoerceError(
-            'value (%s) must be a date object, or '
-            'ISO 8601-formatted string, '
-            'but was %s' % (value, type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a date object, or '
+                        'ISO 8601-formatted string, '
+                        'but was %s', value, type(value))
 
 
     if minimum and value and value < minimum:
-        raise errors.MinimumValueError(
-            'value (%s) is before the minimum given (%s)' % (value.isoformat(),
-                                                             minimum.isoformat())
-        )
+        return _Invalid(errors.MinimumValueError,
+                        'value (%s) is before the minimum given (%s)',
+                        value.isoformat(), minimum.isoformat())
     if maximum and value and value > maximum:
-        raise errors.MaximumValueError(
-            'value (%s) is after the maximum given (%s)' % (value.isoformat(),
-                                                            maximum.isoformat())
-        )
+        return _Invalid(errors.MaximumValueError,
+                        'value (%s) is after the maximum given (%s)',
+                        value.isoformat(), maximum.isoformat())
 
     return value
 
 
-@disable_on_env
-def datetime(value,
-             allow_empty = False,
-             minimum = None,
-             maximum = None,
-             coerce_value = True,
-             **kwargs):
-    """Validate that ``value`` is a valid datetime.
+# UTC offsets (in minutes) parsed by _parse_iso_datetime(), mapped to their
+# tzinfo. Bounded by the number of valid offsets.
+_ISO_TIMEZONES = {}
 
-    .. caution::
 
-      If supplying a string, the string needs to be in an ISO 8601-format to pass
-      validation. If it is not in an ISO 8601-format, validation will fail.
+def _parse_iso_datetime(value, allow_date = False):
+    """Parse an ISO 8601 / RFC 3339 datetime string in a single pass, without
+    :func:`strptime <python:datetime.datetime.strptime>`.
 
-    :param value: The value to validate.
-    :type value: :class:`str <python:str>` / :class:`datetime <python:datetime.datetime>`
-      / :class:`date <python:datetime.date>` / :obj:`None <python:None>`
+    Handles ``YYYY-MM-DD``, followed by ``T`` or a space and ``HH:MM:SS``, then
+    an optional fraction of one to six digits and an optional ``Z``, ``+HH:MM``
+    or ``+HHMM`` UTC offset. These strings parse to exactly the same value as
+    they would through :func:`_strptime_datetime`.
 
-    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
-      ``value`` is empty. If ``False``, raises a
-      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
-      if ``value`` is empty. Defaults to ``False``.
-    :type allow_empty: :class:`bool <python:bool>`
+    :param allow_date: If ``True``, also accepts a bare ``YYYY-MM-DD`` and returns
+      it as a :class:`datetime <python:datetime.datetime>` at midnight.
+    :type allow_date: :class:`bool <python:bool>`
 
-    :param minimum: If supplied, will make sure that ``value`` is on or after this value.
-    :type minimum: :class:`datetime <python:datetime.datetime>` /
-      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>` /
-      :obj:`None <python:None>`
+    :returns: The parsed value, or :obj:`None <python:None>` if ``value`` is not
+      in one of the forms above (including if it is out of range).
+    :rtype: :class:`datetime <python:datetime.datetime>` / :obj:`None <python:None>`
+    """
+    # pylint: disable=too-many-return-statements, too-many-branches
+    length = len(value)
+    if length < 10 or value[4] != '-' or value[7] != '-':
+        return None
 
-    :param maximum: If supplied, will make sure that ``value`` is on or before this
-      value.
-    :type maximum: :class:`datetime <python:datetime.datetime>` /
-      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>` /
-      :obj:`None <python:None>`
+    if length == 10:
+        if not allow_date:
+            return None
+        digits = value[0:4] + value[5:7] + value[8:10]
+    elif length < 19 or value[10] not in 'T ' or value[13] != ':' or value[16] != ':':
+        return None
+    else:
+        digits = value[0:4] + value[5:7] + value[8:10] + \
+            value[11:13] + value[14:16] + value[17:19]
 
-    :param coerce_value: If ``True``, will coerce dates to
-      :class:`datetime <python:datetime.datetime>` objects with times of 00:00:00. If ``False``, will error
-      if ``value`` is not an unambiguous timestamp. Defaults to ``True``.
-    :type coerce_value: :class:`bool <python:bool>`
+    if digits.strip(string_.digits):
+        return None
 
-    :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`datetime <python:datetime.datetime>` / :obj:`None <python:None>`
+    fields = [int(digits[0:4]), int(digits[4:6]), int(digits[6:8])]
+    if length > 10:
+        fields.extend([int(digits[8:10]), int(digits[10:12]), int(digits[12:14])])
 
-    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
-    :raises CannotCoerceError: if ``value`` cannot be coerced to a
-      :class:`datetime <python:datetime.datetime>` value and is not
-      :obj:`None <python:None>`
-    :raises MinimumValueError: if ``minimum`` is supplied but ``value`` occurs
+    position = 19
+    microsecond = 0
+    if length > position and value[position] == '.':
+        end = position + 1
+        while end < length and '0' <= value[end] <= '9':
+            end += 1
+
+        fraction = value[position + 1:end]
+        if not fraction or len(fraction) > 6:
+            return None
+
+        microsecond = int(fraction + '0' * (6 - len(fraction)))
+        position = end
+
+    tzinfo = None
+    if length > position:
+        if is_py2:
+            return None
+
+        offset = value[position:]
+        if offset == 'Z':
+            offset_minutes = 0
+        else:
+            if len(offset) == 6 and offset[3] == ':':
+                hours, minutes = offset[1:3], offset[4:6]
+            elif len(offset) == 5:
+                hours, minutes = offset[1:3], offset[3:5]
+            else:
+                return None
+
+            if offset[0] not in '+-' or (hours + minutes).strip(string_.digits):
+                return None
+
+            hours, minutes = int(hours), int(minutes)
+            if minutes > 59:
+                return None
+
+            offset_minutes = hours * 60 + minutes
+            if offset[0] == '-':
+                offset_minutes = -offset_minutes
+
+        tzinfo = _ISO_TIMEZONES.get(offset_minutes, None)
+        if tzinfo is None:
+            try:
+                tzinfo = TimeZone(datetime_.timedelta(minutes = offset_minutes))
+            except ValueError:
+                return None
+            _ISO_TIMEZONES[offset_minutes] = tzinfo
+
+    if length > 10:
+        fields.append(microsecond)
+
+    try:
+        return datetime_.datetime(*fields, tzinfo = tzinfo)
+    except ValueError:
+        return None
+
+
+def _strptime_datetime(value, coerce_value, format_memo = None):
+    """Parse the datetime string ``value`` by trying each supported
+    :func:`strptime <python:datetime.datetime.strptime>` format in turn.
+
+    This is the fallback used by :func:`datetime` for strings that
+    :func:`_parse_iso_datetime` does not handle.
+
+    The formats in ``_DATETIME_FORMATS`` cannot match the same string, so trying
+    the format remembered by ``format_memo`` first does not change the result.
+
+    :returns: The parsed value, or an :class:`_Invalid` if ``value`` cannot be
+      parsed.
+    """
+    formats = _DATETIME_FORMATS
+    remembered = None
+    if format_memo is not None:
+        remembered = format_memo.format
+        formats = _DATETIME_FORMATS_BY_FORMAT.get(remembered, formats)
+
+    if len(value) < _DATETIME_FORMATS_MIN_LENGTH:
+        formats = ()
+
+    index = 0 if 'T' in value else 1
+    for pair in formats:
+        try:
+            parsed = datetime_.datetime.strptime(value, pair[index])
+        except ValueError:
+            continue
+
+        if format_memo is not None and remembered != pair[index]:
+            format_memo.format = pair[index]
+
+        return parsed
+
+    if coerce_value:
+        return _date_core(value, format_memo = format_memo)
+
+    return _Invalid(errors.CannotCoerceError,
+                    'value (%s) must be a datetime object, '
+                    'ISO 8601-formatted string, '
+                    'or POSIX timestamp', value)
+
+
+def _iso_datetime_format(value):
+    """Return the :func:`strptime <python:datetime.datetime.strptime>`-style
+    format of ``value``, a string parsed by :func:`_parse_iso_datetime`."""
+    if len(value) == 10:
+        return _DATE_FORMAT
+
+    date_format = '%Y-%m-%d' + value[10] + '%H:%M:%S'
+    if len(value) > 19 and value[19] == '.':
+        date_format += '.%f'
+
+    offset = value[19:]
+    if offset.endswith('Z') or '+' in offset or '-' in offset:
+        date_format += '%z'
+
+    return date_format
+
+
+@disable_on_env
+def datetime(value,
+             allow_empty = False,
+             minimum = None,
+             maximum = None,
+             coerce_value = True,
+             format_memo = None,
+             **kwargs):
+    """Validate that ``value`` is a valid datetime.
+
+    .. caution::
+
+      If supplying a string, the string needs to be in an ISO 8601-format to pass
+      validation. If it is not in an ISO 8601-format, validation will fail.
+
+    :param value: The value to validate.
+    :type value: :class:`str <python:str>` / :class:`datetime <python:datetime.datetime>`
+      / :class:`date <python:datetime.date>` / :obj:`None <python:None>`
+
+    :param allow_empty: If ``True``, returns :obj:`None <python:None>` if
+      ``value`` is empty. If ``False``, raises a
+      :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`
+      if ``value`` is empty. Defaults to ``False``.
+    :type allow_empty: :class:`bool <python:bool>`
+
+    :param minimum: If supplied, will make sure that ``value`` is on or after this value.
+    :type minimum: :class:`datetime <python:datetime.datetime>` /
+      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>` /
+      :obj:`None <python:None>`
+
+    :param maximum: If supplied, will make sure that ``value`` is on or before this
+      value.
+    :type maximum: :class:`datetime <python:datetime.datetime>` /
+      :class:`date <python:datetime.date>` / compliant :class:`str <python:str>` /
+      :obj:`None <python:None>`
+
+    :param coerce_value: If ``True``, will coerce dates to
+      :class:`datetime <python:datetime.datetime>` objects with times of 00:00:00. If ``False``, will error
+      if ``value`` is not an unambiguous timestamp. Defaults to ``True``.
+    :type coerce_value: :class:`bool <python:bool>`
+
+    :param format_memo: If supplied, the string format that parsed the previous
+      value is tried first, and the format that parses ``value`` is recorded on
+      it. Defaults to :obj:`None <python:None>`.
+    :type format_memo: :class:`FormatMemo` / :obj:`None <python:None>`
+
+    :returns: ``value`` / :obj:`None <python:None>`
+    :rtype: :class:`datetime <python:datetime.datetime>` / :obj:`None <python:None>`
+
+    :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises CannotCoerceError: if ``value`` cannot be coerced to a
+      :class:`datetime <python:datetime.datetime>` value and is not
+      :obj:`None <python:None>`
+    :raises MinimumValueError: if ``minimum`` is supplied but ``value`` occurs
       before ``minimum``
     :raises MaximumValueError: if ``maximum`` is supplied but ``value`` occurs
       after ``minimum``
 
     """
-    # pylint: disable=too-many-branches
+    result = _datetime_core(value,
+                            allow_empty = allow_empty,
+                            minimum = minimum,
+                            maximum = maximum,
+                            coerce_value = coerce_value,
+                            format_memo = format_memo)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _datetime_core(value,
+                   allow_empty = False,
+                   minimum = None,
+                   maximum = None,
+                   coerce_value = True,
+                   format_memo = None,
+                   **kwargs):
+    """Non-raising core of :func:`datetime`."""
+    # pylint: disable=too-many-branches, too-many-return-statements
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    minimum = datetime(minimum, allow_empty = True, force_run = True)           # pylint: disable=E1123
-    maximum = datetime(maximum, allow_empty = True, force_run = True)           # pylint: disable=E1123
+    if minimum is not None and not isinstance(minimum, datetime_.datetime):
+        minimum = datetime(minimum, allow_empty = True, force_run = True)       # pylint: disable=E1123
+    if maximum is not None and not isinstance(maximum, datetime_.datetime):
+        maximum = datetime(maximum, allow_empty = True, force_run = True)       # pylint: disable=E1123
 
     if not isinstance(value, datetime_types):
-        raise errors.CannotCoerceError(
-            'value (%s) must be a date object, datetime object, '
-            'ISO 8601-formatted string, '
-            'or POSIX timestamp, but was %s' % (value,
-                                                type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a date object, datetime object, '
+                        'ISO 8601-formatted string, '
+                        'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, timestamp_types) and coerce_value:
         try:
             value = datetime_.datetime.fromtimestamp(value)
-        except ValueError:
-            raise errors.CannotCoerceError(
-                'value (%s) must be a date object, datetime object, '
-                'ISO 8601-formatted string, '
-                'or POSIX timestamp, but was %s' % (value,
-                                                    type(value))
-            )
+        except (ValueError, OverflowError, OSError):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a date object, datetime object, '
+                            'ISO 8601-formatted string, '
+                            'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, str):
-        # pylint: disable=line-too-long
-        try:
-            if 'T' in value:
-                value = datetime_.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
-            else:
-                value = datetime_.datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f%z')
-        except ValueError:
-            try:
-                if 'T' in value:
-                    value = datetime_.datetime.strptime(value, '%Y/%m/%dT%H:%M:%S%z')
-                else:
-                    value = datetime_.datetime.strptime(value, '%Y/%m/%d %H:%M:%S%z')
-            except ValueError:
-                try:
-                    if 'T' in value:
-                        value = datetime_.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z')
-                    else:
-                        value = datetime_.datetime.strptime(value, '%Y-%m-%d %H:%M:%S%z')
-                except ValueError:
-                    try:
-                        if 'T' in value:
-                            value = datetime_.datetime.strptime(value,
-                                                                '%Y/%m/%dT%H:%M:%S%z')
-                        else:
-                            value = datetime_.datetime.strptime(value,
-                                                                '%Y/%m/%d %H:%M:%S%z')
-                    except ValueError:
-                        try:
-                            if 'T' in value:
-                                value = datetime_.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f')
-                            else:
-                                value = datetime_.datetime.strptime(value, '%Y-%m-%d %H:%M:%S.%f')
-                        except ValueError:
-                            try:
-                                if 'T' in value:
-                                    value = datetime_.datetime.strptime(value, '%Y/%m/%dT%H:%M:%S')
-                                else:
-                                    value = datetime_.datetime.strptime(value, '%Y/%m/%d %H:%M:%S')
-                            except ValueError:
-                                try:
-                                    if 'T' in value:
-                                        value = datetime_.datetime.strptime(value, '%Y-%m-%dT%H:%M:%S')
-                                    else:
-                                        value = datetime_.datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-                                except ValueError:
-                                    try:
-                                        if 'T' in value:
-                                            value = datetime_.datetime.strptime(value,
-                                                                                '%Y/%m/%dT%H:%M:%S')
-                                        else:
-                                            value = datetime_.datetime.strptime(value,
-                                                                                '%Y/%m/%d %H:%M:%S')
-                                    except ValueError:
-                                        if coerce_value:
-                                            value = date(value)
-                                        else:
-                                            raise errors.CannotCoerceError(
-                                                'value (%s) must be a datetime object, '
-                                                'ISO 8601-formatted string, '
-                                                'or POSIX timestamp' % value
-                                            )
-    # pylint: enable=line-too-long
+        parsed = _parse_iso_datetime(value, allow_date = coerce_value)
+        if parsed is not None:
+            if format_memo is not None:
+                format_memo.format = _iso_datetime_format(value)
+            value = parsed
+        else:
+            value = _strptime_datetime(value, coerce_value, format_memo)
+            if isinstance(value, _Invalid):
+                return value
     elif isinstance(value, numeric_types) and not coerce_value:
-        raise errors.CannotCoerceError(
-            'value (%s) must be a datetime object, '
-            'ISO 8601-formatted string, '
-            'or POSIX timestamp' % value
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a datetime object, '
+                        'ISO 8601-formatted string, '
+                        'or POSIX timestamp', value)
 
     if isinstance(value, datetime_.date) and not isinstance(value, datetime_.datetime):
         if coerce_value:
@@ -910,23 +1508,20 @@ def datetime(value,
                                        0,
                                        0)
         else:
-            raise errors.CannotCoerceError(
-                'value (%s) must be a datetime object, '
-                'ISO 8601-formatted string, '
-                'or POSIX timestamp' % value
-            )
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a datetime object, '
+                            'ISO 8601-formatted string, '
+                            'or POSIX timestamp', value)
 
 
     if minimum and value and value < minimum:
-        raise errors.MinimumValueError(
-            'value (%s) is before the minimum given (%s)' % (value.isoformat(),
-                                                             minimum.isoformat())
-        )
+        return _Invalid(errors.MinimumValueError,
+                        'value (%s) is before the minimum given (%s)',
+                        value.isoformat(), minimum.isoformat())
     if maximum and value and value > maximum:
-        raise errors.MaximumValueError(
-            'value (%s) is after the maximum given (%s)' % (value.isoformat(),
-                                                            maximum.isoformat())
-        )
+        return _Invalid(errors.MaximumValueError,
+                        'value (%s) is after the maximum given (%s)',
+                        value.isoformat(), maximum.isoformat())
 
     return value
 
@@ -937,6 +1532,7 @@ def time(value,
          minimum = None,
          maximum = None,
          coerce_value = True,
+         format_memo = None,
          **kwargs):
     """Validate that ``value`` is a valid :class:`time <python:datetime.time>`.
 
@@ -976,6 +1572,11 @@ def time(value,
       respect direct representations of time. Defaults to ``True``.
     :type coerce_value: :class:`bool <python:bool>`
 
+    :param format_memo: If supplied, the string format that parsed the previous
+      value is tried first, and the format that parses ``value`` is recorded on
+      it. Defaults to :obj:`None <python:None>`.
+    :type format_memo: :class:`FormatMemo` / :obj:`None <python:None>`
+
     :returns: ``value`` in UTC time / :obj:`None <python:None>`
     :rtype: :class:`time <python:datetime.time>` / :obj:`None <python:None>`
 
@@ -988,71 +1589,78 @@ def time(value,
       after ``minimum``
 
     """
-    # pylint: disable=too-many-branches
+    result = _time_core(value,
+                        allow_empty = allow_empty,
+                        minimum = minimum,
+                        maximum = maximum,
+                        coerce_value = coerce_value,
+                        format_memo = format_memo)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _time_core(value,
+               allow_empty = False,
+               minimum = None,
+               maximum = None,
+               coerce_value = True,
+               format_memo = None,
+               **kwargs):
+    """Non-raising core of :func:`time`."""
+    # pylint: disable=too-many-branches, too-many-return-statements
     if not value and not allow_empty:
         if isinstance(value, datetime_.time):
             pass
         else:
-            raise errors.EmptyValueError('value (%s) was empty' % value)
+            return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         if not isinstance(value, datetime_.time):
             return None
 
-    minimum = time(minimum, allow_empty = True, force_run = True)               # pylint: disable=E1123
-    maximum = time(maximum, allow_empty = True, force_run = True)               # pylint: disable=E1123
+    if minimum is not None and not isinstance(minimum, datetime_.time):
+        minimum = time(minimum, allow_empty = True, force_run = True)           # pylint: disable=E1123
+    if maximum is not None and not isinstance(maximum, datetime_.time):
+        maximum = time(maximum, allow_empty = True, force_run = True)           # pylint: disable=E1123
 
     if not isinstance(value, time_types):
-        raise errors.CannotCoerceError(
-            'value (%s) must be a datetime object, '
-            'ISO 8601-formatted string, '
-            'or POSIX timestamp, but was %s' % (value,
-                                                type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a datetime object, '
+                        'ISO 8601-formatted string, '
+                        'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, datetime_.datetime) and not coerce_value:
-        raise errors.CannotCoerceError(
-            'value (%s) must be a datetime object, '
-            'ISO 8601-formatted string, '
-            'or POSIX timestamp, but was %s' % (value,
-                                                type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a datetime object, '
+                        'ISO 8601-formatted string, '
+                        'or POSIX timestamp, but was %s', value, type(value))
     elif isinstance(value, datetime_.datetime) and coerce_value:
         value = value.time()
     elif isinstance(value, timestamp_types):
-        try:
-            datetime_value = datetime(value, force_run = True)                  # pylint: disable=E1123
-            if coerce_value:
-                value = datetime_value.time()
-            else:
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a time object, '
-                    'ISO 8601-formatted string, '
-                    'but was %s' % (value,
-                                    type(value))
-                )
-        except ValueError:
-            raise errors.CannotCoerceError(
-                'value (%s) must be a datetime object, '
-                'ISO 8601-formatted string, '
-                'or POSIX timestamp, but was %s' % (value,
-                                                    type(value))
-            )
+        datetime_value = _datetime_core(value)
+        if isinstance(datetime_value, _Invalid):
+            return datetime_value
+        if not coerce_value:
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a time object, '
+                            'ISO 8601-formatted string, '
+                            'but was %s', value, type(value))
+
+        value = datetime_value.time()
     elif isinstance(value, basestring):
         is_value_calculated = False
         if len(value) > 10:
-            try:
-                datetime_value = datetime(value, force_run = True)              # pylint: disable=E1123
-                if coerce_value:
-                    value = datetime_value.time()
-                else:
-                    raise errors.CannotCoerceError(
-                        'value (%s) must be a time object, '
-                        'ISO 8601-formatted string, '
-                        'but was %s' % (value,
-                                        type(value))
-                    )
-                is_value_calculated = True
-            except ValueError:
-                pass
+            datetime_value = _datetime_core(value, format_memo = format_memo)
+            if isinstance(datetime_value, _Invalid):
+                return datetime_value
+            if not coerce_value:
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a time object, '
+                                'ISO 8601-formatted string, '
+                                'but was %s', value, type(value))
+
+            value = datetime_value.time()
+            is_value_calculated = True
 
         if not is_value_calculated:
             try:
@@ -1082,10 +1690,11 @@ def time(value,
                 else:
                     microseconds = 0
 
-                utc_offset = timezone(utc_offset,                               # pylint: disable=E1123
-                                      allow_empty = True,
-                                      positive = is_offset_positive,
-                                      force_run = True)
+                utc_offset = _timezone_core(utc_offset,
+                                            allow_empty = True,
+                                            positive = is_offset_positive)
+                if isinstance(utc_offset, _Invalid):
+                    raise ValueError()
 
                 value = datetime_.time(hour = hour,
                                        minute = minutes,
@@ -1093,26 +1702,22 @@ def time(value,
                                        microsecond = microseconds,
                                        tzinfo = utc_offset)
             except (ValueError, TypeError, IndexError):
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a datetime object, '
-                    'ISO 8601-formatted string, '
-                    'or POSIX timestamp, but was %s' % (value,
-                                                        type(value))
-                )
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a datetime object, '
+                                'ISO 8601-formatted string, '
+                                'or POSIX timestamp, but was %s', value, type(value))
 
         if value is not None:
             value = value.replace(tzinfo = None)
 
     if minimum is not None and value and value < minimum:
-        raise errors.MinimumValueError(
-            'value (%s) is before the minimum given (%s)' % (value.isoformat(),
-                                                             minimum.isoformat())
-        )
+        return _Invalid(errors.MinimumValueError,
+                        'value (%s) is before the minimum given (%s)',
+                        value.isoformat(), minimum.isoformat())
     if maximum is not None and value and value > maximum:
-        raise errors.MaximumValueError(
-            'value (%s) is after the maximum given (%s)' % (value.isoformat(),
-                                                            maximum.isoformat())
-        )
+        return _Invalid(errors.MaximumValueError,
+                        'value (%s) is after the maximum given (%s)',
+                        value.isoformat(), maximum.isoformat())
 
     return value
 
@@ -1158,21 +1763,34 @@ def timezone(value,
       indicated by ``value`` is actually positive
 
     """
-    # pylint: disable=too-many-branches
+    result = _timezone_core(value,
+                            allow_empty = allow_empty,
+                            positive = positive)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _timezone_core(value,
+                   allow_empty = False,
+                   positive = True,
+                   **kwargs):
+    """Non-raising core of :func:`timezone`."""
+    # pylint: disable=too-many-branches, too-many-return-statements
     original_value = value
 
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, tzinfo_types):
-        raise errors.CannotCoerceError(
-            'value (%s) must be a tzinfo, '
-            'UTC offset in seconds expressed as a number, '
-            'UTC offset expressed as string of form +HH:MM, '
-            'but was %s' % (value, type(value))
-        )
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) must be a tzinfo, '
+                        'UTC offset in seconds expressed as a number, '
+                        'UTC offset expressed as string of form +HH:MM, '
+                        'but was %s', value, type(value))
     elif isinstance(value, datetime_.datetime):
         value = value.tzinfo
     elif isinstance(value, datetime_.date):
@@ -1183,33 +1801,28 @@ def timezone(value,
         return None
     elif isinstance(value, str):
         if '+' not in value and '-' not in value:
-            try:
-                datetime_value = datetime(value, force_run = True)              # pylint: disable=E1123
-                return datetime_value.tzinfo
-            except TypeError:
-                raise errors.CannotCoerceError(
-                    'value (%s) must be a tzinfo, '
-                    'UTC offset in seconds expressed as a number, '
-                    'UTC offset expressed as string of form +HH:MM, '
-                    'but was %s' % (value, type(value))
-                )
+            datetime_value = _datetime_core(value)
+            if isinstance(datetime_value, _Invalid):
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) must be a tzinfo, '
+                                'UTC offset in seconds expressed as a number, '
+                                'UTC offset expressed as string of form +HH:MM, '
+                                'but was %s', value, type(value))
+
+            return datetime_value.tzinfo
         elif '-' in value:
-            try:
-                datetime_value = datetime(value, force_run = True)              # pylint: disable=E1123
+            datetime_value = _datetime_core(value)
+            if not isinstance(datetime_value, _Invalid):
                 return datetime_value.tzinfo
-            except TypeError:
-                pass
 
         if '+' in value and not positive:
-            raise errors.NegativeOffsetMismatchError(
-                'expected a negative UTC offset but value is positive'
-            )
+            return _Invalid(errors.NegativeOffsetMismatchError,
+                            'expected a negative UTC offset but value is positive')
         elif '-' in value and positive and len(value) == 6:
             positive = False
         elif '-' in value and positive:
-            raise errors.PositiveOffsetMismatchError(
-                'expected a positive UTC offset but value is negative'
-            )
+            return _Invalid(errors.PositiveOffsetMismatchError,
+                            'expected a positive UTC offset but value is negative')
 
         if '+' in value:
             value = value[value.find('+'):]
@@ -1220,14 +1833,20 @@ def timezone(value,
 
         offset_components = value.split(':')
         if len(offset_components) != 2:
-            raise errors.CannotCoerceError(
-                'value (%s) must be a tzinfo, '
-                'UTC offset in seconds expressed as a number, '
-                'UTC offset expressed as string of form +HH:MM, '
-                'but was %s' % (value, type(value))
-            )
-        hour = int(offset_components[0])
-        minutes = int(offset_components[1])
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a tzinfo, '
+                            'UTC offset in seconds expressed as a number, '
+                            'UTC offset expressed as string of form +HH:MM, '
+                            'but was %s', value, type(value))
+        try:
+            hour = int(offset_components[0])
+            minutes = int(offset_components[1])
+        except ValueError:
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a tzinfo, '
+                            'UTC offset in seconds expressed as a number, '
+                            'UTC offset expressed as string of form +HH:MM, '
+                            'but was %s', value, type(value))
 
         value = (hour * 60 * 60) + (minutes * 60)
 
@@ -1242,16 +1861,25 @@ def timezone(value,
         elif value == 0:
             return None
 
-        offset = datetime_.timedelta(seconds = value)
+        try:
+            offset = datetime_.timedelta(seconds = value)
+        except OverflowError:
+            return _Invalid(errors.UTCOffsetError,
+                            'value (%s) cannot exceed +/- 24h', original_value)
+        except ValueError:
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) must be a tzinfo, '
+                            'UTC offset in seconds expressed as a number, '
+                            'UTC offset expressed as string of form +HH:MM, '
+                            'but was %s', value, type(value))
         if is_py2:
             value = TimeZone(offset = offset)
         elif is_py3:
             try:
                 value = TimeZone(offset)
             except ValueError:
-                raise errors.UTCOffsetError(
-                    'value (%s) cannot exceed +/- 24h' % original_value
-                )
+                return _Invalid(errors.UTCOffsetError,
+                                'value (%s) cannot exceed +/- 24h', original_value)
         else:
             raise NotImplementedError()
 
@@ -1308,7 +1936,21 @@ def timedelta(value,
       :class:`timedelta <python:datetime.timedelta>` and is not :obj:`None <python:None>`
 
     """
-    # pylint: disable=too-many-branches
+    result = _timedelta_core(value,
+                             allow_empty = allow_empty,
+                             resolution = resolution)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _timedelta_core(value,
+                    allow_empty = False,
+                    resolution = 'seconds',
+                    **kwargs):
+    """Non-raising core of :func:`timedelta`."""
+    # pylint: disable=too-many-branches, too-many-return-statements
     if isinstance(value, datetime_.timedelta):
         return value
 
@@ -1325,33 +1967,39 @@ def timedelta(value,
                           'microseconds']:
         raise ValueError('resolution (%s) not a valid time period resolution' % resolution)
 
-    timedelta_properties = {}
-
-    try:
-        value = numeric(value,
-                        allow_empty = allow_empty,
-                        force_run = True)
+    original_value = value
+    number = _numeric_core(value, allow_empty = allow_empty)
+    if isinstance(number, _Invalid):
+        if not issubclass(number.error_type, errors.CannotCoerceError):
+            return number
+    elif number is None:
+        return None
+    else:
         if resolution == 'years':
             resolution = 'days'
-            value = value * 365
+            number = number * 365
         elif resolution == 'weeks':
             resolution = 'days'
-            value = value * 7
+            number = number * 7
 
-        timedelta_properties[resolution] = value
-        return datetime_.timedelta(**timedelta_properties)
-    except errors.CannotCoerceError:
         try:
-            value = string(value,
-                           allow_empty = allow_empty,
-                           coerce_value = False,
-                           force_run = True)
-        except errors.CannotCoerceError:
-            raise errors.CannotCoerceError('value (%s) could not be coerced to a'
-                                           ' timedelta' % value)
+            return datetime_.timedelta(**{resolution: number})
+        except (ValueError, OverflowError):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) could not be coerced to a timedelta', value)
+
+    value = _string_core(value,
+                         allow_empty = allow_empty,
+                         coerce_value = False)
+    if isinstance(value, _Invalid):
+        if issubclass(value.error_type, errors.CannotCoerceError):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) could not be coerced to a timedelta',
+                            original_value)
+        return value
 
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
@@ -1360,20 +2008,22 @@ def timedelta(value,
     is_valid = TIMEDELTA_REGEX.match(value)
 
     if not is_valid:
-        raise errors.CannotCoerceError('value (%s) could not be coerced to'
-                                       ' a timedelta' % value)
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) could not be coerced to a timedelta', value)
 
     timedelta_properties = is_valid.groupdict(0)
     for key, sub_value in timedelta_properties.items():
-        try:
-            timedelta_properties[key] = numeric(sub_value,
-                                                allow_empty = True,
-                                                force_run = True)
-        except errors.CannotCoerceError:
-            raise errors.CannotCoerceError('value (%s) could not be coerced to a'
-                                           ' timedelta' % value)
+        sub_value = _numeric_core(sub_value, allow_empty = True)
+        if isinstance(sub_value, _Invalid):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) could not be coerced to a timedelta', value)
+        timedelta_properties[key] = sub_value
 
-    return datetime_.timedelta(**timedelta_properties)
+    try:
+        return datetime_.timedelta(**timedelta_properties)
+    except (ValueError, OverflowError):
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) could not be coerced to a timedelta', value)
 
 
 ## NUMBERS
@@ -1414,40 +2064,58 @@ def numeric(value,
     :raises CannotCoerceError: if ``value`` cannot be coerced to a numeric form
 
     """
+    result = _numeric_core(value,
+                           allow_empty = allow_empty,
+                           minimum = minimum,
+                           maximum = maximum)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _numeric_core(value,
+                  allow_empty = False,
+                  minimum = None,
+                  maximum = None,
+                  **kwargs):
+    """Non-raising core of :func:`numeric`."""
     if maximum is None:
         maximum = POSITIVE_INFINITY
-    else:
+    elif not isinstance(maximum, numeric_types):
         maximum = numeric(maximum)
     if minimum is None:
         minimum = NEGATIVE_INFINITY
-    else:
+    elif not isinstance(minimum, numeric_types):
         minimum = numeric(minimum)
 
     if value is None and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif value is not None:
         if isinstance(value, str):
             try:
                 value = float_(value)
             except (ValueError, TypeError):
-                raise errors.CannotCoerceError(
-                    'value (%s) cannot be coerced to a numeric form' % value
-                )
+                return _Invalid(errors.CannotCoerceError,
+                                'value (%s) cannot be coerced to a numeric form',
+                                value)
         elif not isinstance(value, numeric_types):
-            raise errors.CannotCoerceError(
-                'value (%s) is not a numeric type, was %s' % (value,
-                                                              type(value))
-            )
-
-    if value is not None and value > maximum:
-        raise errors.MaximumValueError(
-            'value (%s) exceeds maximum (%s)' % (value, maximum)
-        )
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) is not a numeric type, was %s',
+                            value, type(value))
 
-    if value is not None and value < minimum:
-        raise errors.MinimumValueError(
-            'value (%s) less than minimum (%s)' % (value, minimum)
-        )
+    try:
+        if value is not None and value > maximum:
+            return _Invalid(errors.MaximumValueError,
+                            'value (%s) exceeds maximum (%s)', value, maximum)
+
+        if value is not None and value < minimum:
+            return _Invalid(errors.MinimumValueError,
+                            'value (%s) less than minimum (%s)', value, minimum)
+    except (TypeError, ArithmeticError):
+        return _Invalid(errors.CannotCoerceError,
+                        'value (%s) cannot be compared to minimum (%s) '
+                        'and maximum (%s)', value, minimum, maximum)
 
     return value
 
@@ -1505,18 +2173,43 @@ def integer(value,
       :class:`int <python:int>`
 
     """
-    value = numeric(value,                                                      # pylint: disable=E1123
-                    allow_empty = allow_empty,
-                    minimum = minimum,
-                    maximum = maximum,
-                    force_run = True)
+    result = _integer_core(value,
+                           allow_empty = allow_empty,
+                           coerce_value = coerce_value,
+                           minimum = minimum,
+                           maximum = maximum,
+                           base = base)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _integer_core(value,
+                  allow_empty = False,
+                  coerce_value = False,
+                  minimum = None,
+                  maximum = None,
+                  base = 10,
+                  **kwargs):
+    """Non-raising core of :func:`integer`."""
+    value = _numeric_core(value,
+                          allow_empty = allow_empty,
+                          minimum = minimum,
+                          maximum = maximum)
+    if isinstance(value, _Invalid):
+        return value
 
     if value is not None and hasattr(value, 'is_integer'):
         if value.is_integer():
             return int(value)
 
     if value is not None and coerce_value:
-        float_value = math.ceil(value)
+        try:
+            float_value = math.ceil(value)
+        except (ValueError, OverflowError):
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) cannot be coerced to an integer', value)
         if is_py2:
             value = int(float_value)                                            # pylint: disable=R0204
         elif is_py3:
@@ -1525,9 +2218,9 @@ def integer(value,
         else:
             raise NotImplementedError('Python %s not supported' % os.sys.version)
     elif value is not None and not isinstance(value, integer_types):
-        raise errors.NotAnIntegerError('value (%s) is not an integer-type, '
-                                       'is a %s'% (value, type(value))
-                                      )
+        return _Invalid(errors.NotAnIntegerError,
+                        'value (%s) is not an integer-type, is a %s',
+                        value, type(value))
 
     return value
 
@@ -1562,22 +2255,32 @@ def float(value,
 
     """
     try:
-        value = _numeric_coercion(value,
-                                  coercion_function = float_,
-                                  allow_empty = allow_empty,
-                                  minimum = minimum,
-                                  maximum = maximum)
-    except (errors.EmptyValueError,
-            errors.CannotCoerceError,
-            errors.MinimumValueError,
-            errors.MaximumValueError) as error:
-        raise error
+        result = _float_core(value,
+                             allow_empty = allow_empty,
+                             minimum = minimum,
+                             maximum = maximum)
     except Exception as error:
         raise errors.CannotCoerceError('unable to coerce value (%s) to float, '
                                        'for an unknown reason - please see '
                                        'stack trace' % value)
 
-    return value
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _float_core(value,
+                allow_empty = False,
+                minimum = None,
+                maximum = None,
+                **kwargs):
+    """Non-raising core of :func:`float`."""
+    return _numeric_coercion_core(value,
+                                  coercion_function = float_,
+                                  allow_empty = allow_empty,
+                                  minimum = minimum,
+                                  maximum = maximum)
 
 
 @disable_on_env
@@ -1610,22 +2313,32 @@ def fraction(value,
 
     """
     try:
-        value = _numeric_coercion(value,
-                                  coercion_function = fractions.Fraction,
-                                  allow_empty = allow_empty,
-                                  minimum = minimum,
-                                  maximum = maximum)
-    except (errors.EmptyValueError,
-            errors.CannotCoerceError,
-            errors.MinimumValueError,
-            errors.MaximumValueError) as error:
-        raise error
+        result = _fraction_core(value,
+                                allow_empty = allow_empty,
+                                minimum = minimum,
+                                maximum = maximum)
     except Exception as error:
         raise errors.CannotCoerceError('unable to coerce value (%s) to Fraction, '
                                        'for an unknown reason - please see '
                                        'stack trace' % value)
 
-    return value
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _fraction_core(value,
+                   allow_empty = False,
+                   minimum = None,
+                   maximum = None,
+                   **kwargs):
+    """Non-raising core of :func:`fraction`."""
+    return _numeric_coercion_core(value,
+                                  coercion_function = fractions.Fraction,
+                                  allow_empty = allow_empty,
+                                  minimum = minimum,
+                                  maximum = maximum)
 
 
 @disable_on_env
@@ -1665,31 +2378,42 @@ def decimal(value,
       :class:`Decimal <python:decimal.Decimal>`
 
     """
+    result = _decimal_core(value,
+                           allow_empty = allow_empty,
+                           minimum = minimum,
+                           maximum = maximum)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _decimal_core(value,
+                  allow_empty = False,
+                  minimum = None,
+                  maximum = None,
+                  **kwargs):
+    """Non-raising core of :func:`decimal`."""
     if value is None and allow_empty:
         return None
     elif value is None:
-        raise errors.EmptyValueError('value cannot be None')
+        return _Invalid(errors.EmptyValueError, 'value cannot be None')
 
     if isinstance(value, str):
         try:
             value = decimal_.Decimal(value.strip())
         except decimal_.InvalidOperation:
-            raise errors.CannotCoerceError(
-                'value (%s) cannot be converted to a Decimal' % value
-            )
+            return _Invalid(errors.CannotCoerceError,
+                            'value (%s) cannot be converted to a Decimal', value)
     elif isinstance(value, fractions.Fraction):
-        try:
-            value = float(value, force_run = True)                              # pylint: disable=R0204, E1123
-        except ValueError:
-            raise errors.CannotCoerceError(
-                'value (%s) cannot be converted to a Decimal' % value
-            )
+        value = float(value, force_run = True)                                  # pylint: disable=R0204, E1123
 
-    value = numeric(value,                                                      # pylint: disable=E1123
-                    allow_empty = False,
-                    maximum = maximum,
-                    minimum = minimum,
-                    force_run = True)
+    value = _numeric_core(value,
+                          allow_empty = False,
+                          maximum = maximum,
+                          minimum = minimum)
+    if isinstance(value, _Invalid):
+        return value
 
     if not isinstance(value, decimal_.Decimal):
         value = decimal_.Decimal(value)
@@ -1729,24 +2453,41 @@ def _numeric_coercion(value,
       :class:`SyntaxError <python:SyntaxError>`
 
     """
+    result = _numeric_coercion_core(value,
+                                    coercion_function = coercion_function,
+                                    allow_empty = allow_empty,
+                                    minimum = minimum,
+                                    maximum = maximum)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _numeric_coercion_core(value,
+                           coercion_function = None,
+                           allow_empty = False,
+                           minimum = None,
+                           maximum = None):
+    """Non-raising core of :func:`_numeric_coercion`."""
     if coercion_function is None:
         raise errors.CoercionFunctionEmptyError('coercion_function cannot be empty')
     elif not hasattr(coercion_function, '__call__'):
         raise errors.NotCallableError('coercion_function must be callable')
 
-    value = numeric(value,                                                      # pylint: disable=E1123
-                    allow_empty = allow_empty,
-                    minimum = minimum,
-                    maximum = maximum,
-                    force_run = True)
+    value = _numeric_core(value,
+                          allow_empty = allow_empty,
+                          minimum = minimum,
+                          maximum = maximum)
+    if isinstance(value, _Invalid):
+        return value
 
     if value is not None:
         try:
             value = coercion_function(value)
         except (ValueError, TypeError, AttributeError, IndexError, SyntaxError):
-            raise errors.CannotCoerceError(
-                'cannot coerce value (%s) to desired type' % value
-            )
+            return _Invalid(errors.CannotCoerceError,
+                            'cannot coerce value (%s) to desired type', value)
 
     return value
 
@@ -1774,14 +2515,25 @@ def bytesIO(value,
     :raises NotBytesIOError: if ``value`` is not a :class:`BytesIO <python:io.BytesIO>`
       object.
     """
+    result = _bytesIO_core(value, allow_empty = allow_empty, **kwargs)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _bytesIO_core(value,
+                  allow_empty = False,
+                  **kwargs):
+    """Non-raising core of :func:`bytesIO`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, io.BytesIO):
-        raise errors.NotBytesIOError('value (%s) is not a BytesIO, '
-                                     'is a %s' % (value, type(value)))
+        return _Invalid(errors.NotBytesIOError,
+                        'value (%s) is not a BytesIO, is a %s', value, type(value))
 
     return value
 
@@ -1807,14 +2559,26 @@ def stringIO(value,
     :raises NotStringIOError: if ``value`` is not a :class:`StringIO <python:io.StringIO>`
       object
     """
+    result = _stringIO_core(value, allow_empty = allow_empty, **kwargs)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _stringIO_core(value,
+                   allow_empty = False,
+                   **kwargs):
+    """Non-raising core of :func:`stringIO`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, io.StringIO):
-        raise ValueError('value (%s) is not an io.StringIO object, '
-                         'is a %s' % (value, type(value)))
+        return _Invalid(ValueError,
+                        'value (%s) is not an io.StringIO object, is a %s',
+                        value, type(value))
 
     return value
 
@@ -1840,20 +2604,30 @@ def path(value,
     :raises NotPathlikeError: if ``value`` is not a valid path-like object
 
     """
+    result = _path_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _path_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`path`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if hasattr(os, 'PathLike'):
         if not isinstance(value, (str, bytes, int, os.PathLike)):                    # pylint: disable=E1101
-            raise errors.NotPathlikeError('value (%s) is path-like' % value)
+            return _Invalid(errors.NotPathlikeError, 'value (%s) is path-like', value)
     else:
         if not isinstance(value, int):
             try:
                 os.path.exists(value)
             except TypeError:
-                raise errors.NotPathlikeError('value (%s) is not path-like' % value)
+                return _Invalid(errors.NotPathlikeError,
+                                'value (%s) is not path-like', value)
 
     return value
 
@@ -1882,19 +2656,149 @@ def path_exists(value,
     :raises PathExistsError: if ``value`` does not exist
 
     """
+    result = _path_exists_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _path_exists_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`path_exists`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    value = path(value, force_run = True)                                       # pylint: disable=E1123
+    value = _path_core(value)
+    if isinstance(value, _Invalid):
+        return value
 
-    if not os.path.exists(value):
-        raise errors.PathExistsError('value (%s) not found' % value)
+    if _path_mode(value, kwargs.get('path_modes', None)) is None:
+        return _Invalid(errors.PathExistsError, 'value (%s) not found', value)
 
     return value
 
 
+def _path_mode(value, path_modes = None):
+    """Return the file mode of the path ``value`` (following symbolic links).
+
+    :param path_modes: The file modes already known for some paths (e.g. from a
+      directory listing), keyed by path. Other paths are looked up with
+      :func:`os.stat() <python:os.stat>`, through :data:`STAT_CACHE` if it is
+      enabled.
+    :type path_modes: :class:`dict <python:dict>` / :obj:`None <python:None>`
+
+    :returns: The file mode, or :obj:`None <python:None>` if ``value`` does not
+      exist.
+    :rtype: :class:`int <python:int>` / :obj:`None <python:None>`
+    """
+    if path_modes:
+        mode = path_modes.get(value, None)
+        if mode is not None:
+            return mode
+
+    is_cached = STAT_CACHE.maxsize != 0 and not isinstance(value, integer_types)
+    if is_cached:
+        mode = STAT_CACHE.get(value)
+        if mode is not None:
+            return mode or None
+
+    try:
+        mode = os.stat(value).st_mode
+    except (OSError, ValueError):
+        mode = False
+
+    if is_cached:
+        STAT_CACHE.set(value, mode)
+
+    return mode or None
+
+
+# Directories are only listed when at least this many of the paths being
+# validated are in them: fewer paths are cheaper to look up one by one.
+_LIST_DIRECTORY_MIN_PATHS = 8
+
+
+def _list_path_modes(values):
+    """Find the file modes of the paths in ``values`` by listing each directory
+    that contains several of them once, with
+    :func:`os.scandir() <python:os.scandir>`.
+
+    Paths that are not found in a listing, or that are symbolic links, are left
+    out so that they are looked up with :func:`os.stat() <python:os.stat>`
+    instead. This keeps the results identical to validating each path on its own
+    (e.g. on case-insensitive file systems).
+
+    :returns: The file modes found, keyed by path.
+    :rtype: :class:`dict <python:dict>`
+    """
+    if not hasattr(os, 'fspath'):
+        return {}
+
+    names_by_directory = {}
+    for value in values:
+        try:
+            path = os.fspath(value)
+        except TypeError:
+            continue
+
+        directory, name = os.path.split(path)
+        if name and name not in ('.', '..', b'.', b'..'):
+            names_by_directory.setdefault(directory, {}).setdefault(name, []).append(value)
+
+    path_modes = {}
+    for directory, names in names_by_directory.items():
+        if len(names) < _LIST_DIRECTORY_MIN_PATHS:
+            continue
+
+        if not directory:
+            directory = os.curdir if isinstance(directory, str) else os.curdir.encode()
+
+        try:
+            entries = os.scandir(directory)
+        except (OSError, ValueError):
+            continue
+
+        with entries:
+            for entry in entries:
+                paths = names.get(entry.name, None)
+                if paths is None:
+                    continue
+
+                try:
+                    if entry.is_symlink():
+                        continue
+                    elif entry.is_dir():
+                        mode = stat_.S_IFDIR
+                    elif entry.is_file():
+                        mode = stat_.S_IFREG
+                    else:
+                        mode = entry.stat().st_mode
+                except OSError:
+                    continue
+
+                for value in paths:
+                    path_modes[value] = mode
+
+    return path_modes
+
+
+def stat_cache_info():
+    """Return hit / miss statistics for the cache of file system status results
+    used by the file-related validators.
+
+    :rtype: named tuple with ``hits``, ``misses``, ``maxsize``, and ``currsize``
+    """
+    return STAT_CACHE.info()
+
+
+def clear_stat_cache():
+    """Remove all file system status results from the cache and reset its
+    statistics."""
+    STAT_CACHE.clear()
+
+
 @disable_on_env
 def file_exists(value,
                 allow_empty = False,
@@ -1919,15 +2823,30 @@ def file_exists(value,
     :raises NotAFileError: if ``value`` is not a valid file
 
     """
+    result = _file_exists_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _file_exists_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`file_exists`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    value = path_exists(value, force_run = True)                                # pylint: disable=E1123
+    value = _path_core(value)
+    if isinstance(value, _Invalid):
+        return value
 
-    if not os.path.isfile(value):
-        raise errors.NotAFileError('value (%s) is not a file')
+    mode = _path_mode(value, kwargs.get('path_modes', None))
+    if mode is None:
+        return _Invalid(errors.PathExistsError, 'value (%s) not found', value)
+
+    if not stat_.S_ISREG(mode):
+        return _Invalid(errors.NotAFileError, 'value (%s) is not a file')
 
     return value
 
@@ -1957,15 +2876,31 @@ def directory_exists(value,
     :raises NotADirectoryError: if ``value`` is not a valid directory
 
     """
+    result = _directory_exists_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _directory_exists_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`directory_exists`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    value = path_exists(value, force_run = True)                                # pylint: disable=E1123
+    value = _path_core(value)
+    if isinstance(value, _Invalid):
+        return value
+
+    mode = _path_mode(value, kwargs.get('path_modes', None))
+    if mode is None:
+        return _Invalid(errors.PathExistsError, 'value (%s) not found', value)
 
-    if not os.path.isdir(value):
-        raise errors.NotADirectoryError('value (%s) is not a directory' % value)
+    if not stat_.S_ISDIR(mode):
+        return _Invalid(errors.NotADirectoryError,
+                        'value (%s) is not a directory', value)
 
     return value
 
@@ -2019,20 +2954,34 @@ def readable(value,
     :raises NotAFileError: if ``value`` is not a valid file
     :raises NotReadableError: if ``value`` cannot be opened for reading
 
+    .. note::
+
+      This validator relies on :func:`os.access() <python:os.access>` to check
+      whether ``value`` is readable, rather than opening it, and so shares the
+      limitations described for :func:`writeable`.
+
     """
+    result = _readable_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _readable_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`readable`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    value = file_exists(value, force_run = True)                                # pylint: disable=E1123
+    value = _file_exists_core(value, path_modes = kwargs.get('path_modes', None))
+    if isinstance(value, _Invalid):
+        return value
 
-    try:
-        with open(value, mode='r'):
-            pass
-    except (OSError, IOError):
-        raise errors.NotReadableError('file at %s could not be opened for '
-                                      'reading' % value)
+    if not os.access(value, os.R_OK):
+        return _Invalid(errors.NotReadableError,
+                        'file at %s could not be opened for reading', value)
 
     return value
 
@@ -2107,12 +3056,23 @@ def writeable(value,
     :raises NotWriteableError: if ``value`` cannot be opened for writing
 
     """
+    result = _writeable_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _writeable_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`writeable`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    value = path(value, force_run = True)
+    value = _path_core(value)
+    if isinstance(value, _Invalid):
+        return value
 
     if sys.platform in ['win32', 'cygwin']:
         raise NotImplementedError('not supported on Windows')
@@ -2120,7 +3080,8 @@ def writeable(value,
     is_valid = os.access(value, mode = os.W_OK)
 
     if not is_valid:
-        raise errors.NotWriteableError('writing not allowed for file at %s' % value)
+        return _Invalid(errors.NotWriteableError,
+                        'writing not allowed for file at %s', value)
 
     return value
 
@@ -2188,12 +3149,23 @@ def executable(value,
     :raises NotExecutableError: if ``value`` cannot be executed
 
     """
+    result = _executable_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _executable_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`executable`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
-    value = file_exists(value, force_run = True)
+    value = _file_exists_core(value, path_modes = kwargs.get('path_modes', None))
+    if isinstance(value, _Invalid):
+        return value
 
     if sys.platform in ['win32', 'cygwin']:
         raise NotImplementedError('not supported on Windows')
@@ -2201,16 +3173,136 @@ def executable(value,
     is_valid = os.access(value, mode = os.X_OK)
 
     if not is_valid:
-        raise errors.NotExecutableError('execution not allowed for file at %s' % value)
+        return _Invalid(errors.NotExecutableError,
+                        'execution not allowed for file at %s', value)
 
     return value
 
 
 ## INTERNET-RELATED
 
+class ParsedEmail(namedtuple('ParsedEmail', ['value', 'local_part', 'domain'])):
+    """The components of an email address, returned by :func:`email` when called
+    with ``parsed = True``.
+
+    :ivar value: The validated email address, as :func:`email` would otherwise
+      return it.
+    :vartype value: :class:`str <python:str>`
+
+    :ivar local_part: The part of the address before its last ``@``.
+    :vartype local_part: :class:`str <python:str>`
+
+    :ivar domain: The part of the address after its last ``@``, without the
+      square brackets around an address literal (e.g. ``'192.168.1.1'`` for
+      ``'user@[192.168.1.1]'``).
+    :vartype domain: :class:`str <python:str>`
+
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return self.value
+
+
+class ParsedURL(namedtuple('ParsedURL', ['value',
+                                         'scheme',
+                                         'user_info',
+                                         'host',
+                                         'port',
+                                         'path',
+                                         'query',
+                                         'fragment'])):
+    """The components of a URL, returned by :func:`url` when called with
+    ``parsed = True``.
+
+    :ivar value: The validated URL, as :func:`url` would otherwise return it.
+    :vartype value: :class:`str <python:str>`
+
+    :ivar scheme: The URL's scheme in lower case (e.g. ``'https'``).
+    :vartype scheme: :class:`str <python:str>`
+
+    :ivar user_info: The user information before the host (e.g.
+      ``'user:password'``), or :obj:`None <python:None>` if there is none.
+    :vartype user_info: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :ivar host: The host name or IP address, in lower case.
+    :vartype host: :class:`str <python:str>`
+
+    :ivar port: The port number, or :obj:`None <python:None>` if there is none.
+    :vartype port: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :ivar path: The path, which is empty if there is none.
+    :vartype path: :class:`str <python:str>`
+
+    :ivar query: The query string (less the ``?``), or
+      :obj:`None <python:None>` if there is none.
+    :vartype query: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    :ivar fragment: The fragment (less the ``#``), or :obj:`None <python:None>`
+      if there is none.
+    :vartype fragment: :class:`str <python:str>` / :obj:`None <python:None>`
+
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return self.value
+
+
+class ParsedDomain(namedtuple('ParsedDomain', ['value', 'labels'])):
+    """The components of a domain name, returned by :func:`domain` when called
+    with ``parsed = True``.
+
+    :ivar value: The validated domain name, as :func:`domain` would otherwise
+      return it.
+    :vartype value: :class:`str <python:str>`
+
+    :ivar labels: The period-separated labels of the domain name, from left to
+      right (e.g. ``('www', 'example', 'com')``).
+    :vartype labels: :class:`tuple <python:tuple>` of :class:`str <python:str>`
+
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return self.value
+
+    @property
+    def public_suffix(self):
+        """The domain name's public suffix (e.g. ``'co.uk'`` for
+        ``'www.example.co.uk'``), according to the bundled copy of the
+        `Public Suffix List <https://publicsuffix.org/>`_, or
+        :obj:`None <python:None>` if the value is an IP address.
+
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+        """
+        if self.labels[-1].isdigit():
+            return None
+
+        return '.'.join(self.labels[-public_suffix_length(self.labels):])
+
+    @property
+    def registrable_domain(self):
+        """The public suffix and the label before it (e.g. ``'example.co.uk'``
+        for ``'www.example.co.uk'``), or :obj:`None <python:None>` if the value
+        is an IP address or a public suffix itself.
+
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+        """
+        if self.labels[-1].isdigit():
+            return None
+
+        length = public_suffix_length(self.labels) + 1
+        if length > len(self.labels):
+            return None
+
+        return '.'.join(self.labels[-length:])
+
+
 @disable_on_env
 def email(value,
           allow_empty = False,
+          parsed = False,
           **kwargs):
     """Validate that ``value`` is a valid email address.
 
@@ -2218,15 +3310,15 @@ def email(value,
 
       Email address validation is...complicated. The methodology that we have
       adopted here is *generally* compliant with
-      `RFC 5322 <https://tools.ietf.org/html/rfc5322>`_ and uses a combination of
-      string parsing and regular expressions.
+      `RFC 5322 <https://tools.ietf.org/html/rfc5322>`_ and reads the address
+      in a single left-to-right scan.
 
-      String parsing in particular is used to validate certain *highly unusual*
-      but still valid email patterns, including the use of escaped text and
-      comments within an email address' local address (the user name part).
+      The scan also validates certain *highly unusual* but still valid email
+      patterns, including the use of escaped text and comments within an email
+      address' local address (the user name part).
 
-      This approach ensures more complete coverage for unusual edge cases, while
-      still letting us use regular expressions that perform quickly.
+      Its running time grows linearly with the length of the value, so even very
+      long or malicious values are validated quickly.
 
     :param value: The value to validate.
     :type value: :class:`str <python:str>` / :obj:`None <python:None>`
@@ -2237,142 +3329,520 @@ def email(value,
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
-    :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    :param parsed: If ``True``, returns a :class:`ParsedEmail` holding the local
+      part and domain found while validating ``value``, rather than ``value``
+      itself. Defaults to ``False``.
+    :type parsed: :class:`bool <python:bool>`
+
+    :returns: ``value`` / :class:`ParsedEmail` / :obj:`None <python:None>`
+    :rtype: :class:`str <python:str>` / :class:`ParsedEmail` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises CannotCoerceError: if ``value`` is not a :class:`str <python:str>` or
       :obj:`None <python:None>`
     :raises InvalidEmailError: if ``value`` is not a valid email address or
       empty with ``allow_empty`` set to ``True``
     """
-    # pylint: disable=too-many-branches,too-many-statements,R0914
+    result = _email_core(value, allow_empty = allow_empty, parsed = parsed)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
 
+
+def _email_core(value, allow_empty = False, parsed = False, **kwargs):
+    """Non-raising core of :func:`email`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value must be a valid string, '
-                                       'was %s' % type(value))
-
-    if '@' not in value:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
-    if '(' in value and ')' in value:
-        open_parentheses = value.find('(')
-        close_parentheses = value.find(')') + 1
-
-        if close_parentheses < open_parentheses:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
-
-        commented_value = value[open_parentheses:close_parentheses]
-        value = value.replace(commented_value, '')
-    elif '(' in value:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
-    elif ')' in value:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+        return _Invalid(errors.CannotCoerceError,
+                        'value must be a valid string, was %s', type(value))
+
+    too_long = _check_length('email', value)
+    if too_long is not None:
+        return too_long
+
+    if '(' in value or ')' in value:
+        uncommented_value = _remove_email_comment(value)
+        if uncommented_value is None:
+            return _Invalid(errors.InvalidEmailError,
+                            'value (%s) is not a valid email address', value)
+        value = uncommented_value
+
+    scan = _scan_email(value)
+    if scan is None:
+        return _Invalid(errors.InvalidEmailError,
+                        'value (%s) is not a valid email address', value)
+
+    last_at, match_start, match_end = scan
+    domain_value = value[last_at + 1:]
+    if domain_value.startswith('[') and domain_value.endswith(']'):
+        domain_value = domain_value[1:-1]
+
+    matched_value = value
+    if isinstance(_domain_core(domain_value), _Invalid):
+        if isinstance(_ip_address_core(domain_value), _Invalid):
+            return _Invalid(errors.InvalidEmailError,
+                            'value (%s) is not a valid email address', value)
+
+        # The domain is an IP address: check that the local part (less any @
+        # signs) would make a valid address at an ordinary domain.
+        local_value = value[:last_at].replace('@', '')
+        if '(' in local_value or ')' in local_value:
+            local_value = _remove_email_comment(local_value)
+
+        scan = None
+        if local_value is not None:
+            matched_value = local_value + '@test.com'
+            scan = _scan_email(matched_value)
+        if scan is None:
+            return _Invalid(errors.InvalidEmailError,
+                            'value (%s) is not a valid email address', value)
+
+        _, match_start, match_end = scan
+
+    # The address must run to the end of the value. Any text before it must not
+    # start with punctuation or contain consecutive periods.
+    if match_start < 0 or \
+       match_end != len(matched_value) or \
+       (match_start > 0 and (matched_value[0] in string_.punctuation or
+                             '..' in matched_value[:match_start])):
+        return _Invalid(errors.InvalidEmailError,
+                        'value (%s) is not a valid email address', value)
+
+    if parsed:
+        return ParsedEmail(value, value[:last_at], domain_value)
+
+    return value
+
+
+# Characters permitted in the dot-atoms of an email address' local part.
+_EMAIL_DOT_ATOM_CHARACTERS = string_.ascii_lowercase + string_.digits + \
+                             "!#$%&'*+/=?^_`{|}~-."
+
+# A quoted local part, read for as long as possible. The second group is empty
+# if there is no closing quotation mark.
+_EMAIL_QUOTED_REGEX = re.compile(
+    r'"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*'
+    r'("?)'
+)
+
+# At least two period-separated labels, read for as long as possible.
+_EMAIL_HOST_REGEX = re.compile(
+    r'(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z0-9](?:[a-z0-9-]*[a-z0-9])?'
+)
+
+# The tag of an address literal (e.g. ``[1.2.3.tag:text]``), and its text, read
+# for as long as possible.
+_EMAIL_LITERAL_TAG_REGEX = re.compile(r'[a-z0-9-]*[a-z0-9]:')
+_EMAIL_LITERAL_TEXT_REGEX = re.compile(r'(?:\\[\t ]|[\x01-\x08\x0b\x0c\x0e-\x1f\x21-\x7f])*')
+
+_EMAIL_OCTETS = frozenset(str(octet) for octet in range(256))
 
+
+def _remove_email_comment(value):
+    """Remove the first comment (text in parentheses) from ``value``, along with
+    any repetitions of it.
+
+    :returns: ``value`` without the comment, or :obj:`None <python:None>` if
+      ``value`` does not contain both an opening and a closing parenthesis, or
+      its first closing parenthesis comes too early.
+    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    """
+    open_parenthesis = value.find('(')
+    close_parenthesis = value.find(')') + 1
+    if open_parenthesis < 0 or not close_parenthesis or \
+       close_parenthesis < open_parenthesis:
+        return None
+
+    return value.replace(value[open_parenthesis:close_parenthesis], '')
+
+
+def _scan_email(value):
+    """Scan ``value`` from left to right, checking the placement of its quotation
+    marks, angle brackets and ``@`` signs and finding the first (leftmost) email
+    address in it.
+
+    An email address is a local part (dot-atoms such as ``first.last`` or a
+    quoted string such as ``"first last"``), an ``@`` sign and a domain (see
+    :func:`_email_domain_end`). Each ``@`` sign ends at most one candidate local
+    part, which starts as early as possible, and the text between two ``@``
+    signs is read once.
+
+    :returns: The position of the last ``@`` sign and the start and end of the
+      first address (both ``-1`` if there is none), or :obj:`None <python:None>`
+      if there is no ``@`` sign, if ``value`` has angle brackets that are not
+      enclosed in quotation marks, or if it has more than one ``@`` sign and no
+      quotation mark before the first of them (ignoring an ``@`` sign at the
+      very start).
+    :rtype: :class:`tuple <python:tuple>` of :class:`int <python:int>` /
+      :obj:`None <python:None>`
+    """
+    last_at = value.rfind('@')
+    if last_at < 0:
+        return None
+
+    first_quote = value.find('"') if '"' in value else -1
     if '<' in value or '>' in value:
-        lt_position = value.find('<')
-        gt_position = value.find('>')
-        first_quote_position = -1
-        second_quote_position = -1
-
-        if lt_position >= 0:
-            first_quote_position = value.find('"', 0, lt_position)
-        if gt_position >= 0:
-            second_quote_position = value.find('"', gt_position)
-
-        if first_quote_position < 0 or second_quote_position < 0:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
-
-    at_count = value.count('@')
-    if at_count > 1:
-        last_at_position = 0
-        last_quote_position = 0
-        for x in range(0, at_count):                                            # pylint: disable=W0612
-            at_position = value.find('@', last_at_position + 1)
-            if at_position >= 0:
-                first_quote_position = value.find('"',
-                                                  last_quote_position,
-                                                  at_position)
-                second_quote_position = value.find('"',
-                                                   first_quote_position)
-                if first_quote_position < 0 or second_quote_position < 0:
-                    raise errors.InvalidEmailError(
-                        'value (%s) is not a valid email address' % value
-                    )
-            last_at_position = at_position
-            last_quote_position = second_quote_position
-
-    split_values = value.split('@')
-    if len(split_values) < 2:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
-
-    local_value = ''.join(split_values[:-1])
-    domain_value = split_values[-1]
-    is_domain = False
-    is_ip = False
-    try:
-        if domain_value.startswith('[') and domain_value.endswith(']'):
-            domain_value = domain_value[1:-1]
-        domain(domain_value)
-        is_domain = True
-    except ValueError:
-        is_domain = False
+        first_lt = value.find('<')
+        first_gt = value.find('>')
+        if first_lt < 0 or first_gt < 0 or not 0 <= first_quote < first_lt or \
+           value.rfind('"') < first_gt:
+            return None
 
-    if not is_domain:
-        try:
-            ip_address(domain_value, force_run = True)                          # pylint: disable=E1123
-            is_ip = True
-        except ValueError:
-            is_ip = False
+    first_at = value.find('@')
+    if first_at != last_at and not 0 <= first_quote < value.find('@', 1):
+        return None
 
-    if not is_domain and is_ip:
-        try:
-            email(local_value + '@test.com', force_run = True)                  # pylint: disable=E1123
-        except ValueError:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
+    # The starts of the quoted strings that are followed by an @ sign, keyed by
+    # the position of the @ sign. A closing quotation mark may also open the
+    # next quoted string, but a quotation mark inside a quoted string may not.
+    quoted_starts = {}
+    quote = first_quote
+    while quote >= 0:
+        quoted = _EMAIL_QUOTED_REGEX.match(value, quote)
+        quoted_end = quoted.end()
+        if quoted.group(1):
+            if value.startswith('@', quoted_end):
+                quoted_starts[quoted_end] = quote
+            quote = quoted_end - 1
+        else:
+            quote = value.find('"', quoted_end)
+
+    match_start = match_end = -1
+    literal_text = [0, -1]
+    local_start = 0
+    at = first_at
+    while True:
+        local = quoted_starts.get(at)
+        if local is None:
+            atoms = value[local_start:at]
+            atoms = atoms[len(atoms.rstrip(_EMAIL_DOT_ATOM_CHARACTERS)):]
+            if atoms and not atoms.endswith('.'):
+                if '..' in atoms:
+                    atoms = atoms[atoms.rfind('..') + 2:]
+                local = at - len(atoms.lstrip('.'))
+
+        if local is not None and (match_start < 0 or local < match_start):
+            domain_end = _email_domain_end(value, at + 1, literal_text)
+            if domain_end >= 0:
+                match_start, match_end = local, domain_end
+
+        if at == last_at:
+            return last_at, match_start, match_end
+
+        local_start = at + 1
+        at = value.find('@', local_start)
+
+
+def _email_domain_end(value, start, literal_text):
+    """Return the end of the domain of an email address starting at ``start`` in
+    ``value``, or -1 if there is none.
+
+    The domain is either at least two period-separated labels of lowercase ASCII
+    letters, digits and hyphens (e.g. ``example.com``), read for as long as
+    possible, or an address literal: three octets and either a fourth octet or a
+    tag and some text, in square brackets (e.g. ``[192.168.1.1]`` or
+    ``[1.2.3.tag:text]``).
+
+    :param literal_text: The end of the last address literal text read, and the
+      position of the last closing bracket in it. Updated in place, so that text
+      shared by several address literals is only read once.
+    :type literal_text: :class:`list <python:list>` of :class:`int <python:int>`
+
+    :rtype: :class:`int <python:int>`
+    """
+    if value[start:start + 1] != '[':
+        host = _EMAIL_HOST_REGEX.match(value, start)
+        return host.end() if host else -1
 
-        return value
+    position = start + 1
+    for _ in range(3):
+        period = value.find('.', position, position + 4)
+        if period < 0 or value[position:period] not in _EMAIL_OCTETS:
+            return -1
+        position = period + 1
+
+    close = value.find(']', position, position + 4)
+    if close >= 0 and value[position:close] in _EMAIL_OCTETS:
+        return close + 1
+
+    tag = _EMAIL_LITERAL_TAG_REGEX.match(value, position)
+    if not tag:
+        return -1
+
+    # The text must end in a closing bracket. Text that starts within the last
+    # text read ends where it does.
+    text_start = tag.end()
+    if text_start >= literal_text[0]:
+        text_end = _EMAIL_LITERAL_TEXT_REGEX.match(value, text_start).end()
+        if text_end == text_start:
+            return -1
+        literal_text[:] = [text_end, value.rfind(']', text_start + 1, text_end)]
+
+    if literal_text[1] <= text_start:
+        return -1
+
+    return literal_text[1] + 1
+
+
+# Characters that may not appear in the top-level domain of a URL's host name.
+_URL_TLD_INVALID_CHARACTERS = frozenset('-' + string_.digits)
+
+# The first character after a URL's authority (user information, host and port).
+_URL_AUTHORITY_END_REGEX = re.compile(r'[/?#]')
+
+
+def _is_url_octet(octet, maximum, allow_leading_zero = False):
+    """Indicate whether ``octet`` is an octet of an IPv4 host in a URL: one to
+    three decimal digits no greater than ``maximum``.
+
+    :param maximum: The largest permitted value, as a three-digit string.
+    :type maximum: :class:`str <python:str>`
+
+    :param allow_leading_zero: If ``False``, one- and two-digit octets must start
+      with an ASCII digit other than zero. Defaults to ``False``.
+    :type allow_leading_zero: :class:`bool <python:bool>`
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if not 0 < len(octet) < 4 or not octet.isdecimal():
+        return False
+
+    if len(octet) < 3:
+        return allow_leading_zero or octet[0] in '123456789'
+
+    hundreds, tens, units = octet
+    if hundreds == '1':
+        return True
+    if hundreds != '2' or tens not in string_.digits:
+        return False
+
+    return tens < maximum[1] or \
+        (tens == maximum[1] and units in string_.digits and units <= maximum[2])
+
+
+def _is_url_ipv4(octets, allow_special_ips = False):
+    """Indicate whether the four ``octets`` form an IPv4 address that a URL may
+    use as its host.
+
+    Network (``0``) and broadcast (``255``) addresses and the reserved space from
+    ``224.0.0.0`` are never permitted. Private, loopback and link-local addresses
+    are only permitted if ``allow_special_ips`` is ``True``.
 
-    if not is_domain:
-        raise errors.InvalidEmailError('value (%s) is not a valid email address' % value)
+    :rtype: :class:`bool <python:bool>`
+    """
+    first, second, third, fourth = octets
+    if not (_is_url_octet(first, '223') and
+            _is_url_octet(second, '255', allow_leading_zero = True) and
+            _is_url_octet(third, '255', allow_leading_zero = True) and
+            _is_url_octet(fourth, '254')):
+        return False
+
+    if allow_special_ips:
+        return True
+
+    if first in ('10', '127') or \
+       (first, second) in (('169', '254'), ('192', '168')):
+        return False
+
+    return not (first == '172' and
+                len(second) == 2 and
+                (second[0] == '2' or
+                 (second[0] == '1' and second[1] in '6789') or
+                 (second[0] == '3' and second[1] in '01')))
+
+
+def _is_url_host(value, allow_special_ips = False):
+    """Indicate whether ``value`` may be the host of a URL: a public IPv4 address,
+    a special-use domain name such as ``localhost``, or a host name with a
+    top-level domain.
+
+    :param allow_special_ips: If ``True``, private and loopback IPv4 addresses are
+      accepted, special-use domain names are not, and host names must be in lower
+      case. Defaults to ``False``.
+    :type allow_special_ips: :class:`bool <python:bool>`
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if not allow_special_ips and value in SPECIAL_USE_DOMAIN_NAMES:
+        return True
+
+    labels = value.split('.')
+    if len(labels) == 4 and _is_url_ipv4(labels, allow_special_ips):
+        return True
+
+    if len(labels) < 2:
+        return False
+
+    if allow_special_ips:
+        invalid_character = URL_SPECIAL_IP_HOST_INVALID_CHARACTER_REGEX
     else:
-        is_valid = EMAIL_REGEX.search(value)
-
-        if not is_valid:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
-
-        matched_string = is_valid.group(0)
-        position = value.find(matched_string)
-        if position > 0:
-            prefix = value[:position]
-            if prefix[0] in string_.punctuation:
-                raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                               'address' % value)
-            if '..' in prefix:
-                raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                               'address' % value)
-
-        end_of_match = position + len(matched_string)
-        suffix = value[end_of_match:]
-        if suffix:
-            raise errors.InvalidEmailError('value (%s) is not a valid email '
-                                           'address' % value)
+        invalid_character = URL_HOST_INVALID_CHARACTER_REGEX
 
-    return value
+    if invalid_character.search(value):
+        return False
+
+    top_level_domain = labels.pop()
+    if len(top_level_domain) < 2 or \
+       not _URL_TLD_INVALID_CHARACTERS.isdisjoint(top_level_domain):
+        return False
+
+    for label in labels:
+        if not label or label[0] == '-' or label[-1] == '-':
+            return False
+
+    return True
+
+
+def _is_url_authority(value, start, last_whitespace, allow_special_ips = False):
+    """Indicate whether ``value[start:]`` is a URL's host, optionally followed by
+    a port and a path.
+
+    :param last_whitespace: The index of the last whitespace character in
+      ``value``, or ``-1``. Paths may not contain whitespace.
+    :type last_whitespace: :class:`int <python:int>`
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    delimiter = URL_AUTHORITY_DELIMITER_REGEX.search(value, start)
+    if delimiter is None:
+        return _is_url_host(value[start:], allow_special_ips)
+
+    host_end = delimiter.start()
+    if value[host_end] == '@' or \
+       not _is_url_host(value[start:host_end], allow_special_ips):
+        return False
+
+    path_start = host_end
+    if value[host_end] == ':':
+        path_start = value.find('/', host_end + 1, host_end + 7)
+        if path_start == -1:
+            path_start = len(value)
+
+        port = value[host_end + 1:path_start]
+        if not 1 < len(port) < 6 or not port.isdecimal():
+            return False
+
+    return path_start > last_whitespace
+
+
+def _is_url(value, allow_special_ips = False):
+    """Indicate whether ``value`` is an ``http``, ``https`` or ``ftp`` URL.
+
+    The URL is tokenized in a single pass into its scheme, optional user
+    information (ending in ``@``), host, optional port and optional path, and
+    each component is checked on its own.
+
+    The user information may itself contain ``@``, so each ``@`` before the first
+    whitespace character is tried in turn as its end. A host never contains
+    ``@``, so the hosts checked for each candidate do not overlap and the whole
+    check remains linear in the length of ``value``.
+
+    :param allow_special_ips: If ``True``, private and loopback IPv4 hosts are
+      accepted. Defaults to ``False``.
+    :type allow_special_ips: :class:`bool <python:bool>`
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    for protocol in URL_PROTOCOLS:
+        if value.startswith(protocol):
+            value = value[len(protocol):]
+            break
+    else:
+        return False
+
+    # A single trailing newline has always been tolerated.
+    if value.endswith('\n'):
+        value = value[:-1]
+
+    whitespace = WHITESPACE_REGEX.search(value)
+    if whitespace is None:
+        first_whitespace = len(value)
+        last_whitespace = -1
+    else:
+        first_whitespace = whitespace.start()
+        last_whitespace = len(value) - 1 - \
+            WHITESPACE_REGEX.search(value[::-1]).start()
+
+    if _is_url_authority(value, 0, last_whitespace, allow_special_ips):
+        return True
+
+    userinfo_end = value.find('@', 1)
+    while -1 < userinfo_end < first_whitespace:
+        if _is_url_authority(value,
+                             userinfo_end + 1,
+                             last_whitespace,
+                             allow_special_ips):
+            return True
+
+        userinfo_end = value.find('@', userinfo_end + 1)
+
+    return False
+
+
+def _parse_url(value):
+    """Split ``value``, a valid URL, into its components.
+
+    :rtype: :class:`ParsedURL`
+    """
+    url_value = value
+    if url_value.endswith('\n'):
+        url_value = url_value[:-1]
+
+    scheme_end = url_value.find('://')
+    authority_start = scheme_end + 3
+    delimiter = _URL_AUTHORITY_END_REGEX.search(url_value, authority_start)
+    if delimiter is None:
+        authority_end = len(url_value)
+    else:
+        authority_end = delimiter.start()
+
+    user_info = None
+    host_start = url_value.rfind('@', authority_start, authority_end)
+    if host_start == -1:
+        host_start = authority_start
+    else:
+        user_info = url_value[authority_start:host_start]
+        host_start += 1
+
+    port = None
+    host_end = url_value.find(':', host_start, authority_end)
+    if host_end == -1:
+        host_end = authority_end
+    elif url_value[host_end + 1:authority_end].isdecimal():
+        port = int(url_value[host_end + 1:authority_end])
+
+    path = url_value[authority_end:]
+    fragment = None
+    if '#' in path:
+        path, fragment = path.split('#', 1)
+
+    query = None
+    if '?' in path:
+        path, query = path.split('?', 1)
+
+    return ParsedURL(value,
+                     url_value[:scheme_end].lower(),
+                     user_info,
+                     url_value[host_start:host_end].lower(),
+                     port,
+                     path,
+                     query,
+                     fragment)
 
 
 @disable_on_env
 def url(value,
         allow_empty = False,
         allow_special_ips = False,
+        parsed = False,
         **kwargs):
     """Validate that ``value`` is a valid URL.
 
@@ -2382,11 +3852,11 @@ def url(value,
       adopted here is *generally* compliant with
       `RFC 1738 <https://tools.ietf.org/html/rfc1738>`_,
       `RFC 6761 <https://tools.ietf.org/html/rfc6761>`_,
-      `RFC 2181 <https://tools.ietf.org/html/rfc2181>`_  and uses a combination of
-      string parsing and regular expressions,
+      `RFC 2181 <https://tools.ietf.org/html/rfc2181>`_.
 
-      This approach ensures more complete coverage for unusual edge cases, while
-      still letting us use regular expressions that perform quickly.
+      The URL is split into its scheme, user information, host, port and path in
+      a single pass and each component is checked on its own, so validation time
+      grows linearly with the length of ``value``.
 
     :param value: The value to validate.
     :type value: :class:`str <python:str>` / :obj:`None <python:None>`
@@ -2403,26 +3873,52 @@ def url(value,
       to ``False``.
     :type allow_special_ips: :class:`bool <python:bool>`
 
-    :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    :param parsed: If ``True``, returns a :class:`ParsedURL` holding the scheme,
+      user information, host, port, path, query and fragment of ``value``,
+      rather than ``value`` itself. Defaults to ``False``.
+    :type parsed: :class:`bool <python:bool>`
+
+    :returns: ``value`` / :class:`ParsedURL` / :obj:`None <python:None>`
+    :rtype: :class:`str <python:str>` / :class:`ParsedURL` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises CannotCoerceError: if ``value`` is not a :class:`str <python:str>` or
       :obj:`None <python:None>`
     :raises InvalidURLError: if ``value`` is not a valid URL or
       empty with ``allow_empty`` set to ``True``
 
     """
-    is_recursive = kwargs.pop('is_recursive', False)
+    result = _url_core(value,
+                       allow_empty = allow_empty,
+                       allow_special_ips = allow_special_ips,
+                       parsed = parsed)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
 
+def _url_core(value,
+              allow_empty = False,
+              allow_special_ips = False,
+              parsed = False,
+              **kwargs):
+    """Non-raising core of :func:`url`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value must be a valid string, '
-                                       'was %s' % type(value))
+        return _Invalid(errors.CannotCoerceError,
+                        'value must be a valid string, was %s', type(value))
+
+    too_long = _check_length('url', value)
+    if too_long is not None:
+        return too_long
 
     is_valid = False
     lowercase_value = value.lower()
@@ -2449,24 +3945,15 @@ def url(value,
                     if path_index > -1:
                         lowercase_stripped_value = lowercase_stripped_value[:path_index]
 
-                if lowercase_stripped_value:
-                    try:
-                        domain(lowercase_stripped_value,
-                               allow_empty = False,
-                               is_recursive = is_recursive)
-                        is_valid = True
-                    except (ValueError, TypeError):
-                        pass
+                if lowercase_stripped_value and \
+                   not isinstance(_domain_core(lowercase_stripped_value), _Invalid):
+                    is_valid = True
 
     if not is_valid and allow_special_ips:
-        try:
-            ip_address(stripped_value, allow_empty = False)
-            is_valid = True
-        except (ValueError, TypeError):
-            pass
+        is_valid = not isinstance(_ip_address_core(stripped_value), _Invalid)
 
     if not is_valid:
-        is_valid = URL_REGEX.match(lowercase_value)
+        is_valid = _is_url(lowercase_value)
 
     if is_valid:
         prefix_index = value.find('@')
@@ -2490,20 +3977,19 @@ def url(value,
             if path_index > -1:
                 stripped_prefix = stripped_prefix[:path_index]
 
-        try:
-            domain(stripped_prefix,
-                   allow_empty = False,
-                   is_recursive = is_recursive)
-        except (ValueError, TypeError):
-            for character in URL_UNSAFE_CHARACTERS:
-                if character in stripped_prefix:
-                    raise errors.InvalidURLError('value (%s) is not a valid URL' % value)
+        for character in URL_UNSAFE_CHARACTERS:
+            if character in stripped_prefix:
+                return _Invalid(errors.InvalidURLError,
+                                'value (%s) is not a valid URL', value)
 
     if not is_valid and allow_special_ips:
-        is_valid = URL_SPECIAL_IP_REGEX.match(value)
+        is_valid = _is_url(value, allow_special_ips = True)
 
     if not is_valid:
-        raise errors.InvalidURLError('value (%s) is not a valid URL' % value)
+        return _Invalid(errors.InvalidURLError, 'value (%s) is not a valid URL', value)
+
+    if parsed:
+        return _parse_url(value)
 
     return value
 
@@ -2512,6 +3998,9 @@ def url(value,
 def domain(value,
            allow_empty = False,
            allow_ips = False,
+           strict = False,
+           idna = False,
+           parsed = False,
            **kwargs):
     """Validate that ``value`` is a valid domain name.
 
@@ -2554,10 +4043,36 @@ def domain(value,
       address. Defaults to ``False``.
     :type allow_ips: :class:`bool <python:bool>`
 
-    :returns: ``value`` / :obj:`None <python:None>`
-    :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+    :param strict: If ``True``, will raise a :class:`UnknownTopLevelDomainError`
+      if ``value`` does not end in a top-level domain on the bundled copy of the
+      `Public Suffix List <https://publicsuffix.org/>`_ (e.g.
+      ``foo.notarealtld``). Special-use domain names (e.g. ``localhost``) and IP
+      addresses allowed by ``allow_ips`` are still accepted. Defaults to
+      ``False``.
+    :type strict: :class:`bool <python:bool>`
+
+    :param idna: If ``True``, checks that every internationalized label of
+      ``value`` can be converted to or from its ASCII (``xn--``) form under
+      `IDNA <https://tools.ietf.org/html/rfc3490>`_, and returns ``value``
+      converted to ASCII (e.g. ``'xn--e1afmkfd.xn--p1ai'`` for
+      ``'пример.рф'``). Conversions are cached in :data:`IDNA_CACHE`, so
+      repeated host names are only converted once. Defaults to ``False``.
+    :type idna: :class:`bool <python:bool>`
+
+    :param parsed: If ``True``, returns a :class:`ParsedDomain` holding the
+      labels of ``value``, rather than ``value`` itself. Its
+      :attr:`public_suffix <ParsedDomain.public_suffix>` and
+      :attr:`registrable_domain <ParsedDomain.registrable_domain>` are looked up
+      in the bundled Public Suffix List. Defaults to ``False``.
+    :type parsed: :class:`bool <python:bool>`
+
+    :returns: ``value`` / :class:`ParsedDomain` / :obj:`None <python:None>`
+    :rtype: :class:`str <python:str>` / :class:`ParsedDomain` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises CannotCoerceError: if ``value`` is not a :class:`str <python:str>` or
       :obj:`None <python:None>`
     :raises InvalidDomainError: if ``value`` is not a valid domain name or
@@ -2566,65 +4081,162 @@ def domain(value,
     :raises AtInDomainError: if ``value`` contains an ``@`` symbol
     :raises ColonInDomainError: if ``value`` contains a ``:`` symbol
     :raises WhitespaceInDomainError: if ``value`` contains whitespace
+    :raises UnknownTopLevelDomainError: if ``strict`` is ``True`` and ``value``
+      does not end in a known top-level domain
 
     """
+    result = _domain_core(value,
+                          allow_empty = allow_empty,
+                          allow_ips = allow_ips,
+                          strict = strict,
+                          idna = idna,
+                          parsed = parsed,
+                          **kwargs)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _domain_core(value,
+                 allow_empty = False,
+                 allow_ips = False,
+                 strict = False,
+                 idna = False,
+                 parsed = False,
+                 **kwargs):
+    """Non-raising core of :func:`domain`."""
     is_recursive = kwargs.pop('is_recursive', False)
-    has_unsafe_characters = False
 
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value must be a valid string, '
-                                       'was %s' % type(value))
+        return _Invalid(errors.CannotCoerceError,
+                        'value must be a valid string, was %s', type(value))
+
+    too_long = _check_length('domain', value)
+    if too_long is not None:
+        return too_long
 
     if '/' in value:
-        raise errors.SlashInDomainError('valid domain name cannot contain "/"')
+        return _Invalid(errors.SlashInDomainError,
+                        'valid domain name cannot contain "/"')
     if '\\' in value:
-        raise errors.SlashInDomainError('valid domain name cannot contain "\\"')
+        return _Invalid(errors.SlashInDomainError,
+                        'valid domain name cannot contain "\\"')
     if '@' in value:
-        raise errors.AtInDomainError('valid domain name cannot contain "@"')
+        return _Invalid(errors.AtInDomainError,
+                        'valid domain name cannot contain "@"')
     if ':' in value:
-        raise errors.ColonInDomainError('valid domain name cannot contain ":"')
+        return _Invalid(errors.ColonInDomainError,
+                        'valid domain name cannot contain ":"')
 
     value = value.strip().lower()
 
     for item in string_.whitespace:
         if item in value:
-            raise errors.WhitespaceInDomainError('valid domain name cannot contain '
-                                                 'whitespace')
+            return _Invalid(errors.WhitespaceInDomainError,
+                            'valid domain name cannot contain whitespace')
+
+    if idna:
+        ascii_value = _idna_encode(value)
+        if not ascii_value:
+            return _Invalid(errors.InvalidDomainError,
+                            'value (%s) is not a valid internationalized domain',
+                            value)
+        value = ascii_value
+
+    is_reserved = value in SPECIAL_USE_DOMAIN_NAMES or \
+                  (allow_ips and
+                   not isinstance(_ip_address_core(value, allow_empty = allow_empty),
+                                  _Invalid))
+
+    is_valid = is_reserved
+    if not is_valid:
+        for character in URL_UNSAFE_CHARACTERS:
+            if character in value:
+                return _Invalid(errors.InvalidDomainError,
+                                'value (%s) is not a valid domain', value)
 
-    if value in SPECIAL_USE_DOMAIN_NAMES:
-        return value
+        is_valid = DOMAIN_REGEX.match(value)
 
-    if allow_ips:
-        try:
-            ip_address(value, allow_empty = allow_empty)
-            is_valid = True
-        except (ValueError, TypeError, AttributeError):
-            is_valid = False
+    # Anything that is a valid URL host on its own (e.g. 'a.b--c.de') is also
+    # accepted as a domain.
+    if not is_valid and not is_recursive:
+        is_valid = _is_url_host(value)
+
+    if not is_valid:
+        return _Invalid(errors.InvalidDomainError,
+                        'value (%s) is not a valid domain', value)
+
+    if strict and not is_reserved and \
+       not is_top_level_domain(value[value.rfind('.') + 1:]):
+        return _Invalid(errors.UnknownTopLevelDomainError,
+                        'value (%s) does not end in a known top-level domain', value)
+
+    if parsed:
+        return ParsedDomain(value, tuple(value.split('.')))
+
+    return value
+
+
+def _idna_encode(value):
+    """Convert the (lower case) domain name ``value`` to its ASCII form under
+    IDNA, checking that each of its ``xn--`` labels decodes.
+
+    Domain names that are already ASCII and have no ``xn--`` labels are returned
+    as they are. Others are converted once and then served from
+    :data:`IDNA_CACHE`.
 
-        if is_valid:
+    :returns: The ASCII form of ``value``, or an empty string if ``value`` cannot
+      be converted.
+    :rtype: :class:`str <python:str>`
+    """
+    try:
+        value.encode('ascii')
+        if 'xn--' not in value:
             return value
+    except UnicodeError:
+        pass
 
-    for character in URL_UNSAFE_CHARACTERS:
-        if character in value:
-            raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
+    ascii_value = IDNA_CACHE.get(value)
+    if ascii_value is not None:
+        return ascii_value
 
-    is_valid = DOMAIN_REGEX.match(value)
+    ascii_labels = []
+    try:
+        for label in value.split('.'):
+            if label.startswith('xn--'):
+                idna_.ToUnicode(label)
+                ascii_labels.append(label)
+            elif label:
+                ascii_labels.append(idna_.ToASCII(label).decode('ascii'))
+            else:
+                ascii_labels.append(label)
+        ascii_value = '.'.join(ascii_labels)
+    except UnicodeError:
+        ascii_value = ''
 
-    if not is_valid and not is_recursive:
-        with_prefix = 'http://' + value
-        try:
-            url(with_prefix, force_run = True, is_recursive = True)                                  # pylint: disable=E1123
-        except ValueError:
-            raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
-    elif not is_valid:
-        raise errors.InvalidDomainError('value (%s) is not a valid domain' % value)
+    IDNA_CACHE.set(value, ascii_value)
 
-    return value
+    return ascii_value
+
+
+def idna_cache_info():
+    """Return hit / miss statistics for the cache of ASCII domain names used by
+    :func:`domain() <validator_collection.validators.domain>`.
+
+    :rtype: named tuple with ``hits``, ``misses``, ``maxsize``, and ``currsize``
+    """
+    return IDNA_CACHE.info()
+
+
+def clear_idna_cache():
+    """Remove all ASCII domain names from the cache and reset its statistics."""
+    IDNA_CACHE.clear()
 
 
 @disable_on_env
@@ -2635,8 +4247,8 @@ def ip_address(value,
 
     .. note::
 
-      First, the validator will check if the address is a valid IPv6 address.
-      If that doesn't work, the validator will check if the address is a valid
+      If ``value`` contains a colon, the validator will check if the address is
+      a valid IPv6 address. Otherwise, it will check if the address is a valid
       IPv4 address.
 
       If neither works, the validator will raise an error (as always).
@@ -2652,36 +4264,50 @@ def ip_address(value,
     :returns: ``value`` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises InvalidIPAddressError: if ``value`` is not a valid IP address or empty with
       ``allow_empty`` set to ``True``
 
     """
+    result = _ip_address_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _ip_address_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`ip_address`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if is_py2 and value and isinstance(value, unicode):
         value = value.encode('utf-8')
 
-    try:
-        value = ipv6(value, force_run = True)                                   # pylint: disable=E1123
-        ipv6_failed = False
-    except ValueError:
-        ipv6_failed = True
+    if isinstance(value, basestring):
+        too_long = _check_length('ip_address', value)
+        if too_long is not None:
+            return too_long
 
-    if ipv6_failed:
-        try:
-            value = ipv4(value, force_run = True)                               # pylint: disable=E1123
-        except ValueError:
-            raise errors.InvalidIPAddressError('value (%s) is not a valid IPv6 or '
-                                               'IPv4 address' % value)
+    # An IPv6 address always contains a colon and an IPv4 address never does,
+    # so only one of the two needs to be checked.
+    if isinstance(value, str) and ':' in value:
+        result = _ipv6_core(value)
+    else:
+        result = _ipv4_core(value)
 
-    return value
+    if isinstance(result, _Invalid):
+        return _Invalid(errors.InvalidIPAddressError,
+                        'value (%s) is not a valid IPv6 or IPv4 address', value)
+
+    return result
 
 
 @disable_on_env
-def ipv4(value, allow_empty = False):
+def ipv4(value, allow_empty = False, output = 'string'):
     """Validate that ``value`` is a valid IP version 4 address.
 
     :param value: The value to validate.
@@ -2692,36 +4318,208 @@ def ipv4(value, allow_empty = False):
       if ``value`` is empty. Defaults to ``False``.
     :type allow_empty: :class:`bool <python:bool>`
 
+    :param output: What to return for a valid ``value``. Accepts:
+
+      * ``'string'`` - returns ``value`` unchanged (the default)
+      * ``'integer'`` - returns the address as a 32-bit
+        :class:`int <python:int>` (e.g. ``3232235777`` for ``'192.168.1.1'``)
+      * ``'ipaddress'`` - returns an
+        :class:`IPv4Address <python:ipaddress.IPv4Address>`
+
+    :type output: :class:`str <python:str>`
+
     :returns: ``value`` / :obj:`None <python:None>`
+    :rtype: :class:`str <python:str>` / :class:`int <python:int>` /
+      :class:`IPv4Address <python:ipaddress.IPv4Address>` /
+      :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises InvalidIPAddressError: if ``value`` is not a valid IP version 4 address or
       empty with ``allow_empty`` set to ``True``
+    :raises ValidatorUsageError: if ``output`` is not a supported value
     """
-    if not value and allow_empty is False:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
-    elif not value:
-        return None
+    _ipv4_output(output)
+    result = _ipv4_core(value, allow_empty = allow_empty, output = output)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _ipv4_output(output):
+    """Return ``output`` if it is a supported ``output`` for :func:`ipv4`.
+
+    :raises ValidatorUsageError: if ``output`` is not a supported value
+    """
+    if output not in ('string', 'integer', 'ipaddress'):
+        raise errors.ValidatorUsageError(
+            'output (%s) must be "string", "integer" or "ipaddress"' % output
+        )
+
+    return output
+
+
+def _parse_ipv4(value):
+    """Convert the dotted-quad string ``value`` to its 32-bit integer.
 
+    Each of the four octets must consist solely of digits (leading zeros are
+    permitted) and be no greater than 255.
+
+    :returns: The address as an :class:`int <python:int>`, or
+      :obj:`None <python:None>` if ``value`` is not a valid IPv4 address.
+    :rtype: :class:`int <python:int>` / :obj:`None <python:None>`
+    """
     try:
         components = value.split('.')
-    except AttributeError:
-        raise errors.InvalidIPAddressError('value (%s) is not a valid ipv4' % value)
+    except (AttributeError, TypeError):
+        return None
 
-    if len(components) != 4 or not all(x.isdigit() for x in components):
-        raise errors.InvalidIPAddressError('value (%s) is not a valid ipv4' % value)
+    if len(components) != 4:
+        return None
 
-    for x in components:
+    result = 0
+    for component in components:
+        if not component.isdigit():
+            return None
         try:
-            x = integer(x,
-                        minimum = 0,
-                        maximum = 255)
+            octet = int(component)
         except ValueError:
-            raise errors.InvalidIPAddressError('value (%s) is not a valid ipv4' % value)
+            return None
+        if octet > 255:
+            return None
+
+        result = (result << 8) | octet
+
+    return result
+
+
+def _ipv4_core(value, allow_empty = False, output = 'string'):
+    """Non-raising core of :func:`ipv4`."""
+    if not value and allow_empty is False:
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
+    elif not value:
+        return None
+
+    if isinstance(value, basestring):
+        too_long = _check_length('ipv4', value)
+        if too_long is not None:
+            return too_long
+
+    packed = _parse_ipv4(value)
+    if packed is None:
+        return _Invalid(errors.InvalidIPAddressError,
+                        'value (%s) is not a valid ipv4', value)
+
+    if output == 'integer':
+        return packed
+    elif output == 'ipaddress':
+        import ipaddress
+        return ipaddress.IPv4Address(packed)
 
     return value
 
 
+_HEXTET_CHARACTERS = '0123456789abcdef'
+_ZONE_ID_CHARACTERS = string_.ascii_lowercase + string_.digits + '-._~'
+
+# The longest valid IPv6 address, excluding any zone ID
+# (e.g. 'ffff:ffff:ffff:ffff:ffff:ffff:255.255.255.255').
+_IPV6_MAX_LENGTH = 45
+
+
+def _is_ipv4_octets(value):
+    """Indicate whether ``value`` is a dotted-quad IPv4 address embedded in an IPv6
+    address: four decimal octets, each no greater than 255 and without leading
+    zeros."""
+    octets = value.split('.')
+    if len(octets) != 4:
+        return False
+
+    for octet in octets:
+        if not octet or len(octet) > 3 or octet.strip(string_.digits):
+            return False
+        if len(octet) > 1 and (octet[0] == '0' or int(octet) > 255):
+            return False
+
+    return True
+
+
+def _is_zone_id(value):
+    """Indicate whether ``value`` is an IPv6 zone ID in its URI form
+    (:rfc:`6874`): ``%25`` followed by unreserved or percent-encoded
+    characters."""
+    if len(value) < 4 or not value.startswith('%25'):
+        return False
+
+    # Every '%' after the first must start a percent-encoded octet.
+    parts = value[3:].split('%')
+    if parts[0].strip(_ZONE_ID_CHARACTERS):
+        return False
+
+    for part in parts[1:]:
+        if len(part) < 2 or part[:2].strip(_HEXTET_CHARACTERS) or \
+           part[2:].strip(_ZONE_ID_CHARACTERS):
+            return False
+
+    return True
+
+
+def _is_ipv6(value):
+    """Indicate whether the lower-cased string ``value`` is a valid IPv6 address
+    (:rfc:`4291`), optionally followed by a zone ID.
+
+    The address is tokenized in a single pass: it is split into colon-separated
+    groups on either side of at most one ``::``, each group is checked as a
+    hextet (or, in the last position, an embedded IPv4 address), and the number
+    of groups is checked against the compression.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    zone_start = value.find('%')
+    if zone_start != -1:
+        zone_id = value[zone_start:]
+        value = value[:zone_start]
+    else:
+        zone_id = None
+
+    if len(value) > _IPV6_MAX_LENGTH:
+        return False
+
+    head, separator, tail = value.partition('::')
+    if separator:
+        if '::' in tail:
+            return False
+        groups = head.split(':') if head else []
+        tail_groups = tail.split(':') if tail else []
+        groups.extend(tail_groups)
+        has_ipv4 = bool(tail_groups) and '.' in tail_groups[-1]
+    else:
+        groups = value.split(':')
+        has_ipv4 = '.' in groups[-1]
+
+    if has_ipv4:
+        if not _is_ipv4_octets(groups.pop()):
+            return False
+        group_count = len(groups) + 2
+    else:
+        group_count = len(groups)
+
+    if separator:
+        if group_count > 7:
+            return False
+    elif group_count != 8:
+        return False
+
+    if groups and ('' in groups or
+                   max(map(len, groups)) > 4 or
+                   ''.join(groups).strip(_HEXTET_CHARACTERS)):
+        return False
+
+    return zone_id is None or _is_zone_id(zone_id)
+
+
 @disable_on_env
 def ipv6(value,
          allow_empty = False,
@@ -2739,24 +4537,39 @@ def ipv6(value,
     :returns: ``value`` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises InvalidIPAddressError: if ``value`` is not a valid IP version 6 address or
       empty with ``allow_empty`` is not set to ``True``
 
     """
+    result = _ipv6_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _ipv6_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`ipv6`."""
     if not value and allow_empty is False:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, str):
-        raise errors.InvalidIPAddressError('value (%s) is not a valid ipv6' % value)
+        return _Invalid(errors.InvalidIPAddressError,
+                        'value (%s) is not a valid ipv6', value)
 
-    value = value.lower().strip()
+    too_long = _check_length('ipv6', value)
+    if too_long is not None:
+        return too_long
 
-    is_valid = IPV6_REGEX.match(value)
+    value = value.lower().strip()
 
-    if not is_valid:
-        raise errors.InvalidIPAddressError('value (%s) is not a valid ipv6' % value)
+    if not _is_ipv6(value):
+        return _Invalid(errors.InvalidIPAddressError,
+                        'value (%s) is not a valid ipv6', value)
 
     return value
 
@@ -2780,20 +4593,35 @@ def mac_address(value,
     :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises CannotCoerceError: if ``value`` is not a valid :class:`str <python:str>`
       or string-like object
     :raises InvalidMACAddressError: if ``value`` is not a valid MAC address or empty with
       ``allow_empty`` set to ``True``
 
     """
+    result = _mac_address_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _mac_address_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`mac_address`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value must be a valid string, '
-                                       'was %s' % type(value))
+        return _Invalid(errors.CannotCoerceError,
+                        'value must be a valid string, was %s', type(value))
+
+    too_long = _check_length('mac_address', value)
+    if too_long is not None:
+        return too_long
 
     if '-' in value:
         value = value.replace('-', ':')
@@ -2803,8 +4631,8 @@ def mac_address(value,
     is_valid = MAC_ADDRESS_REGEX.match(value)
 
     if not is_valid:
-        raise errors.InvalidMACAddressError('value (%s) is not a valid MAC '
-                                            'address' % value)
+        return _Invalid(errors.InvalidMACAddressError,
+                        'value (%s) is not a valid MAC address', value)
 
     return value
 
@@ -2828,27 +4656,820 @@ def mimetype(value,
     :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
 
     :raises EmptyValueError: if ``value`` is empty and ``allow_empty`` is ``False``
+    :raises MaximumLengthError: if ``value`` is longer than the limit set for this
+      validator with :func:`set_max_length` or :func:`harden`
     :raises CannotCoerceError: if ``value`` is not a valid string
     :raises InvalidMimeTypeError: if ``value`` is neither a valid MIME type nor empty
       with ``allow_empty`` set to ``True``
 
     """
+    result = _mimetype_core(value, allow_empty = allow_empty)
+    if isinstance(result, _Invalid):
+        raise result.error()
+
+    return result
+
+
+def _mimetype_core(value, allow_empty = False, **kwargs):
+    """Non-raising core of :func:`mimetype`."""
     if not value and not allow_empty:
-        raise errors.EmptyValueError('value (%s) was empty' % value)
+        return _Invalid(errors.EmptyValueError, 'value (%s) was empty', value)
     elif not value:
         return None
 
     if not isinstance(value, basestring):
-        raise errors.CannotCoerceError('value must be a valid string, '
-                                       'was %s' % type(value))
+        return _Invalid(errors.CannotCoerceError,
+                        'value must be a valid string, was %s', type(value))
+
+    too_long = _check_length('mimetype', value)
+    if too_long is not None:
+        return too_long
 
     value = value.lower().strip()
 
     is_valid = MIME_TYPE_REGEX.fullmatch(value)
 
     if not is_valid:
-        raise errors.InvalidMimeTypeError(
-            'value (%s) is not a valid MIME Type' % value
-        )
+        return _Invalid(errors.InvalidMimeTypeError,
+                        'value (%s) is not a valid MIME Type', value)
 
     return value
+
+
+## BATCH
+
+class BatchResult(namedtuple('BatchResult', ['values', 'errors'])):
+    """The result of a batch validation run with ``collect_errors = True``.
+
+    :ivar values: The validated (coerced) values, in input order. Members that
+      failed validation are :obj:`None <python:None>`.
+    :vartype values: :class:`list <python:list>`
+
+    :ivar errors: The exceptions raised for members that failed validation,
+      keyed by their index in the input.
+    :vartype errors: :class:`dict <python:dict>` of :class:`int <python:int>` to
+      :class:`Exception <python:Exception>`
+
+    """
+    __slots__ = ()
+
+    @property
+    def is_valid(self):
+        """``True`` if every member passed validation."""
+        return not self.errors
+
+
+_BATCH_DOCSTRING = """Validate every member of ``values`` using
+    :func:`{name}() <validator_collection.validators.{name}>`.
+
+    Keyword arguments are validated and normalized **once** and then applied to
+    every member, and each member is passed straight to the undecorated
+    validator. This makes validating large collections considerably cheaper
+    than calling :func:`{name}() <validator_collection.validators.{name}>` in a
+    loop.
+
+    :param values: The values to validate.
+    :type values: iterable
+
+    :param collect_errors: If ``False``, raises the first error encountered. If
+      ``True``, validates every member and returns a :class:`BatchResult` that
+      records each failure by index. Defaults to ``False``.
+    :type collect_errors: :class:`bool <python:bool>`
+
+    :param max_workers: The number of threads (or processes) to validate
+      ``values`` in. If :obj:`None <python:None>` and neither ``executor`` nor
+      ``processes`` is supplied, validates ``values`` in the calling thread.
+      Defaults to :obj:`None <python:None>`.
+    :type max_workers: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param executor: An existing
+      :class:`ThreadPoolExecutor <python:concurrent.futures.ThreadPoolExecutor>`
+      or
+      :class:`ProcessPoolExecutor <python:concurrent.futures.ProcessPoolExecutor>`
+      to validate ``values`` in. Defaults to :obj:`None <python:None>`.
+    :type executor: :class:`Executor <python:concurrent.futures.Executor>` /
+      :obj:`None <python:None>`
+
+    :param max_pending: The maximum number of chunks submitted to the pool whose
+      results have not yet been collected. See :meth:`CompiledValidator.many`.
+      Defaults to :obj:`None <python:None>`.
+    :type max_pending: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param processes: If ``True``, validates ``values`` in a pool of processes
+      rather than threads. Defaults to ``False``.
+    :type processes: :class:`bool <python:bool>`
+
+    :param chunk_size: The number of members validated by each task submitted to
+      the pool. See :meth:`CompiledValidator.many`. Defaults to
+      :obj:`None <python:None>`.
+    :type chunk_size: :class:`int <python:int>` / :obj:`None <python:None>`
+
+    :param kwargs: Keyword arguments accepted by
+      :func:`{name}() <validator_collection.validators.{name}>`.
+
+    :returns: The validated values, in input order / a :class:`BatchResult` if
+      ``collect_errors`` is ``True``
+    :rtype: :class:`list <python:list>` / :class:`BatchResult`
+
+    :raises NotAnIterableError: if ``values`` is not iterable
+    :raises ValueError: (or a sub-class) if ``collect_errors`` is ``False`` and a
+      member fails validation
+
+    """
+
+
+def _optional(validator, **options):
+    """Return a function that normalizes an option value with ``validator``,
+    allowing empty values."""
+    def resolve(value):
+        return validator(value, allow_empty = True, force_run = True, **options)    # pylint: disable=E1123
+
+    return resolve
+
+
+_VALIDATOR_NAMES = frozenset([
+    'uuid', 'string', 'iterable', 'none', 'not_empty', 'variable_name', 'dict',
+    'json', 'date', 'datetime', 'time', 'timezone', 'timedelta', 'numeric',
+    'integer', 'float', 'fraction', 'decimal', 'bytesIO', 'stringIO', 'path',
+    'path_exists', 'file_exists', 'directory_exists', 'readable', 'writeable',
+    'executable', 'email', 'url', 'domain', 'ip_address', 'ipv4', 'ipv6',
+    'mac_address', 'mimetype'
+])
+
+# Validators that accept a FormatMemo, and are compiled as ``adaptive`` when
+# validating a batch.
+_ADAPTIVE_VALIDATORS = frozenset(['date', 'datetime', 'time'])
+
+# Validators whose batches look paths up in directory listings (see
+# _list_path_modes()).
+_LISTED_PATH_VALIDATORS = frozenset(['path_exists',
+                                     'file_exists',
+                                     'directory_exists',
+                                     'readable',
+                                     'executable'])
+
+_NUMERIC_OPTION_RESOLVERS = {
+    'minimum': _optional(numeric),
+    'maximum': _optional(numeric),
+}
+
+_OPTION_RESOLVERS = {
+    'string': {
+        'minimum_length': _optional(integer),
+        'maximum_length': _optional(integer),
+    },
+    'iterable': {
+        'minimum_length': _optional(integer),
+        'maximum_length': _optional(integer),
+    },
+    'date': {
+        'minimum': _optional(date),
+        'maximum': _optional(date),
+    },
+    'datetime': {
+        'minimum': _optional(datetime),
+        'maximum': _optional(datetime),
+    },
+    'time': {
+        'minimum': _optional(time),
+        'maximum': _optional(time),
+    },
+    'ipv4': {
+        'output': _ipv4_output,
+    },
+    'numeric': _NUMERIC_OPTION_RESOLVERS,
+    'integer': _NUMERIC_OPTION_RESOLVERS,
+    'float': _NUMERIC_OPTION_RESOLVERS,
+    'fraction': _NUMERIC_OPTION_RESOLVERS,
+    'decimal': _NUMERIC_OPTION_RESOLVERS,
+}
+
+# The defaults that the checkers in ``checkers`` apply in place of the
+# validator's own, and that CompiledValidator.check() applies in the same way
+# (unless compiled with the option).
+_CHECK_DEFAULTS = {
+    'iterable': {'allow_empty': True},
+    'date': {'coerce_value': False},
+    'datetime': {'coerce_value': False},
+    'time': {'coerce_value': False},
+}
+
+
+def _dict_precheck(value, **kwargs):
+    """Accept any :class:`dict <python:dict>` (including an empty one), as
+    :func:`is_dict() <validator_collection.checkers.is_dict>` does."""
+    if isinstance(value, dict_):
+        return True
+
+    return None
+
+
+def _string_precheck(value,
+                     minimum_length = None,
+                     whitespace_padding = False,
+                     **kwargs):
+    """Reject :obj:`None <python:None>` and accept an empty string (unless it is
+    too short), as :func:`is_string() <validator_collection.checkers.is_string>`
+    does."""
+    if value is None:
+        return False
+
+    if isinstance(value, basestring) and not value:
+        return not (minimum_length and minimum_length > 0 and not whitespace_padding)
+
+    return None
+
+
+def _iterable_precheck(value, forbid_literals = (str, bytes), **kwargs):
+    """Reject :obj:`None <python:None>` and the types in ``forbid_literals``, as
+    :func:`is_iterable() <validator_collection.checkers.is_iterable>` does."""
+    if value is None or value in forbid_literals:
+        return False
+
+    return None
+
+
+# Functions that decide some values before the validator is applied, as the
+# corresponding checker does. Each returns True or False, or None if the
+# validator decides.
+_CHECK_PRECHECKS = {
+    'dict': _dict_precheck,
+    'string': _string_precheck,
+    'iterable': _iterable_precheck,
+}
+
+
+class CompiledValidator(object):
+    """A validator with its keyword arguments validated and bound in advance.
+
+    Instances are returned by :func:`compile`. Calling the instance validates
+    ``value`` exactly as the original validator would when called with the same
+    keyword arguments, but without re-validating those keyword arguments on
+    every call.
+
+    :ivar name: The name of the underlying validator.
+    :vartype name: :class:`str <python:str>`
+
+    :ivar options: The normalized keyword arguments bound to the validator.
+    :vartype options: :class:`dict <python:dict>`
+
+    """
+    __slots__ = ('name', 'options', '_validate', '_core', '_check', '_precheck')
+
+    def __init__(self, validator, options):
+        self.name = validator.__name__
+        self.options = options
+        self._validate = getattr(validator, '__wrapped__', validator)
+        self._core = globals()['_%s_core' % self.name]
+
+        check_options = _CHECK_DEFAULTS.get(self.name, {}).copy()
+        check_options.update(options)
+        self._check = self._core
+        if check_options:
+            self._check = partial(self._check, **check_options)
+        self._precheck = _CHECK_PRECHECKS.get(self.name, None)
+        if self._precheck is not None and options:
+            self._precheck = partial(self._precheck, **options)
+
+        if options:
+            self._validate = partial(self._validate, **options)
+            self._core = partial(self._core, **options)
+
+    def __call__(self, value, force_run = False):
+        """Validate ``value``.
+
+        :param value: The value to validate.
+
+        :param force_run: If ``True``, runs the validator even if it has been
+          disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+        :type force_run: :class:`bool <python:bool>`
+
+        :returns: The validated (and possibly coerced) ``value``.
+
+        :raises ValueError: (or a sub-class) if ``value`` is invalid
+        """
+        if not force_run and validator_is_disabled(self.name):
+            return value
+
+        return self._validate(value)
+
+    def check(self, value, force_run = False):
+        """Indicate whether ``value`` is valid. This is the compiled equivalent of
+        the corresponding checker (e.g.
+        :func:`is_string() <validator_collection.checkers.is_string>` for a
+        compiled :func:`string`), and applies its defaults and its handling of
+        empty values: for example, ``compile('iterable').check([])`` returns
+        ``True``, as :func:`is_iterable() <validator_collection.checkers.is_iterable>`
+        does, even though ``compile('iterable')([])`` raises
+        :class:`EmptyValueError <validator_collection.errors.EmptyValueError>`.
+
+        :param value: The value to check.
+
+        :param force_run: If ``True``, checks ``value`` even if the validator has
+          been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+        :type force_run: :class:`bool <python:bool>`
+
+        :returns: ``True`` if ``value`` is valid (or the validator is disabled),
+          ``False`` if it is not.
+        :rtype: :class:`bool <python:bool>`
+
+        :raises SyntaxError: if the underlying validator raises a
+          :class:`SyntaxError <python:SyntaxError>`
+        """
+        if not force_run and validator_is_disabled(self.name):
+            return True
+
+        try:
+            if self._precheck is not None:
+                result = self._precheck(value)
+                if result is not None:
+                    return result
+
+            return not isinstance(self._check(value), _Invalid)
+        except SyntaxError as error:
+            raise error
+        except Exception:
+            return False
+
+    def many(self,
+             values,
+             collect_errors = False,
+             force_run = False,
+             max_workers = None,
+             executor = None,
+             max_pending = None,
+             processes = False,
+             chunk_size = None):
+        """Validate every member of ``values``.
+
+        If ``max_workers`` or ``executor`` is supplied, the members are validated
+        concurrently in a pool of threads. This pays off for validators that wait
+        on the operating system (e.g. :func:`path_exists` or :func:`readable` on
+        a network file system); for validators that only compute, it is slower
+        than validating in the calling thread.
+
+        If ``processes`` is ``True`` (or ``executor`` is a
+        :class:`ProcessPoolExecutor <python:concurrent.futures.ProcessPoolExecutor>`),
+        the members are instead split into chunks of ``chunk_size`` members,
+        which are validated in a pool of processes. This lets validators that
+        only compute (e.g. :func:`email`, :func:`url` or :func:`domain`) use
+        more than one processor core, at the cost of copying each chunk and its
+        results between processes.
+
+        Either way, the results (and the error raised if ``collect_errors`` is
+        ``False``) are the same as validating in the calling thread, and so is
+        :attr:`detected_format` afterwards: each process reports the format it
+        detected in its chunk back to the calling process. At most
+        ``max_pending`` chunks are read from ``values`` ahead of the last result
+        collected, so ``values`` may be a (lazy) iterable of any length.
+
+        When compiled from :func:`path_exists`, :func:`file_exists`,
+        :func:`directory_exists`, :func:`readable` or :func:`executable`, each
+        directory that contains several of the paths in ``values`` is listed
+        once with :func:`os.scandir() <python:os.scandir>` and the paths in it
+        are looked up in the listing, rather than with one
+        :func:`os.stat() <python:os.stat>` call each. The results are the same.
+
+        :param values: The values to validate.
+        :type values: iterable
+
+        :param collect_errors: If ``False``, raises the first error encountered.
+          If ``True``, validates every member and returns a :class:`BatchResult`
+          that records each failure by index. Defaults to ``False``.
+        :type collect_errors: :class:`bool <python:bool>`
+
+        :param force_run: If ``True``, validates ``values`` even if the validator
+          has been disabled via ``VALIDATORS_DISABLED``. Defaults to ``False``.
+        :type force_run: :class:`bool <python:bool>`
+
+        :param max_workers: The number of threads (or processes) to validate
+          ``values`` in. If :obj:`None <python:None>` and neither ``executor``
+          nor ``processes`` is supplied, validates ``values`` in the calling
+          thread. If :obj:`None <python:None>` and ``processes`` is ``True``,
+          uses one process per processor core. Defaults to
+          :obj:`None <python:None>`.
+        :type max_workers: :class:`int <python:int>` / :obj:`None <python:None>`
+
+        :param executor: An existing
+          :class:`ThreadPoolExecutor <python:concurrent.futures.ThreadPoolExecutor>`
+          or
+          :class:`ProcessPoolExecutor <python:concurrent.futures.ProcessPoolExecutor>`
+          to validate ``values`` in, which is left running afterwards. If
+          :obj:`None <python:None>`, a pool of ``max_workers`` threads (or
+          processes) is created for the batch and shut down when it is done.
+          Defaults to :obj:`None <python:None>`.
+        :type executor: :class:`Executor <python:concurrent.futures.Executor>` /
+          :obj:`None <python:None>`
+
+        :param max_pending: The maximum number of chunks submitted to the pool
+          whose results have not yet been collected. If
+          :obj:`None <python:None>`, four times ``max_workers`` (or ``64`` if
+          ``max_workers`` is not supplied). Defaults to
+          :obj:`None <python:None>`.
+        :type max_pending: :class:`int <python:int>` / :obj:`None <python:None>`
+
+        :param processes: If ``True``, validates ``values`` in a pool of
+          processes rather than threads. Defaults to ``False``.
+        :type processes: :class:`bool <python:bool>`
+
+        :param chunk_size: The number of members validated by each task submitted
+          to the pool. If :obj:`None <python:None>`, ``1000`` when validating in
+          processes and ``1`` when validating in threads. Defaults to
+          :obj:`None <python:None>`.
+        :type chunk_size: :class:`int <python:int>` / :obj:`None <python:None>`
+
+        :returns: The validated values, in input order / a :class:`BatchResult`
+          if ``collect_errors`` is ``True``
+        :rtype: :class:`list <python:list>` / :class:`BatchResult`
+
+        :raises ValueError: (or a sub-class) if ``collect_errors`` is ``False``
+          and a member fails validation
+        """
+        if not force_run and validator_is_disabled(self.name):
+            if collect_errors:
+                return BatchResult(list(values), {})
+            return list(values)
+
+        if max_workers is not None or executor is not None or processes:
+            return self._many_in_pool(values,
+                                      collect_errors,
+                                      max_workers,
+                                      executor,
+                                      max_pending,
+                                      processes,
+                                      chunk_size)
+
+        validate = self._validate
+        if self.name in _LISTED_PATH_VALIDATORS:
+            values = list(values)
+            validate = self._with_path_modes(_list_path_modes(values))
+
+        results = []
+        append = results.append
+
+        if not collect_errors:
+            for value in values:
+                append(validate(value))
+
+            return results
+
+        failures = {}
+        for index, value in enumerate(values):
+            try:
+                append(validate(value))
+            except (ValueError, TypeError, IOError) as error:
+                append(None)
+                failures[index] = error
+
+        return BatchResult(results, failures)
+
+    def _many_in_pool(self,
+                      values,
+                      collect_errors,
+                      max_workers,
+                      executor,
+                      max_pending,
+                      processes,
+                      chunk_size):
+        """Validate every member of ``values`` in a pool of threads or processes,
+        as :meth:`many` does when ``max_workers``, ``executor`` or ``processes``
+        is supplied.
+
+        ``values`` is split into chunks, each of which is validated as a batch of
+        its own by :func:`_validate_chunk`. Results are collected in input order
+        from a queue of at most ``max_pending`` submitted chunks, so that a slow
+        chunk holds back reading ``values`` rather than letting the queue grow
+        without bound.
+        """
+        # Imported here rather than at the top of the module, as importing
+        # concurrent.futures also imports logging.
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        max_workers = integer(max_workers,
+                              allow_empty = True,
+                              minimum = 1,
+                              force_run = True)                                 # pylint: disable=E1123
+        max_pending = integer(max_pending,
+                              allow_empty = True,
+                              minimum = 1,
+                              force_run = True)                                 # pylint: disable=E1123
+        chunk_size = integer(chunk_size,
+                             allow_empty = True,
+                             minimum = 1,
+                             force_run = True)                                  # pylint: disable=E1123
+        if max_pending is None:
+            max_pending = 4 * max_workers if max_workers else 64
+
+        owns_executor = executor is None
+        if owns_executor:
+            if processes:
+                executor = ProcessPoolExecutor(max_workers = max_workers)
+            else:
+                executor = ThreadPoolExecutor(max_workers = max_workers)
+        else:
+            processes = isinstance(executor, ProcessPoolExecutor)
+
+        if chunk_size is None:
+            chunk_size = 1000 if processes else 1
+
+        # Threads share the format memo of an adaptive validator, but each
+        # process updates its own copy, so the format detected in each chunk
+        # is passed back and applied in input order.
+        format_memo = self.options.get('format_memo', None) if processes else None
+        report_format = format_memo is not None
+
+        results = []
+        failures = {}
+
+        def collect(future):
+            result = future.result()
+            if report_format:
+                result, detected_format = result
+                if detected_format is not None:
+                    format_memo.format = detected_format
+
+            if collect_errors:
+                for index, error in result.errors.items():
+                    failures[len(results) + index] = error
+                result = result.values
+
+            results.extend(result)
+
+        values = iter(values)
+        pending = deque()
+        try:
+            chunk = list(islice(values, chunk_size))
+            while chunk:
+                pending.append(executor.submit(_validate_chunk,
+                                               self,
+                                               chunk,
+                                               collect_errors,
+                                               report_format))
+                if len(pending) >= max_pending:
+                    collect(pending.popleft())
+
+                chunk = list(islice(values, chunk_size))
+
+            while pending:
+                collect(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+            if owns_executor:
+                executor.shutdown()
+
+        if collect_errors:
+            return BatchResult(results, failures)
+
+        return results
+
+    def _with_path_modes(self, path_modes):
+        """Return a function that validates a path as the compiled validator
+        does, taking its file mode from ``path_modes`` where it is known."""
+        core = partial(self._core, path_modes = path_modes)
+
+        def validate(value):
+            result = core(value)
+            if isinstance(result, _Invalid):
+                raise result.error()
+
+            return result
+
+        return validate
+
+    @property
+    def detected_format(self):
+        """The string format most recently detected by an ``adaptive`` compiled
+        :func:`date`, :func:`datetime` or :func:`time` validator, or
+        :obj:`None <python:None>`.
+
+        :rtype: :class:`str <python:str>` / :obj:`None <python:None>`
+        """
+        format_memo = self.options.get('format_memo', None)
+        if format_memo is None:
+            return None
+
+        return format_memo.format
+
+    def __reduce__(self):
+        # The undecorated validator cannot be pickled by reference, so a
+        # compiled validator is pickled as the (decorated) validator and its
+        # options. This lets it be sent to worker processes.
+        return (CompiledValidator, (globals()[self.name], self.options))
+
+    def __repr__(self):
+        return 'CompiledValidator(%s, %r)' % (self.name, self.options)
+
+
+def _validate_chunk(validator, values, collect_errors, report_format = False):
+    """Validate one chunk of a batch submitted to a pool of threads or processes
+    by :meth:`CompiledValidator.many`.
+
+    :param validator: The compiled validator to apply.
+    :type validator: :class:`CompiledValidator`
+
+    :param values: The members of the chunk.
+    :type values: :class:`list <python:list>`
+
+    :param report_format: If ``True``, ``validator`` is an adaptive copy sent to
+      a worker process. Its format memo is cleared before the chunk is validated,
+      and the format detected in the chunk (or :obj:`None <python:None>` if no
+      string was parsed) is returned with the results.
+    :type report_format: :class:`bool <python:bool>`
+
+    :rtype: :class:`list <python:list>` / :class:`BatchResult` /
+      :class:`tuple <python:tuple>` of those and the detected format
+    """
+    if not report_format:
+        return validator.many(values, collect_errors = collect_errors, force_run = True)
+
+    format_memo = validator.options['format_memo']
+    format_memo.format = None
+    result = validator.many(values, collect_errors = collect_errors, force_run = True)
+
+    return result, format_memo.format
+
+
+def _option_names(validator):
+    """Return the names of the keyword arguments accepted by ``validator``.
+
+    :param validator: The (decorated) validator.
+    :type validator: callable
+
+    :rtype: :class:`frozenset <python:frozenset>`
+    """
+    code = getattr(validator, '__wrapped__', validator).__code__
+
+    return frozenset(code.co_varnames[1:code.co_argcount])
+
+
+def compile(validator, **kwargs):                                               # pylint: disable=W0622
+    """Return a reusable version of ``validator`` with the keyword arguments in
+    ``kwargs`` validated and bound in advance.
+
+    Validators like :func:`string` or :func:`numeric` validate their own keyword
+    arguments (e.g. ``minimum_length`` or ``maximum``) on every call. When the
+    same configuration is applied to many values, compiling it first does that
+    work once:
+
+    .. code-block:: python
+
+      from validator_collection import validators
+
+      username = validators.compile('string', minimum_length = 3, maximum_length = 64)
+
+      username('jdoe')              # returns 'jdoe'
+      username.check('jd')          # returns False
+      username.many(['jdoe', 'jsmith'])
+
+    When compiling :func:`date`, :func:`datetime` or :func:`time`, pass
+    ``adaptive = True`` to have the compiled validator remember the string format
+    of the last value it parsed and try it first for the next one (see
+    :class:`FormatMemo`). The detected format is available as
+    :attr:`CompiledValidator.detected_format`.
+
+    :param validator: The validator to compile, or its name.
+    :type validator: callable / :class:`str <python:str>`
+
+    :param kwargs: Keyword arguments accepted by ``validator``.
+
+    :rtype: :class:`CompiledValidator`
+
+    :raises ValidatorUsageError: if ``validator`` is not a known validator, or
+      does not accept one of the keyword arguments in ``kwargs``
+    :raises ValueError: (or a sub-class) if a keyword argument is invalid
+    """
+    if isinstance(validator, basestring):
+        name = validator
+        validator = globals().get(name, None)
+    else:
+        name = getattr(validator, '__name__', None)
+
+    if name not in _VALIDATOR_NAMES or globals().get(name) is not validator:
+        raise errors.ValidatorUsageError(
+            'validator (%s) is not a known validator' % name
+        )
+
+    kwargs.pop('force_run', None)
+    accepted = _option_names(validator)
+    for option in sorted(kwargs):
+        if option not in accepted and (option != 'adaptive' or
+                                       name not in _ADAPTIVE_VALIDATORS):
+            raise errors.ValidatorUsageError(
+                'validator (%s) does not accept the keyword argument %s' % (name, option)
+            )
+
+    if kwargs.pop('adaptive', False) and name in _ADAPTIVE_VALIDATORS:
+        kwargs.setdefault('format_memo', FormatMemo())
+
+    _resolve_options(name, kwargs)
+
+    return CompiledValidator(validator, kwargs)
+
+
+def _resolve_options(name, options):
+    """Normalize, in place, the values in ``options`` that the validator
+    ``name`` would otherwise normalize on every call (see
+    :data:`_OPTION_RESOLVERS`).
+
+    :param name: The name of the validator.
+    :type name: :class:`str <python:str>`
+
+    :param options: The keyword arguments for the validator.
+    :type options: :class:`dict <python:dict>`
+
+    :raises ValueError: (or a sub-class) if an option value is invalid
+    """
+    resolvers = _OPTION_RESOLVERS.get(name, {})
+    for option in resolvers:
+        if option in options:
+            options[option] = resolvers[option](options[option])
+
+
+def _many(validator):
+    """Build the batch version of ``validator``.
+
+    :param validator: The (decorated) validator to apply to each value.
+    :type validator: callable
+
+    :rtype: callable
+    """
+    function_name = validator.__name__
+
+    def validate_many(values,
+                      collect_errors = False,
+                      max_workers = None,
+                      executor = None,
+                      max_pending = None,
+                      processes = False,
+                      chunk_size = None,
+                      **kwargs):
+        # pylint: disable=C0111
+        force_run = kwargs.pop('force_run', False)
+
+        values = iterable(values, allow_empty = True, force_run = True)         # pylint: disable=E1123
+        if values is None:
+            values = []
+
+        if not force_run and validator_is_disabled(function_name):
+            if collect_errors:
+                return BatchResult(list(values), {})
+            return list(values)
+
+        if function_name in _ADAPTIVE_VALIDATORS:
+            kwargs.setdefault('adaptive', True)
+
+        return compile(validator, **kwargs).many(values,
+                                                 collect_errors = collect_errors,
+                                                 force_run = True,
+                                                 max_workers = max_workers,
+                                                 executor = executor,
+                                                 max_pending = max_pending,
+                                                 processes = processes,
+                                                 chunk_size = chunk_size)
+
+    validate_many.__name__ = '%s_many' % function_name
+    validate_many.__doc__ = _BATCH_DOCSTRING.format(name = function_name)
+
+    return validate_many
+
+
+uuid_many = _many(uuid)
+string_many = _many(string)
+iterable_many = _many(iterable)
+none_many = _many(none)
+not_empty_many = _many(not_empty)
+variable_name_many = _many(variable_name)
+dict_many = _many(dict)
+json_many = _many(json)
+
+date_many = _many(date)
+datetime_many = _many(datetime)
+time_many = _many(time)
+timezone_many = _many(timezone)
+timedelta_many = _many(timedelta)
+
+numeric_many = _many(numeric)
+integer_many = _many(integer)
+float_many = _many(float)
+fraction_many = _many(fraction)
+decimal_many = _many(decimal)
+
+bytesIO_many = _many(bytesIO)
+stringIO_many = _many(stringIO)
+path_many = _many(path)
+path_exists_many = _many(path_exists)
+file_exists_many = _many(file_exists)
+directory_exists_many = _many(directory_exists)
+readable_many = _many(readable)
+writeable_many = _many(writeable)
+executable_many = _many(executable)
+
+email_many = _many(email)
+url_many = _many(url)
+domain_many = _many(domain)
+ip_address_many = _many(ip_address)
+ipv4_many = _many(ipv4)
+ipv6_many = _many(ipv6)
+mac_address_many = _many(mac_address)
+mimetype_many = _many(mimetype)